@@ -52,8 +52,22 @@ def cli():
     help="Base output directory (contains plugin_paths config)",
 )
 @click.option("--verbose", is_flag=True, help="Enable verbose output")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Worker processes for per-message generation (0 = one per CPU)",
+)
 def generate(
-    method: str, messages: str, config: str, plugin_paths: str, output_base: str, verbose: bool
+    method: str,
+    messages: str,
+    config: str,
+    plugin_paths: str,
+    output_base: str,
+    verbose: bool,
+    jobs: int,
 ):
     """
     Generate protocol code from message definitions.
@@ -97,6 +111,7 @@ def generate(
                 plugin_paths_path=plugin_paths_path,
                 output_base=output_base_path,
                 verbose=verbose,
+                jobs=jobs or None,
             )
         elif method.lower() == "binary":
             from protocol_codegen.generators.orchestrators.binary.generator import (
@@ -109,6 +124,7 @@ def generate(
                 plugin_paths_path=plugin_paths_path,
                 output_base=output_base_path,
                 verbose=verbose,
+                jobs=jobs or None,
             )
         else:
             click.echo(f"❌ Method '{method}' not yet implemented", err=True)
@@ -15,6 +15,7 @@ Single Responsibility: Represent a single field with its name, type, and structu
 
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -95,6 +96,8 @@ class FieldBase(ABC):
 
     Defines the common interface that all fields must implement.
     Not a dataclass itself to avoid field ordering conflicts in subclasses.
+    Subclasses intern their name in __post_init__: names are hashed and
+    spliced into generated code many times per run.
     """
 
     name: str
@@ -157,6 +160,7 @@ class PrimitiveField(FieldBase):
 
     def __post_init__(self) -> None:
         """Validate primitive field"""
+        self.name = sys.intern(self.name)
         if self.array is not None and self.array <= 0:
             raise ValueError(f"Array size must be positive, got {self.array}")
         if self.dynamic and self.array is None:
@@ -218,6 +222,7 @@ class CompositeField(FieldBase):
         """Validate composite field and convert to list if needed"""
         # Convert to list for internal storage
         object.__setattr__(self, "fields", list(self.fields))
+        object.__setattr__(self, "name", sys.intern(self.name))
 
         if not self.fields:
             raise ValueError(f"CompositeField '{self.name}' must have at least one field")
@@ -301,6 +306,7 @@ class EnumField(FieldBase):
 
     def __post_init__(self) -> None:
         """Validate enum field."""
+        self.name = sys.intern(self.name)
         if self.array is not None and self.array <= 0:
             raise ValueError(f"Array size must be positive, got {self.array}")
 
@@ -42,22 +42,30 @@ def write_if_changed(path: Path, content: str, encoding: str = "utf-8") -> bool:
         ...     print("File unchanged, skipped")
     """
     # Normalize line endings to LF for cross-platform consistency
-    content = content.replace("\r\n", "\n").replace("\r", "\n")
-
-    # Check if file exists and has same content
-    if path.exists():
-        try:
-            existing_content = path.read_text(encoding=encoding)
-            if existing_content == content:
-                return False  # Content unchanged, skip write
-        except (OSError, UnicodeDecodeError):
-            pass  # If we can't read, just write
-
-    # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write with explicit LF line endings
-    path.write_bytes(content.encode(encoding))
+    # (generators emit LF already, so skip the copies in the common case)
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    data = content.encode(encoding)
+
+    # Compare raw bytes against the existing file (no exists() probe, no decode)
+    try:
+        existing = path.read_bytes()
+    except OSError:
+        pass  # Missing or unreadable, just write
+    else:
+        if existing == data:
+            return False  # Content unchanged, skip write
+        # A CRLF checkout (e.g. git autocrlf) of the same text is unchanged too
+        if b"\r" in existing and existing.replace(b"\r\n", b"\n").replace(b"\r", b"\n") == data:
+            return False
+
+    # Write with explicit LF line endings, in one call; the parent directory
+    # is only created when missing, not probed before every write
+    try:
+        path.write_bytes(data)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
     return True
 
 
@@ -16,15 +16,17 @@ Reusability: Used across all plugins, not specific to any one.
 
 from __future__ import annotations
 
-from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from .enums import Direction, Intent
+from .field import CompositeField, EnumField, PrimitiveField
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
 
+    from .enum_def import EnumDef
     from .field import FieldBase
 
 
@@ -85,6 +87,52 @@ class Message:
         name_str = self.name or "UNNAMED"
         return f"Message({name_str}, {len(self.fields)} fields)"
 
+    @cached_property
+    def pascal_name(self) -> str:
+        """PascalCase message name (TRANSPORT_PLAY -> TransportPlay).
+
+        Computed once on first access: generators only run after auto-discovery
+        has injected the name, which does not change afterwards.
+        """
+        from protocol_codegen.generators.core.naming import to_pascal_case
+
+        return to_pascal_case(self.name)
+
+    @cached_property
+    def has_string_field(self) -> bool:
+        """True if any field, nested composites included, is a string.
+
+        Computed once: every backend (C++/Java, Binary/SysEx) asks for it,
+        and field trees do not change after loading.
+        """
+        stack = list(self.fields)
+        while stack:
+            field = stack.pop()
+            if isinstance(field, PrimitiveField):
+                if field.type_name.value == "string":
+                    return True
+            elif isinstance(field, CompositeField):
+                stack.extend(field.fields)
+        return False
+
+    @cached_property
+    def enum_defs(self) -> tuple[EnumDef, ...]:
+        """Unique EnumDefs used by the fields (nested composites included).
+
+        In first-seen order, deduplicated by name, computed once.
+        """
+        seen: dict[str, EnumDef] = {}
+
+        def visit(fields: Sequence[FieldBase]) -> None:
+            for field in fields:
+                if isinstance(field, EnumField):
+                    seen.setdefault(field.enum_def.name, field.enum_def)
+                elif isinstance(field, CompositeField):
+                    visit(field.fields)
+
+        visit(self.fields)
+        return tuple(seen.values())
+
     def is_legacy(self) -> bool:
         """Check if message uses old format (no direction)."""
         return self.direction is None
@@ -21,30 +21,8 @@ if TYPE_CHECKING:
     from protocol_codegen.core.message import Message
 
 
-def generate_protocol_template_hpp(messages: list[Message], output_path: Path) -> str:
-    """
-    Generate Protocol.hpp.template for Binary transport.
-
-    Args:
-        messages: List of message definitions
-        output_path: Where to write Protocol.hpp.template
-
-    Returns:
-        Generated C++ template code with TODO comments
-    """
-    # Generate example callback assignments
-    callback_examples: list[str] = []
-    for message in messages[:3]:  # Show first 3 as examples
-        pascal_name = "".join(word.capitalize() for word in message.name.split("_"))
-        callback_name = f"on{pascal_name}"
-        class_name = f"{pascal_name}Message"
-        callback_examples.append(
-            f"    // protocol.{callback_name} = [](const {class_name}& msg) {{ }};"
-        )
-
-    callback_examples_str = "\n".join(callback_examples)
-
-    code = f"""/**
+# Static template text around the callback examples, built once at import
+_TEMPLATE_HEAD = """/**
  * Protocol.hpp.template - Binary Protocol Handler Template
  *
  * ============================================================================
@@ -104,7 +82,7 @@ def generate_protocol_template_hpp(messages: list[Message], output_path: Path) -
 //   #include <oc/api/MidiAPI.hpp>           // For SysEx over MIDI
 //   #include "TcpSocket.hpp"                // For TCP socket
 
-namespace Protocol {{
+namespace Protocol {
 
 /**
  * Binary Protocol Handler
@@ -114,7 +92,7 @@ namespace Protocol {{
  * Inherits from ProtocolCallbacks which provides typed callback members
  * for each message type (e.g., onSensorReading, onLog, etc.)
  */
-class Protocol : public ProtocolCallbacks {{
+class Protocol : public ProtocolCallbacks {
 public:
     // ========================================================================
     // TODO: Constructor - adapt to your transport
@@ -125,23 +103,23 @@ public:
      *
      *   explicit Protocol(oc::interface::ITransport& transport)
      *       : transport_(transport)
-     *   {{
-     *       transport_.setOnReceive([this](const uint8_t* data, size_t len) {{
+     *   {
+     *       transport_.setOnReceive([this](const uint8_t* data, size_t len) {
      *           dispatch(data, len);
-     *       }});
-     *   }}
+     *       });
+     *   }
      *
      * Example for MidiAPI + EventBus:
      *
      *   Protocol(oc::api::MidiAPI& midi, oc::core::event::IEventBus& events)
      *       : midi_(midi), events_(events)
-     *   {{
+     *   {
      *       subscriptionId_ = events_.on(EventCategory::MIDI, MidiEvent::SYSEX,
-     *           [this](const Event& evt) {{
+     *           [this](const Event& evt) {
      *               const auto& sysex = static_cast<const SysExEvent&>(evt);
      *               dispatch(sysex.data, sysex.length);
-     *           }});
-     *   }}
+     *           });
+     *   }
      */
 
     // Non-copyable
@@ -161,7 +139,7 @@ public:
      * @param message Message to send
      */
     template<typename T>
-    void send(const T& message) {{
+    void send(const T& message) {
         // Build frame: [MessageID][fromHost][payload...]
         uint8_t frame[ProtocolConstants::MAX_MESSAGE_SIZE];
         size_t offset = 0;
@@ -181,7 +159,7 @@ public:
         //   transport_.send(frame, offset);           // IFrameTransport
         //   midi_.sendSysEx(buildSysEx(frame, offset)); // MidiAPI
         //   socket_.write(frame, offset);             // TCP
-    }}
+    }
 
     // ========================================================================
     // Receive / Dispatch
@@ -195,10 +173,10 @@ public:
      * @param data Frame data (after transport-specific decoding)
      * @param len Frame length
      */
-    void dispatch(const uint8_t* data, size_t len) {{
-        if (len < ProtocolConstants::MIN_MESSAGE_LENGTH) {{
+    void dispatch(const uint8_t* data, size_t len) {
+        if (len < ProtocolConstants::MIN_MESSAGE_LENGTH) {
             return;  // Frame too short
-        }}
+        }
 
         // Parse header
         auto messageId = static_cast<MessageID>(data[ProtocolConstants::MESSAGE_TYPE_OFFSET]);
@@ -210,7 +188,7 @@ public:
 
         // Dispatch to typed callback (inherited from ProtocolCallbacks)
         DecoderRegistry::dispatch(*this, messageId, payload, payloadLen, fromHost);
-    }}
+    }
 
     // ========================================================================
     // TODO: Add project-specific helper methods here
@@ -228,10 +206,10 @@ private:
     //   oc::interface::ITransport& transport_;
     //   oc::api::MidiAPI& midi_;
     //   oc::core::event::IEventBus& events_;
-    //   oc::core::event::SubscriptionID subscriptionId_{{0}};
-}};
+    //   oc::core::event::SubscriptionID subscriptionId_{0};
+};
 
-}}  // namespace Protocol
+}  // namespace Protocol
 
 // ============================================================================
 // USAGE EXAMPLE
@@ -243,19 +221,38 @@ private:
 // oc::teensy::UsbSerial serial;
 // Protocol::Protocol protocol(serial);
 //
-// void setup() {{
+// void setup() {
 //     serial.init();
 //
 //     // Register callbacks
-{callback_examples_str}
-// }}
+"""
+
+_TEMPLATE_TAIL = """// }
 //
-// void loop() {{
+// void loop() {
 //     serial.update();  // Polls and dispatches incoming messages
 //
 //     // Send messages
-//     // protocol.send(SensorReadingMessage{{...}});
-// }}
+//     // protocol.send(SensorReadingMessage{...});
+// }
 """
 
-    return code
+
+def generate_protocol_template_hpp(messages: list[Message], output_path: Path) -> str:
+    """
+    Generate Protocol.hpp.template for Binary transport.
+
+    Args:
+        messages: List of message definitions
+        output_path: Where to write Protocol.hpp.template
+
+    Returns:
+        Generated C++ template code with TODO comments
+    """
+    # Example callback assignments for the first 3 messages
+    callback_examples_str = "\n".join(
+        f"    // protocol.on{message.pascal_name} = [](const {message.pascal_name}Message& msg) {{ }};"
+        for message in messages[:3]
+    )
+
+    return f"{_TEMPLATE_HEAD}{callback_examples_str}\n{_TEMPLATE_TAIL}"
@@ -20,14 +20,15 @@ Generated Output:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any
 
 # Import field classes for runtime isinstance checks
 from protocol_codegen.core.field import CompositeField, FieldBase, PrimitiveField
 from protocol_codegen.generators.binary.cpp.logger_generator import generate_log_method
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
     from pathlib import Path
 
     from protocol_codegen.core.loader import TypeRegistry
@@ -98,9 +99,10 @@ def _analyze_includes_needed(
     needs_string = False
     needs_vector = False
 
-    def check_field(field: FieldBase) -> None:
-        nonlocal needs_array, needs_string, needs_vector
-
+    # Explicit stack instead of a recursive closure over nonlocal flags
+    stack = list(fields)
+    while stack:
+        field = stack.pop()
         if field.is_primitive():
             assert isinstance(field, PrimitiveField)
             # Check for string type
@@ -117,12 +119,8 @@ def _analyze_includes_needed(
             assert isinstance(field, CompositeField)
             if field.array:
                 needs_array = True
-            # Recursively check nested fields
-            for nested in field.fields:
-                check_field(nested)
-
-    for field in fields:
-        check_field(field)
+            # Nested fields are checked in later iterations
+            stack.extend(field.fields)
 
     return needs_array, needs_string, needs_vector
 
@@ -193,6 +191,7 @@ def _generate_struct_definition(
     # Add static MESSAGE_NAME constant (for logging/debugging)
     lines.append("    // Message name for logging (encoded in payload)")
     lines.append(f'    static constexpr const char* MESSAGE_NAME = "{pascal_name}";')
+    lines.append(f"    static constexpr uint8_t MESSAGE_NAME_LEN = {len(pascal_name)};")
     lines.append("")
 
     # Add fields FIRST (use new helper that handles both primitive and composite)
@@ -252,10 +251,9 @@ def _generate_encode_function(
             "        uint8_t* ptr = buffer;",
             "",
             "        // Encode message name (length-prefixed string for bridge logging)",
-            "        encodeUint8(ptr, static_cast<uint8_t>(strlen(MESSAGE_NAME)));",
-            "        for (size_t i = 0; i < strlen(MESSAGE_NAME); ++i) {",
-            "            *ptr++ = static_cast<uint8_t>(MESSAGE_NAME[i]);",
-            "        }",
+            "        encodeUint8(ptr, MESSAGE_NAME_LEN);",
+            "        std::memcpy(ptr, MESSAGE_NAME, MESSAGE_NAME_LEN);",
+            "        ptr += MESSAGE_NAME_LEN;",
             "",
             "        return ptr - buffer;",
             "    }",
@@ -278,10 +276,9 @@ def _generate_encode_function(
         "        uint8_t* ptr = buffer;",
         "",
         "        // Encode message name (length-prefixed string for bridge logging)",
-        "        encodeUint8(ptr, static_cast<uint8_t>(strlen(MESSAGE_NAME)));",
-        "        for (size_t i = 0; i < strlen(MESSAGE_NAME); ++i) {",
-        "            *ptr++ = static_cast<uint8_t>(MESSAGE_NAME[i]);",
-        "        }",
+        "        encodeUint8(ptr, MESSAGE_NAME_LEN);",
+        "        std::memcpy(ptr, MESSAGE_NAME, MESSAGE_NAME_LEN);",
+        "        ptr += MESSAGE_NAME_LEN;",
         "",
     ])
 
@@ -473,13 +470,10 @@ def _generate_decode_function(
                 # std::array type (fixed size, but we fill based on count)
                 cpp_type = _get_cpp_type_for_field(field, type_registry)
                 lines.append(f"        {cpp_type} {var_name};")
-                # Use PascalCase struct name for item type (BUG FIX #4)
-                item_struct_name = _field_to_pascal_case(field.name)
                 lines.append(
                     f"        for (uint8_t i = 0; i < count_{field.name} && i < {field.array}; ++i) {{"
                 )
-                lines.append(f"            {item_struct_name} item;")
-                # Decode each field of the struct
+                # Decode each field of the struct straight into its array slot
                 for nested_field in field.fields:
                     if nested_field.is_primitive():
                         assert isinstance(nested_field, PrimitiveField)
@@ -510,7 +504,7 @@ def _generate_decode_function(
                                 )
                                 lines.append(f"                {decoder_call}")
                                 lines.append(
-                                    f"                item.{nested_field.name}.push_back(temp_{nested_field.name});"
+                                    f"                {var_name}[i].{nested_field.name}.push_back(temp_{nested_field.name});"
                                 )
                                 lines.append("            }")
                             else:
@@ -518,7 +512,7 @@ def _generate_decode_function(
                                 lines.append(
                                     f"            for (uint8_t j = 0; j < count_{nested_field.name} && j < {nested_field.array}; ++j) {{"
                                 )
-                                direct_target = f"item.{nested_field.name}[j]"
+                                direct_target = f"{var_name}[i].{nested_field.name}[j]"
                                 decoder_call = _get_decoder_call(
                                     f"item_{nested_field.name}_j",
                                     nested_field.type_name.value,
@@ -529,8 +523,8 @@ def _generate_decode_function(
                                 lines.append("            }")
                         else:
                             # Nested scalar primitive
-                            # OPTION B: Write directly to item struct member
-                            direct_target = f"item.{nested_field.name}"
+                            # OPTION B: Write directly to the array element member
+                            direct_target = f"{var_name}[i].{nested_field.name}"
                             decoder_call = _get_decoder_call(
                                 f"item_{nested_field.name}",  # Unused when direct_target set
                                 nested_field.type_name.value,
@@ -538,14 +532,11 @@ def _generate_decode_function(
                                 direct_target=direct_target,
                             )
                             lines.append(f"            {decoder_call}")
-                lines.append(
-                    f"            {var_name}[i] = item;"
-                )  # Use array index instead of push_back
                 lines.append("        }")
             else:
                 # Single composite struct (not array)
                 # BUG FIX #2: Use capitalized struct type name instead of field name
-                struct_type = field.name[0].upper() + field.name[1:]  # camelCase → PascalCase
+                struct_type = _field_to_pascal_case(field.name)
                 lines.append(f"        {struct_type} {var_name};")
                 for nested_field in field.fields:
                     if nested_field.is_primitive():
@@ -562,17 +553,7 @@ def _generate_decode_function(
             field_vars.append(var_name)
 
     # Construct and return struct
-    # Primitives use output parameters (no dereference needed)
-    # Composites return optional (need dereference)
-    field_values: list[str] = []
-    for i, field in enumerate(fields):
-        var = field_vars[i]
-        if field.is_primitive() and not field.is_array():
-            field_values.append(var)  # Scalar primitive - output parameter, use directly
-        else:
-            field_values.append(var)  # Array or composite - use _data variable
-
-    field_list = ", ".join(field_values)
+    field_list = ", ".join(field_vars)
     lines.extend(["", f"        return {struct_name}{{{field_list}}};", "    }", ""])
 
     return "\n".join(lines)
@@ -583,10 +564,14 @@ def _generate_footer() -> str:
     return ""  # Closed in main function
 
 
+@lru_cache(maxsize=4096)
 def _get_cpp_type(field_type: str, type_registry: TypeRegistry) -> str:
     """
     Get C++ type for a field type string.
 
+    Results are cached per (field_type, registry): the same primitive types
+    are resolved for every message and composite member.
+
     Handles:
     - Builtin types (uint8 → uint8_t)
     - String (uses STRING_MAX_LENGTH constant instead of hardcoded <128>)
@@ -627,12 +612,20 @@ def _get_encoder_call(field_name: str, field_type: str, type_registry: TypeRegis
     """
     Generate Encoder function call for encoding a field.
 
+    The call shape is resolved once per type (_encoder_format); only the
+    field expression is substituted per call.
+
     Returns:
         C++ code line calling appropriate Encoder function
     """
     # Extract base type (handle arrays)
     base_type = field_type.split("[")[0]
+    return _encoder_format(base_type, type_registry).format(target=field_name)
+
 
+@lru_cache(maxsize=256)
+def _encoder_format(base_type: str, type_registry: TypeRegistry) -> str:
+    """Encoder call for a base type, with a {target} placeholder (built once per type)."""
     if not type_registry.is_atomic(base_type):
         raise ValueError(f"Unknown type: {base_type}")
 
@@ -640,11 +633,9 @@ def _get_encoder_call(field_name: str, field_type: str, type_registry: TypeRegis
 
     if atomic.is_builtin:
         # Call encodeXXX() (already in Protocol namespace)
-        encoder_name = f"encode{_capitalize_first(base_type)}"
-        return f"{encoder_name}(ptr, {field_name});"
-    else:
-        # Nested struct - call its encode()
-        return f"ptr += {field_name}.encode(ptr, bufferSize - (ptr - buffer));"
+        return f"encode{_capitalize_first(base_type)}(ptr, {{target}});"
+    # Nested struct - call its encode()
+    return "ptr += {target}.encode(ptr, bufferSize - (ptr - buffer));"
 
 
 def _get_decoder_call(
@@ -653,6 +644,9 @@ def _get_decoder_call(
     """
     Generate decoder function call for decoding a field.
 
+    The call shape is resolved once per (type, direct) pair (_decoder_format);
+    only the variable names are substituted per call.
+
     Args:
         field_name: Variable name for temporary storage (if direct_target is None)
         field_type: Type string
@@ -663,29 +657,30 @@ def _get_decoder_call(
         C++ code line(s) calling appropriate decoder function
     """
     base_type = field_type.split("[")[0]
+    template = _decoder_format(base_type, type_registry, bool(direct_target))
+    return template.format(name=field_name, target=direct_target or field_name)
+
 
+@lru_cache(maxsize=256)
+def _decoder_format(base_type: str, type_registry: TypeRegistry, direct: bool) -> str:
+    """Decoder call for a base type, with {name}/{target} placeholders (built once per type)."""
     if not type_registry.is_atomic(base_type):
         raise ValueError(f"Unknown type: {base_type}")
 
     atomic = type_registry.get(base_type)
-    cpp_type = _get_cpp_type(base_type, type_registry)
 
     if atomic.is_builtin:
-        decoder_name = f"decode{_capitalize_first(base_type)}"
-        target = direct_target if direct_target else field_name
-
         # All types use the same call pattern now (no template for string)
-        decoder_call = f"{decoder_name}(ptr, remaining, {target})"
+        decoder_call = f"decode{_capitalize_first(base_type)}(ptr, remaining, {{target}})"
 
         # OPTION B: Direct pattern if direct_target provided
-        if direct_target:
+        if direct:
             return f"if (!{decoder_call}) return std::nullopt;"
-        else:
-            return f"""{cpp_type} {field_name};
+        cpp_type = _get_cpp_type(base_type, type_registry)
+        return f"""{cpp_type} {{name}};
         if (!{decoder_call}) return std::nullopt;"""
-    else:
-        return f"""auto {field_name} = {base_type}::decode(ptr, remaining);
-        if (!{field_name}) return std::nullopt;
+    return f"""auto {{name}} = {base_type}::decode(ptr, remaining);
+        if (!{{name}}) return std::nullopt;
         ptr += {base_type}::MAX_PAYLOAD_SIZE;
         remaining -= {base_type}::MAX_PAYLOAD_SIZE;"""
 
@@ -879,6 +874,7 @@ def _to_pascal_case(s: str) -> str:
     return "".join(word.capitalize() for word in words)
 
 
+@cache
 def _field_to_pascal_case(field_name: str) -> str:
     """
     Convert camelCase field name to PascalCase struct name.
@@ -899,30 +895,49 @@ def _field_to_pascal_case(field_name: str) -> str:
 # ============================================================================
 
 
-def _generate_composite_structs(
-    fields: Sequence[FieldBase], type_registry: TypeRegistry, depth: int = 0
-) -> str:
+def _generate_composite_structs(fields: Sequence[FieldBase], type_registry: TypeRegistry) -> str:
     """
-    Recursively generate all composite struct definitions from fields.
+    Generate all composite struct definitions from fields, each struct once.
     Returns empty string if no composites found.
     """
-    if depth > 3:
-        return ""  # Safety: max recursion depth
+    emitted: dict[str, str] = {}
+    _collect_composite_structs(fields, type_registry, emitted)
+    return "\n".join(emitted.values())
 
-    structs: list[str] = []
-    for field in fields:
+
+def _collect_composite_structs(
+    fields: Sequence[FieldBase], type_registry: TypeRegistry, emitted: dict[str, str]
+) -> None:
+    """
+    Render every composite struct under fields into emitted (keyed by struct name).
+
+    Nested composites are inserted before their parent (depth-first). A struct
+    name seen again is not re-emitted, but must render to the same definition.
+
+    Raises:
+        ValueError: If two composites share a struct name but not their members
+    """
+    # Explicit stack of (field, members already pushed): a composite is
+    # popped a second time, to be emitted, once all its members are done.
+    # Nesting depth is bounded by the validator, not cut off here.
+    stack = [(field, False) for field in reversed(fields)]
+    while stack:
+        field, members_done = stack.pop()
         if field.is_composite():
             assert isinstance(field, CompositeField)
-            # Generate nested composites first (depth-first)
-            nested = _generate_composite_structs(field.fields, type_registry, depth + 1)
-            if nested:
-                structs.append(nested)
+            if not members_done:
+                stack.append((field, True))
+                stack.extend((nested, False) for nested in reversed(field.fields))
+                continue
 
             # Generate this composite struct
+            struct_name = _field_to_pascal_case(field.name)
             struct_code = _generate_single_composite_struct(field, type_registry)
-            structs.append(struct_code)
-
-    return "\n".join(structs)
+            if emitted.setdefault(struct_name, struct_code) != struct_code:
+                raise ValueError(
+                    f"Composite struct '{struct_name}' is defined with different fields "
+                    "(composite field names must map to one C++ struct)"
+                )
 
 
 def _generate_single_composite_struct(field: CompositeField, type_registry: TypeRegistry) -> str:
@@ -930,7 +945,8 @@ def _generate_single_composite_struct(field: CompositeField, type_registry: Type
     Generate a single composite struct definition with include guards.
 
     BUG FIX #1: Wrap struct in #ifndef guard to prevent redefinition
-    when multiple messages use the same composite type.
+    when multiple messages use the same composite type. Within one header,
+    _collect_composite_structs already emits each struct once.
     """
     # BUG FIX #4: Convert camelCase to PascalCase (pageInfo → PageInfo, not Pageinfo)
     struct_name = _field_to_pascal_case(field.name)
@@ -941,30 +957,10 @@ def _generate_single_composite_struct(field: CompositeField, type_registry: Type
     lines = [f"#ifndef {guard_macro}", f"#define {guard_macro}", "", f"struct {struct_name} {{"]
 
     # Add member fields
-    for nested_field in field.fields:
-        if nested_field.is_primitive():
-            assert isinstance(nested_field, PrimitiveField)
-            # Get base C++ type without array wrapper
-            base_type = _get_cpp_type(nested_field.type_name.value, type_registry)
-            if nested_field.array:
-                # Use std::vector for dynamic arrays, std::array for fixed
-                if nested_field.dynamic:
-                    lines.append(f"    std::vector<{base_type}> {nested_field.name};")
-                else:
-                    lines.append(
-                        f"    std::array<{base_type}, {nested_field.array}> {nested_field.name};"
-                    )
-            else:
-                lines.append(f"    {base_type} {nested_field.name};")
-        else:  # Nested composite
-            assert isinstance(nested_field, CompositeField)
-            nested_struct_name = _field_to_pascal_case(nested_field.name)
-            if nested_field.array:
-                lines.append(
-                    f"    std::array<{nested_struct_name}, {nested_field.array}> {nested_field.name};"
-                )
-            else:
-                lines.append(f"    {nested_struct_name} {nested_field.name};")
+    lines.extend(
+        f"    {_get_cpp_type_for_field(nested_field, type_registry)} {nested_field.name};"
+        for nested_field in field.fields
+    )
 
     lines.append("};")
     lines.append("")
@@ -973,22 +969,42 @@ def _generate_single_composite_struct(field: CompositeField, type_registry: Type
     return "\n".join(lines)
 
 
+def _primitive_member_type(field: PrimitiveField, type_registry: TypeRegistry) -> str:
+    """C++ member type of a primitive field (std::vector when dynamic)."""
+    return _primitive_container_type(
+        field.type_name.value, field.array, field.dynamic, type_registry
+    )
+
+
+@lru_cache(maxsize=4096)
+def _primitive_container_type(
+    type_name: str, array: int | None, dynamic: bool, type_registry: TypeRegistry
+) -> str:
+    """C++ type of a primitive, wrapped in its container (cached per shape)."""
+    base_type = _get_cpp_type(type_name, type_registry)
+    if not array:
+        return base_type
+    # Use std::vector for dynamic arrays, std::array for fixed
+    return f"std::vector<{base_type}>" if dynamic else f"std::array<{base_type}, {array}>"
+
+
+def _composite_member_type(field: CompositeField, type_registry: TypeRegistry) -> str:
+    """C++ member type of a composite field (its PascalCase struct)."""
+    # BUG FIX #4: Convert camelCase to PascalCase
+    struct_name = _field_to_pascal_case(field.name)
+    if field.array:
+        return f"std::array<{struct_name}, {field.array}>"
+    return struct_name
+
+
+# Field class -> C++ member type resolver: one dict lookup per member
+# instead of an is_primitive()/isinstance chain (field classes are final)
+_MEMBER_TYPES: dict[type[FieldBase], Callable[[Any, TypeRegistry], str]] = {
+    PrimitiveField: _primitive_member_type,
+    CompositeField: _composite_member_type,
+}
+
+
 def _get_cpp_type_for_field(field: FieldBase, type_registry: TypeRegistry) -> str:
     """Get C++ type for a field (handles primitive and composite)."""
-    if field.is_primitive():
-        assert isinstance(field, PrimitiveField)
-        base_type = _get_cpp_type(field.type_name.value, type_registry)
-        if field.array:
-            # Use std::vector for dynamic arrays, std::array for fixed
-            if field.dynamic:
-                return f"std::vector<{base_type}>"
-            else:
-                return f"std::array<{base_type}, {field.array}>"
-        return base_type
-    else:  # Composite
-        assert isinstance(field, CompositeField)
-        # BUG FIX #4: Convert camelCase to PascalCase
-        struct_name = _field_to_pascal_case(field.name)
-        if field.array:
-            return f"std::array<{struct_name}, {field.array}>"
-        return struct_name
+    return _MEMBER_TYPES[type(field)](field, type_registry)
@@ -22,6 +22,7 @@ Generated Output:
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING
 
 # Import field classes for runtime isinstance checks
@@ -530,7 +531,7 @@ def _generate_decode_method(
                 decoder_call = _get_decoder_call(
                     field.name, field_type_name, java_type, type_registry
                 )
-                lines.append(f"        {decoder_call}")
+                lines.append(decoder_call)
                 field_vars.append(field.name)
         else:  # Composite
             assert isinstance(field, CompositeField)
@@ -566,10 +567,9 @@ def _generate_decode_method(
                                 nested_field.type_name.value,
                                 java_type,
                                 type_registry,
+                                indent="                ",
                             )
-                            # Indent by 16 spaces (4 levels)
-                            for line in decoder_call.split("\n"):
-                                lines.append(f"        {line}")
+                            lines.append(decoder_call)
                             lines.append(
                                 f"                item_{nested_field.name}[j] = item_{nested_field.name}_j;"
                             )
@@ -580,9 +580,9 @@ def _generate_decode_method(
                                 nested_field.type_name.value,
                                 java_type,
                                 type_registry,
+                                indent="            ",
                             )
-                            for line in decoder_call.split("\n"):
-                                lines.append(f"    {line}")
+                            lines.append(decoder_call)
                 # Construct item
                 item_params: list[str] = []
                 for nested_field in field.fields:
@@ -607,7 +607,7 @@ def _generate_decode_method(
                             java_type,
                             type_registry,
                         )
-                        lines.append(f"        {decoder_call}")
+                        lines.append(decoder_call)
                 # Construct composite
                 composite_params: list[str] = []
                 for nested_field in field.fields:
@@ -757,11 +757,18 @@ def _get_encoder_call(field_name: str, field_type: str, type_registry: TypeRegis
 
 
 def _get_decoder_call(
-    field_name: str, field_type: str, java_type: str, type_registry: TypeRegistry
+    field_name: str,
+    field_type: str,
+    java_type: str,
+    type_registry: TypeRegistry,
+    indent: str = "        ",
 ) -> str:
     """
     Generate Encoder method call for decoding a field.
 
+    Args:
+        indent: Leading whitespace of each emitted line
+
     Returns:
         Java code lines calling appropriate Encoder method
     """
@@ -778,14 +785,14 @@ def _get_decoder_call(
 
         if base_type == "string":
             # String needs max length parameter (using ProtocolConstants.STRING_MAX_LENGTH from config)
-            return f"{java_type} {field_name} = Decoder.{decoder_name}(data, offset, ProtocolConstants.STRING_MAX_LENGTH);\n        offset += 1 + {field_name}.length();"
+            return f"{indent}{java_type} {field_name} = Decoder.{decoder_name}(data, offset, ProtocolConstants.STRING_MAX_LENGTH);\n{indent}offset += 1 + {field_name}.length();"
         else:
             # Other types - calculate size based on type
             encoded_size = _get_encoded_size(base_type, 0)  # Size hardcoded per type
-            return f"{java_type} {field_name} = Decoder.{decoder_name}(data, offset);\n        offset += {encoded_size};"
+            return f"{indent}{java_type} {field_name} = Decoder.{decoder_name}(data, offset);\n{indent}offset += {encoded_size};"
     else:
         # Nested struct - call its decode()
-        return f"{java_type} {field_name} = {java_type}.decode(data);\n        offset += {java_type}.MAX_PAYLOAD_SIZE;"
+        return f"{indent}{java_type} {field_name} = {java_type}.decode(data);\n{indent}offset += {java_type}.MAX_PAYLOAD_SIZE;"
 
 
 def _calculate_max_payload_size(
@@ -1006,6 +1013,7 @@ def _to_getter_name(field_name: str) -> str:
 # ============================================================================
 
 
+@cache
 def _field_to_pascal_case(field_name: str) -> str:
     """
     Convert camelCase field name to PascalCase class name.
@@ -151,7 +151,7 @@ class ProtocolRendererBase(_RendererBase):
         count = 0
         for msg in messages:
             if msg.is_to_controller() and count < 3:
-                pascal = "".join(w.capitalize() for w in msg.name.split("_"))
+                pascal = msg.pascal_name
                 lines.append(f"// protocol.on{pascal} = [](const {pascal}Message& msg) {{ }};")
                 count += 1
 
@@ -162,7 +162,7 @@ class ProtocolRendererBase(_RendererBase):
         count = 0
         for msg in messages:
             if msg.is_to_host() and count < 3:
-                pascal = "".join(w.capitalize() for w in msg.name.split("_"))
+                pascal = msg.pascal_name
                 lines.append(f"// protocol.send({pascal}Message{{...}});")
                 count += 1
 
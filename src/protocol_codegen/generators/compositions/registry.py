@@ -4,10 +4,13 @@ Renderer Registry.
 Auto-discovery and factory for renderers.
 """
 
-from collections.abc import Callable
+from __future__ import annotations
+
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from protocol_codegen.generators.languages.base import LanguageBackend
     from protocol_codegen.generators.protocols import EncodingStrategy
 
@@ -59,7 +62,7 @@ class RendererRegistry:
     def get_backend_renderer(
         cls,
         file_type: str,
-        backend: "LanguageBackend",
+        backend: LanguageBackend,
     ) -> Any:
         """Get a by_backend renderer instance."""
         key = (file_type, backend.name.lower())
@@ -71,8 +74,8 @@ class RendererRegistry:
     def get_backend_strategy_renderer(
         cls,
         file_type: str,
-        backend: "LanguageBackend",
-        strategy: "EncodingStrategy",
+        backend: LanguageBackend,
+        strategy: EncodingStrategy,
     ) -> Any:
         """Get a by_backend_strategy renderer instance."""
         key = (file_type, backend.name.lower(), strategy.name.lower())
@@ -112,8 +115,8 @@ def register_renderer(
 
 def get_renderer(
     file_type: str,
-    backend: "LanguageBackend",
-    strategy: "EncodingStrategy | None" = None,
+    backend: LanguageBackend,
+    strategy: EncodingStrategy | None = None,
 ) -> Any:
     """
     Get a renderer instance.
@@ -7,6 +7,8 @@ No dynamic transformations - message names should be correctly defined at source
 
 from __future__ import annotations
 
+import sys
+from functools import cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -33,6 +35,7 @@ def message_name_to_method_name(message_name: str) -> str:
     return to_camel_case(message_name)
 
 
+@cache
 def message_name_to_callback_name(message_name: str) -> str:
     """
     Convert MESSAGE_NAME to onMethodName callback.
@@ -45,6 +48,7 @@ def message_name_to_callback_name(message_name: str) -> str:
     return f"on{method[0].upper()}{method[1:]}"
 
 
+@cache
 def to_camel_case(screaming_snake: str) -> str:
     """
     Convert SCREAMING_SNAKE_CASE to camelCase.
@@ -57,6 +61,7 @@ def to_camel_case(screaming_snake: str) -> str:
     return parts[0] + "".join(word.capitalize() for word in parts[1:])
 
 
+@cache
 def to_pascal_case(screaming_snake: str) -> str:
     """
     Convert SCREAMING_SNAKE_CASE to PascalCase.
@@ -91,11 +96,13 @@ def capitalize_first(s: str) -> str:
     return s[0].upper() + s[1:]
 
 
+@cache
 def field_to_pascal_case(field_name: str) -> str:
     """
     Convert camelCase field name to PascalCase.
 
-    This is used for inner struct/class names derived from field names.
+    This is used for inner struct/class names derived from field names, once
+    per declaration, constructor, getter, encode and decode pass (cached).
 
     Examples:
         pageInfo → PageInfo
@@ -104,4 +111,4 @@ def field_to_pascal_case(field_name: str) -> str:
     """
     if not field_name:
         return field_name
-    return field_name[0].upper() + field_name[1:]
+    return sys.intern(field_name[0].upper() + field_name[1:])
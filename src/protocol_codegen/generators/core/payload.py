@@ -77,6 +77,78 @@ class PayloadCalculator:
 
         return total_size
 
+    def calculate_payload_size_bounds(
+        self,
+        fields: Sequence[FieldBase],
+        string_max_length: int,
+        name_prefix_size: int = 0,
+    ) -> tuple[int, int]:
+        """
+        Calculate minimum and maximum payload sizes in one field-tree walk.
+
+        Same results as calculate_min_payload_size() and
+        calculate_max_payload_size(), for callers that need both.
+
+        Args:
+            fields: List of Field objects
+            string_max_length: Max string length from config
+            name_prefix_size: Size of MESSAGE_NAME prefix (0 if disabled)
+
+        Returns:
+            Tuple of (min_size, max_size) in bytes
+        """
+        min_total = max_total = name_prefix_size
+
+        for field in fields:
+            field_min, field_max = self._get_field_size_bounds(field, string_max_length)
+            min_total += field_min
+            max_total += field_max
+
+        return min_total, max_total
+
+    def _get_field_size_bounds(self, field: FieldBase, string_max_length: int) -> tuple[int, int]:
+        """Calculate (min, max) size for a single field."""
+        if isinstance(field, EnumField):
+            return self._get_enum_min_size(field), self._get_enum_max_size(field)
+        elif isinstance(field, PrimitiveField):
+            return self._get_primitive_size_bounds(field, string_max_length)
+        elif isinstance(field, CompositeField):
+            nested_min, nested_max = self.calculate_payload_size_bounds(
+                field.fields, string_max_length
+            )
+            if field.array:
+                return 1, 1 + (nested_max * field.array)  # Count byte / count + items
+            return nested_min, nested_max
+        return 0, 0
+
+    def _get_primitive_size_bounds(
+        self, field: PrimitiveField, string_max_length: int
+    ) -> tuple[int, int]:
+        """Calculate (min, max) size for primitive field, resolving its type once."""
+        type_name = field.type_name.value
+        array_size = field.array if field.array else 1
+
+        if not self.type_registry.is_atomic(type_name):
+            return 10, 10 * array_size  # Conservative estimate
+
+        atomic = self.type_registry.get(type_name)
+
+        if atomic.is_builtin:
+            if atomic.size_bytes == "variable":
+                # String: length prefix only (empty) / length prefix + max chars
+                min_base = self.strategy.get_string_min_encoded_size()
+                max_base = self.strategy.get_string_max_encoded_size(string_max_length)
+            else:
+                assert isinstance(atomic.size_bytes, int)
+                min_base = max_base = self.strategy.get_encoded_size(type_name, atomic.size_bytes)
+        else:
+            min_base = max_base = 10  # Conservative
+
+        if field.array:
+            # Count byte only (min = 0 elements) / count byte + all items
+            return 1, max_base * array_size + 1
+        return min_base, max_base
+
     def _get_field_max_size(self, field: FieldBase, string_max_length: int) -> int:
         """Calculate max size for a single field."""
         if isinstance(field, EnumField):
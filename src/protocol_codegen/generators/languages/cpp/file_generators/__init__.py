@@ -14,8 +14,14 @@ from protocol_codegen.generators.languages.cpp.file_generators.decoder_registry
     generate_decoder_registry_hpp,
 )
 from protocol_codegen.generators.languages.cpp.file_generators.enum import (
+    clear_enum_cache,
+    generate_all_enum_hpp,
     generate_enum_hpp,
 )
+from protocol_codegen.generators.languages.cpp.file_generators.message_base import (
+    generate_message_base_hpp,
+    needs_message_base,
+)
 from protocol_codegen.generators.languages.cpp.file_generators.message_structure import (
     generate_message_structure_hpp,
 )
@@ -26,6 +32,8 @@ from protocol_codegen.generators.languages.cpp.file_generators.method import (
     generate_protocol_methods_hpp,
 )
 from protocol_codegen.generators.languages.cpp.file_generators.struct import (
+    generate_all_composite_hpp,
+    generate_all_struct_hpp,
     generate_struct_hpp,
 )
 
@@ -38,4 +46,10 @@ __all__ = [
     "generate_messageid_hpp",
     "generate_protocol_methods_hpp",
     "generate_struct_hpp",
+    "generate_all_struct_hpp",
+    "generate_all_composite_hpp",
+    "generate_all_enum_hpp",
+    "clear_enum_cache",
+    "generate_message_base_hpp",
+    "needs_message_base",
 ]
@@ -9,10 +9,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from protocol_codegen.generators.core.naming import (
-    message_name_to_callback_name,
-    to_pascal_case,
-)
+from protocol_codegen.generators.core.naming import message_name_to_callback_name
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -34,7 +31,7 @@ def generate_protocol_callbacks_hpp(messages: list[Message], output_path: Path)
     # Generate callback declarations for each message
     callbacks: list[str] = []
     for message in messages:
-        class_name = f"{to_pascal_case(message.name)}Message"
+        class_name = f"{message.pascal_name}Message"
         callback_name = message_name_to_callback_name(message.name)
 
         callbacks.append(f"    std::function<void(const {class_name}&)> {callback_name};")
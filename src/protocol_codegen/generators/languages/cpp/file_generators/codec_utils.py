@@ -7,18 +7,32 @@ These are protocol-agnostic - the actual encoding logic is in the Encoder/Decode
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+from protocol_codegen.core.loader import BUILTIN_TYPES
 from protocol_codegen.generators.core.naming import capitalize_first
 
 if TYPE_CHECKING:
     from protocol_codegen.core.loader import TypeRegistry
 
+# Encoder/Decoder function names per builtin type, built once at import
+_ENCODER_NAMES: dict[str, str] = {
+    type_name: f"encode{capitalize_first(type_name)}" for type_name in BUILTIN_TYPES
+}
+_DECODER_NAMES: dict[str, str] = {
+    type_name: f"decode{capitalize_first(type_name)}" for type_name in BUILTIN_TYPES
+}
 
+
+@lru_cache(maxsize=4096)
 def get_cpp_type(field_type: str, type_registry: TypeRegistry) -> str:
     """
     Get C++ type for a field type string.
 
+    Results are cached per (field_type, registry): every field of every
+    message resolves its type several times per run.
+
     Handles:
     - Builtin types (uint8 → uint8_t)
     - String (uses STRING_MAX_LENGTH constant instead of hardcoded <128>)
@@ -55,68 +69,88 @@ def get_cpp_type(field_type: str, type_registry: TypeRegistry) -> str:
     raise ValueError(f"Unknown type: {field_type}")
 
 
+@lru_cache(maxsize=256)
+def _encoder_format(base_type: str, type_registry: TypeRegistry) -> str:
+    """Encoder call for a base type, with a {target} placeholder (built once per type)."""
+    if not type_registry.is_atomic(base_type):
+        raise ValueError(f"Unknown type: {base_type}")
+
+    atomic = type_registry.get(base_type)
+
+    if atomic.is_builtin:
+        # Call Encoder::encodeXXX() (static method in Encoder struct)
+        return f"Encoder::{_ENCODER_NAMES[base_type]}(ptr, {{target}});"
+    # Nested struct - call its encode()
+    return "ptr += {target}.encode(ptr, bufferSize - (ptr - buffer));"
+
+
 def get_encoder_call(field_name: str, field_type: str, type_registry: TypeRegistry) -> str:
     """
     Generate Encoder function call for encoding a field.
 
+    The call shape is resolved once per type (_encoder_format); only the
+    field expression is substituted per call.
+
     Returns:
         C++ code line calling appropriate Encoder function
     """
     # Extract base type (handle arrays)
     base_type = field_type.split("[")[0]
+    return _encoder_format(base_type, type_registry).format(target=field_name)
+
 
+@lru_cache(maxsize=256)
+def _decoder_format(
+    base_type: str, type_registry: TypeRegistry, direct: bool, check_bounds: bool
+) -> str:
+    """Decoder call for a base type, with {name}/{target} placeholders (built once per type)."""
     if not type_registry.is_atomic(base_type):
         raise ValueError(f"Unknown type: {base_type}")
 
     atomic = type_registry.get(base_type)
 
     if atomic.is_builtin:
-        # Call Encoder::encodeXXX() (static method in Encoder struct)
-        encoder_name = f"encode{capitalize_first(base_type)}"
-        return f"Encoder::{encoder_name}(ptr, {field_name});"
-    else:
-        # Nested struct - call its encode()
-        return f"ptr += {field_name}.encode(ptr, bufferSize - (ptr - buffer));"
+        # All types use the same call pattern now (no template for string)
+        decoder_call = f"Decoder::{_DECODER_NAMES[base_type]}(ptr, remaining, {{target}})"
+
+        # OPTION B: Direct pattern if direct_target provided
+        if direct:
+            if not check_bounds:
+                return f"{decoder_call};"
+            return f"if (!{decoder_call}) return std::nullopt;"
+        cpp_type = get_cpp_type(base_type, type_registry)
+        return f"""{cpp_type} {{name}};
+        if (!{decoder_call}) return std::nullopt;"""
+    return f"""auto {{name}} = {base_type}::decode(ptr, remaining);
+        if (!{{name}}) return std::nullopt;
+        ptr += {base_type}::MAX_PAYLOAD_SIZE;
+        remaining -= {base_type}::MAX_PAYLOAD_SIZE;"""
 
 
 def get_decoder_call(
-    field_name: str, field_type: str, type_registry: TypeRegistry, direct_target: str | None = None
+    field_name: str,
+    field_type: str,
+    type_registry: TypeRegistry,
+    direct_target: str | None = None,
+    check_bounds: bool = True,
 ) -> str:
     """
     Generate decoder function call for decoding a field.
 
+    The call shape is resolved once per (type, direct) pair (_decoder_format);
+    only the variable names are substituted per call.
+
     Args:
         field_name: Variable name for temporary storage (if direct_target is None)
         field_type: Type string
         type_registry: Type registry
         direct_target: Optional direct struct member path (e.g., "pageInfo_data.pageIndex")
+        check_bounds: False to ignore the decoder result, when the caller has
+            already checked remaining for the whole composite (direct_target only)
 
     Returns:
         C++ code line(s) calling appropriate decoder function
     """
     base_type = field_type.split("[")[0]
-
-    if not type_registry.is_atomic(base_type):
-        raise ValueError(f"Unknown type: {base_type}")
-
-    atomic = type_registry.get(base_type)
-    cpp_type = get_cpp_type(base_type, type_registry)
-
-    if atomic.is_builtin:
-        decoder_name = f"decode{capitalize_first(base_type)}"
-        target = direct_target if direct_target else field_name
-
-        # All types use the same call pattern now (no template for string)
-        decoder_call = f"Decoder::{decoder_name}(ptr, remaining, {target})"
-
-        # OPTION B: Direct pattern if direct_target provided
-        if direct_target:
-            return f"if (!{decoder_call}) return std::nullopt;"
-        else:
-            return f"""{cpp_type} {field_name};
-        if (!{decoder_call}) return std::nullopt;"""
-    else:
-        return f"""auto {field_name} = {base_type}::decode(ptr, remaining);
-        if (!{field_name}) return std::nullopt;
-        ptr += {base_type}::MAX_PAYLOAD_SIZE;
-        remaining -= {base_type}::MAX_PAYLOAD_SIZE;"""
+    template = _decoder_format(base_type, type_registry, bool(direct_target), check_bounds)
+    return template.format(name=field_name, target=direct_target or field_name)
@@ -120,6 +120,18 @@ def _generate_header(protocol_name: str, is_sysex: bool) -> str:
 
 #include <cstdint>
 
+// Generated struct encode()/decode() are forced inline so their Encoder/Decoder
+// calls fold into the caller (define PROTOCOL_FORCE_INLINE first to override)
+#ifndef PROTOCOL_FORCE_INLINE
+#if defined(_MSC_VER)
+#define PROTOCOL_FORCE_INLINE __forceinline
+#elif defined(__GNUC__) || defined(__clang__)
+#define PROTOCOL_FORCE_INLINE [[gnu::always_inline]] inline
+#else
+#define PROTOCOL_FORCE_INLINE inline
+#endif
+#endif
+
 namespace Protocol {{
 
 // ============================================================================
@@ -34,8 +34,7 @@ def generate_decoder_registry_hpp(messages: list[Message], output_path: Path) ->
     # Generate case statements for each message
     cases: list[str] = []
     for message in messages:
-        # Convert SCREAMING_SNAKE_CASE to PascalCase
-        pascal_name = "".join(word.capitalize() for word in message.name.split("_"))
+        pascal_name = message.pascal_name
         class_name = f"{pascal_name}Message"
         callback_name = f"on{pascal_name}"
 
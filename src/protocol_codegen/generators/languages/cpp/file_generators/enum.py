@@ -5,10 +5,44 @@ Generates C++ enum class or constants from EnumDef definitions.
 Enums are generated in the Protocol namespace for consistency with structs.
 """
 
+import hashlib
+import re
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from functools import lru_cache
 from pathlib import Path
 
 from protocol_codegen.core.enum_def import EnumDef
 
+# Position before every uppercase letter except the first (PascalCase word boundary)
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Fixed header lines shared by every enum file
+_ENUM_PREAMBLE = "#pragma once\n\n#include <cstdint>\n\n"
+
+# Rendered file text after the header comment, keyed by enum content digest
+# (see _enum_fingerprint). Identical definitions, including the same enum
+# reloaded across watch/rebuild runs, skip re-rendering.
+_ENUM_BODY_CACHE: dict[bytes, str] = {}
+
+
+def clear_enum_cache() -> None:
+    """Drop every memoized generate_enum_hpp() body."""
+    _ENUM_BODY_CACHE.clear()
+
+
+def _enum_fingerprint(enum_def: EnumDef) -> bytes:
+    """Digest of every EnumDef attribute the C++ output depends on."""
+    content = (
+        enum_def.name,
+        tuple(enum_def.values.items()),
+        enum_def.is_bitflags,
+        enum_def.description,
+        enum_def.cpp_namespace,
+    )
+    return hashlib.blake2b(repr(content).encode(), digest_size=16).digest()
+
 
 def generate_enum_hpp(enum_def: EnumDef, output_path: Path) -> str:
     """
@@ -17,12 +51,15 @@ def generate_enum_hpp(enum_def: EnumDef, output_path: Path) -> str:
     For regular enums, generates an enum class with conversion helpers.
     For bitflags, generates constexpr constants that can be combined with |.
 
+    Everything below the header comment is memoized by enum content, so
+    regenerating an identical definition only re-renders the header.
+
     Args:
         enum_def: The enum definition to generate
         output_path: Path where the file will be written (for header comment)
 
     Returns:
-        Generated C++ header content as string
+        Generated C++ header content as string, newline-terminated (written as-is)
 
     Examples:
         >>> from protocol_codegen.core.enum_def import EnumDef
@@ -31,57 +68,75 @@ def generate_enum_hpp(enum_def: EnumDef, output_path: Path) -> str:
         >>> "enum class TrackType" in code
         True
     """
-    lines: list[str] = []
+    key = _enum_fingerprint(enum_def)
+    rest = _ENUM_BODY_CACHE.get(key)
+    if rest is None:
+        body = (
+            _generate_bitflags(enum_def) if enum_def.is_bitflags else _generate_enum_class(enum_def)
+        )
+
+        # Open/close namespace (if specified)
+        namespace = enum_def.cpp_namespace
+        ns_open = f"namespace {namespace} {{\n\n" if namespace else ""
+        ns_close = f"\n}}  // namespace {namespace}\n" if namespace else ""
+
+        rest = _ENUM_BODY_CACHE[key] = f"{_ENUM_PREAMBLE}{ns_open}{body}{ns_close}"
+
+    # Only the header comment carries the file name
+    return f"{_generate_header(enum_def, output_path.name)}\n{rest}"
+
+
+def generate_all_enum_hpp(
+    enum_defs: Sequence[EnumDef],
+    output_dir: Path,
+    max_workers: int | None = 1,
+    executor: Executor | None = None,
+) -> dict[str, str]:
+    """
+    Generate C++ headers for a batch of enum definitions.
 
-    # Header
-    lines.append(_generate_header(enum_def, output_path))
+    Same process-pool fan-out as generate_all_struct_hpp(): enums share no
+    state, so each header is rendered independently and the caller writes
+    the results from the parent process.
 
-    # Pragma and includes
-    lines.append("#pragma once")
-    lines.append("")
-    lines.append("#include <cstdint>")
-    lines.append("")
+    Args:
+        enum_defs: Enum definitions to generate
+        output_dir: Directory where <EnumName>.hpp files will be written
+        max_workers: Worker processes (1 = generate in-process, None = one per CPU)
+        executor: Running pool to submit to instead; max_workers is then ignored
 
-    # Open namespace (if specified)
-    if enum_def.cpp_namespace:
-        lines.append(f"namespace {enum_def.cpp_namespace} {{")
-        lines.append("")
+    Returns:
+        Dict mapping enum name to generated C++ code, in input order
+    """
+    jobs = [(enum_def, output_dir / f"{enum_def.name}.hpp") for enum_def in enum_defs]
 
-    if enum_def.is_bitflags:
-        lines.append(_generate_bitflags(enum_def))
+    pool: AbstractContextManager[Executor]
+    if executor is None:
+        if max_workers == 1 or len(jobs) < 2:
+            return {job[0].name: generate_enum_hpp(*job) for job in jobs}
+        pool = ProcessPoolExecutor(max_workers=max_workers)
     else:
-        lines.append(_generate_enum_class(enum_def))
-
-    # Close namespace (if specified)
-    if enum_def.cpp_namespace:
-        lines.append(f"}}  // namespace {enum_def.cpp_namespace}")
-        lines.append("")
-
-    return "\n".join(lines)
+        pool = nullcontext(executor)
 
+    with pool as workers:
+        futures = {job[0].name: workers.submit(generate_enum_hpp, *job) for job in jobs}
+        return {name: future.result() for name, future in futures.items()}
 
-def _generate_header(enum_def: EnumDef, output_path: Path) -> str:
-    """Generate file header comment."""
-    header_lines = [
-        "/**",
-        f" * {output_path.name} - Auto-generated Protocol Enum",
-        " *",
-        " * AUTO-GENERATED - DO NOT EDIT",
-        " *",
-    ]
-
-    if enum_def.description:
-        header_lines.append(f" * Description: {enum_def.description}")
-        header_lines.append(" *")
 
-    if enum_def.is_bitflags:
-        header_lines.append(" * Note: This is a bitflags type - values can be combined with |")
-        header_lines.append(" *")
+# Invariant header comment parts (only the file name and description vary)
+_HEADER_NOTICE = " *\n * AUTO-GENERATED - DO NOT EDIT\n *\n"
+_BITFLAGS_NOTE = " * Note: This is a bitflags type - values can be combined with |\n *\n"
+_HEADER_TAIL = " */\n"
 
-    header_lines.append(" */")
-    header_lines.append("")
 
-    return "\n".join(header_lines)
+def _generate_header(enum_def: EnumDef, file_name: str) -> str:
+    """Generate file header comment."""
+    description = f" * Description: {enum_def.description}\n *\n" if enum_def.description else ""
+    note = _BITFLAGS_NOTE if enum_def.is_bitflags else ""
+    return (
+        f"/**\n * {file_name} - Auto-generated Protocol Enum\n"
+        f"{_HEADER_NOTICE}{description}{note}{_HEADER_TAIL}"
+    )
 
 
 def _to_camel_case(pascal_case: str) -> str:
@@ -112,65 +167,49 @@ def _to_display_name(screaming_snake: str) -> str:
 
 def _generate_enum_class(enum_def: EnumDef) -> str:
     """Generate enum class with conversion helpers, COUNT sentinel, and name function."""
-    lines: list[str] = []
-
-    # Enum class definition
-    lines.append(f"enum class {enum_def.name} : uint8_t {{")
-
-    # Values
-    for name, value in enum_def.values.items():
-        lines.append(f"    {name} = {value},")
-
-    # Add COUNT as sentinel (max_value + 1)
-    count_value = enum_def.max_value + 1
-    lines.append(f"    COUNT = {count_value},  // Sentinel - must be last")
-
-    lines.append("};")
-    lines.append("")
-
-    # Conversion helpers
-    lines.append("// Conversion helpers")
-    lines.append(f"inline {enum_def.name} to{enum_def.name}(uint8_t value) {{")
-    lines.append(f"    return static_cast<{enum_def.name}>(value);")
-    lines.append("}")
-    lines.append("")
-
-    lines.append(f"inline uint8_t from{enum_def.name}({enum_def.name} value) {{")
-    lines.append("    return static_cast<uint8_t>(value);")
-    lines.append("}")
-    lines.append("")
-
-    # Name helper function
-    func_name = _to_camel_case(enum_def.name) + "Name"
-    lines.append("// Name helper")
-    lines.append(f"inline const char* {func_name}({enum_def.name} value) {{")
-    lines.append("    switch (value) {")
-    for name in enum_def.values.keys():
-        display_name = _to_display_name(name)
-        lines.append(f"        case {enum_def.name}::{name}: return \"{display_name}\";")
-    lines.append("        default: return \"Unknown\";")
-    lines.append("    }")
-    lines.append("}")
-    lines.append("")
-
-    return "\n".join(lines)
+    name = enum_def.name
+    values_block = "\n".join(
+        f"    {value_name} = {value}," for value_name, value in enum_def.values.items()
+    )
+    cases_block = "\n".join(
+        f'        case {name}::{value_name}: return "{_to_display_name(value_name)}";'
+        for value_name in enum_def.values
+    )
+    # COUNT is a sentinel (max_value + 1)
+    return f"""enum class {name} : uint8_t {{
+{values_block}
+    COUNT = {enum_def.max_value + 1},  // Sentinel - must be last
+}};
+
+// Conversion helpers
+inline {name} to{name}(uint8_t value) {{
+    return static_cast<{name}>(value);
+}}
+
+inline uint8_t from{name}({name} value) {{
+    return static_cast<uint8_t>(value);
+}}
+
+// Name helper
+inline const char* {_to_camel_case(name)}Name({name} value) {{
+    switch (value) {{
+{cases_block}
+        default: return "Unknown";
+    }}
+}}
+"""
 
 
 def _generate_bitflags(enum_def: EnumDef) -> str:
     """Generate constexpr constants for bitflags."""
-    lines: list[str] = []
-
-    # Constants
-    lines.append(f"// {enum_def.name} bitflags - combine with |")
-    for name, value in enum_def.values.items():
-        const_name = f"{_to_screaming_snake(enum_def.name)}_{name}"
-        lines.append(f"constexpr uint8_t {const_name} = {value};")
-
-    lines.append("")
-
-    return "\n".join(lines)
+    prefix = _to_screaming_snake(enum_def.name)
+    constants = "".join(
+        f"constexpr uint8_t {prefix}_{name} = {value};\n" for name, value in enum_def.values.items()
+    )
+    return f"// {enum_def.name} bitflags - combine with |\n{constants}"
 
 
+@lru_cache(maxsize=1024)
 def _to_screaming_snake(pascal_case: str) -> str:
     """Convert PascalCase to SCREAMING_SNAKE_CASE.
 
@@ -180,12 +219,7 @@ def _to_screaming_snake(pascal_case: str) -> str:
         >>> _to_screaming_snake("ChildType")
         'CHILD_TYPE'
     """
-    result: list[str] = []
-    for i, char in enumerate(pascal_case):
-        if char.isupper() and i > 0:
-            result.append("_")
-        result.append(char.upper())
-    return "".join(result)
+    return _CAMEL_BOUNDARY.sub("_", pascal_case).upper()
 
 
-__all__ = ["generate_enum_hpp"]
+__all__ = ["clear_enum_cache", "generate_all_enum_hpp", "generate_enum_hpp"]
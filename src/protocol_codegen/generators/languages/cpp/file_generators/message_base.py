@@ -0,0 +1,109 @@
+"""
+MessageBase.hpp Generator (C++)
+
+Generates the codec shared by every fieldless message. Such messages only
+carry their MESSAGE_NAME prefix, so their encode()/decode() bodies are
+identical up to the name constants: each struct derives from
+detail::NameOnlyMessage<Self> instead of repeating them.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from protocol_codegen.core.message import Message
+
+_MESSAGE_BASE_HPP = """/**
+ * MessageBase.hpp - Shared codec for fieldless messages
+ *
+ * AUTO-GENERATED - DO NOT EDIT
+ *
+ * Messages without fields encode only their MESSAGE_NAME prefix. Their
+ * structs derive from detail::NameOnlyMessage<Self>, which reads the
+ * MESSAGE_NAME, MESSAGE_NAME_LEN and *_PAYLOAD_SIZE constants of Self.
+ */
+
+#pragma once
+
+#include "Encoder.hpp"
+#include "Decoder.hpp"
+#include "ProtocolConstants.hpp"
+#include <cstdint>
+#include <cstring>
+#include <optional>
+
+namespace Protocol {
+namespace detail {
+
+template <typename Derived>
+struct NameOnlyMessage {
+    /**
+     * Encode struct to MIDI-safe bytes (message name only, no fields)
+     *
+     * @param buffer Output buffer (must have >= MAX_PAYLOAD_SIZE bytes)
+     * @param bufferSize Size of output buffer
+     * @return Number of bytes written, or 0 if buffer too small
+     */
+    PROTOCOL_FORCE_INLINE uint16_t encode(uint8_t* buffer, uint16_t bufferSize) const {
+        if (bufferSize < Derived::MAX_PAYLOAD_SIZE) return 0;
+
+        uint8_t* ptr = buffer;
+
+        // Encode message name (length-prefixed string for bridge logging)
+        Encoder::encodeUint8(ptr, Derived::MESSAGE_NAME_LEN);
+        std::memcpy(ptr, Derived::MESSAGE_NAME, Derived::MESSAGE_NAME_LEN);
+        ptr += Derived::MESSAGE_NAME_LEN;
+
+        return ptr - buffer;
+    }
+
+    /**
+     * Encode without a runtime size check (the payload size is fixed)
+     *
+     * @param buffer Output buffer (must have >= MAX_PAYLOAD_SIZE bytes)
+     * @return Number of bytes written (MAX_PAYLOAD_SIZE)
+     */
+    PROTOCOL_FORCE_INLINE uint16_t encode(uint8_t* buffer) const noexcept {
+        return encode(buffer, Derived::MAX_PAYLOAD_SIZE);
+    }
+
+    /**
+     * Decode struct from MIDI-safe bytes (empty message with name prefix)
+     * @return Empty struct, or std::nullopt if the name prefix is missing
+     */
+    [[nodiscard]] PROTOCOL_FORCE_INLINE static std::optional<Derived> decode(
+        const uint8_t* data, uint16_t len) {
+        if (len < Derived::MIN_PAYLOAD_SIZE) return std::nullopt;
+        const uint8_t* ptr = data;
+        size_t remaining = len;
+        // Skip MESSAGE_NAME prefix
+        uint8_t nameLen;
+        if (!Decoder::decodeUint8(ptr, remaining, nameLen)) return std::nullopt;
+        return Derived{};
+    }
+};
+
+}  // namespace detail
+}  // namespace Protocol
+"""
+
+
+def needs_message_base(messages: list[Message], include_message_name: bool) -> bool:
+    """Check if any struct derives from detail::NameOnlyMessage."""
+    return include_message_name and any(not message.fields for message in messages)
+
+
+def generate_message_base_hpp(output_path: Path) -> str:
+    """
+    Generate MessageBase.hpp (detail::NameOnlyMessage).
+
+    Args:
+        output_path: Output file path (for reference only)
+
+    Returns:
+        Generated C++ code as string
+    """
+    return _MESSAGE_BASE_HPP
@@ -29,8 +29,7 @@ def generate_message_structure_hpp(messages: list[Message], output_path: Path) -
     # Generate includes for all message structs
     includes: list[str] = []
     for message in messages:
-        # Convert SCREAMING_SNAKE_CASE to PascalCase
-        pascal_name = "".join(word.capitalize() for word in message.name.split("_"))
+        pascal_name = message.pascal_name
         struct_name = f"{pascal_name}Message"
         includes.append(f'#include "struct/{struct_name}.hpp"')
 
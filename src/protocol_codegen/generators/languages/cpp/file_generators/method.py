@@ -130,7 +130,7 @@ def generate_protocol_methods_hpp(
         if msg.is_to_host():
             # Controller sends to Host -> generate send method
             # Add Protocol:: namespace prefix for C++ usage in .inl file
-            struct_name = "Protocol::" + to_pascal_case(msg.name) + "Message"
+            struct_name = "Protocol::" + msg.pascal_name + "Message"
             method_name = message_name_to_method_name(msg.name)
             params = _generate_method_params(list(msg.fields))
             args = _generate_struct_args(list(msg.fields))
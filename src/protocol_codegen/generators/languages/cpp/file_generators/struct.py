@@ -8,7 +8,7 @@ Key Features:
 - Calls Encoder::encodeXXX() instead of inline logic (DRY)
 - MAX_PAYLOAD_SIZE constexpr for validation
 - std::optional for safe decoding
-- Zero runtime overhead (static inline + compiler optimization)
+- Zero runtime overhead (encode/decode forced inline via PROTOCOL_FORCE_INLINE)
 
 Generated Output:
 - One .hpp file per message (e.g., TransportPlayMessage.hpp)
@@ -18,21 +18,29 @@ Generated Output:
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from typing import TYPE_CHECKING
 
-from protocol_codegen.generators.core.naming import to_pascal_case
+from protocol_codegen.core.field import populate_type_names
 from protocol_codegen.generators.languages.cpp.file_generators.struct_utils import (
-    generate_composite_structs,
+    collect_composite_fields,
+    generate_composite_hpp,
     generate_decode_function,
     generate_encode_function,
     generate_footer,
     generate_header,
     generate_struct_definition,
+    generate_tag_struct,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from concurrent.futures import Executor
+    from contextlib import AbstractContextManager
     from pathlib import Path
 
+    from protocol_codegen.core.field import CompositeField
     from protocol_codegen.core.loader import TypeRegistry
     from protocol_codegen.core.message import Message
     from protocol_codegen.generators.protocols import EncodingStrategy
@@ -67,7 +75,7 @@ def generate_struct_hpp(
         include_message_name = strategy.include_message_name_default
 
     # Convert SCREAMING_SNAKE_CASE to PascalCase
-    pascal_name = to_pascal_case(message.name)
+    pascal_name = message.pascal_name
     struct_name = f"{pascal_name}Message"
     fields = message.fields
     description = f"{message.name} message"
@@ -76,19 +84,29 @@ def generate_struct_hpp(
     encoding_description = f"{strategy.description} ({strategy.name})"
     encoding_description_short = strategy.description.split()[0]  # "8-bit" or "7-bit"
 
-    # Generate all parts using common utilities
-    header = generate_header(
+    # Every section appends to one line list, joined once at the end
+    lines: list[str] = []
+    generate_header(
+        lines,
         struct_name=struct_name,
         description=description,
         fields=fields,
         type_registry=type_registry,
         encoding_description=encoding_description,
+        # String/enum includes come from the message's cached field summary
+        enum_defs=message.enum_defs,
+        needs_string=message.has_string_field,
+        name_only=include_message_name and not fields,
     )
 
-    # Generate composite structs FIRST (if any)
-    composite_structs = generate_composite_structs(fields, type_registry)
+    # Nothing to encode or decode: a tag type whose codec folds to constants
+    if not fields and not include_message_name:
+        generate_tag_struct(lines, struct_name, message.name)
+        generate_footer(lines)
+        return "\n".join(lines)
 
-    struct_def = generate_struct_definition(
+    generate_struct_definition(
+        lines,
         struct_name=struct_name,
         message_name=message.name,
         pascal_name=pascal_name,
@@ -96,9 +114,11 @@ def generate_struct_hpp(
         fields=fields,
         type_registry=type_registry,
         include_message_name=include_message_name,
+        strategy=strategy,
     )
 
-    encode_fn = generate_encode_function(
+    generate_encode_function(
+        lines,
         struct_name=struct_name,
         pascal_name=pascal_name,
         fields=fields,
@@ -109,16 +129,148 @@ def generate_struct_hpp(
         include_message_name=include_message_name,
     )
 
-    decode_fn = generate_decode_function(
+    generate_decode_function(
+        lines,
         struct_name=struct_name,
         fields=fields,
         type_registry=type_registry,
         string_max_length=string_max_length,
         include_message_name=include_message_name,
+        strategy=strategy,
     )
 
-    footer = generate_footer()
+    generate_footer(lines)
+    return "\n".join(lines)
+
+
+def generate_all_struct_hpp(
+    messages: Sequence[Message],
+    allocations: dict[str, int],
+    type_registry: TypeRegistry,
+    output_dir: Path,
+    string_max_length: int,
+    strategy: EncodingStrategy,
+    include_message_name: bool | None = None,
+    max_workers: int | None = 1,
+    executor: Executor | None = None,
+) -> dict[str, str]:
+    """
+    Generate C++ struct headers for a batch of messages.
+
+    Same process-pool fan-out as generate_all_struct_java(): each header is
+    rendered independently, and workers re-populate the Type enum first.
+
+    Args:
+        messages: Messages to generate structs for
+        allocations: Message name -> allocated message ID
+        type_registry: TypeRegistry for resolving field types
+        output_dir: Directory where Message*.hpp files will be written
+        string_max_length: Maximum string length from config
+        strategy: Encoding strategy (BinaryEncodingStrategy or SysExEncodingStrategy)
+        include_message_name: Include MESSAGE_NAME prefix in payload (None = use strategy default)
+        max_workers: Worker processes (1 = generate in-process, None = one per CPU)
+        executor: Running pool to submit to instead (its workers must have
+            populated the Type enum); max_workers is then ignored
+
+    Returns:
+        Dict mapping message name to generated C++ code, in input order
+    """
+    jobs = [
+        (
+            message,
+            allocations[message.name],
+            type_registry,
+            output_dir / f"{message.pascal_name}Message.hpp",
+            string_max_length,
+            strategy,
+            include_message_name,
+        )
+        for message in messages
+    ]
+
+    pool: AbstractContextManager[Executor]
+    if executor is None:
+        if max_workers == 1 or len(jobs) < 2:
+            return {job[0].name: generate_struct_hpp(*job) for job in jobs}
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=populate_type_names,
+            initargs=(list(type_registry.types.keys()),),
+        )
+    else:
+        pool = nullcontext(executor)
 
-    # Insert composite structs BEFORE main message struct
-    full_code = f"{header}\n{composite_structs}\n{struct_def}\n{encode_fn}\n{decode_fn}\n{footer}}};\n\n}}  // namespace Protocol\n"
-    return full_code
+    with pool as workers:
+        futures = {job[0].name: workers.submit(generate_struct_hpp, *job) for job in jobs}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def generate_all_composite_hpp(
+    messages: Sequence[Message],
+    type_registry: TypeRegistry,
+    strategy: EncodingStrategy | None = None,
+    max_workers: int | None = 1,
+    executor: Executor | None = None,
+) -> dict[str, str]:
+    """
+    Generate the shared header of every composite struct used by messages.
+
+    A composite used by several messages (or nested in several composites)
+    is rendered once, keyed by its struct name. Struct names are rendered
+    independently, on the same process pool as generate_all_struct_hpp().
+
+    Args:
+        messages: Messages whose fields (nested included) are scanned
+        type_registry: TypeRegistry for resolving field types
+        strategy: Encoding strategy, to lay out memcpy-decoded composites
+            (None = no wire-layout composites)
+        max_workers: Worker processes (1 = generate in-process, None = one per CPU)
+        executor: Running pool to submit to instead (its workers must have
+            populated the Type enum); max_workers is then ignored
+
+    Returns:
+        Dict mapping composite struct name to its C++ header code, sorted by name
+
+    Raises:
+        ValueError: If two composites share a struct name but not their members
+    """
+    composites: dict[str, list[CompositeField]] = {}
+    for message in messages:
+        collect_composite_fields(message.fields, composites)
+    jobs = [
+        (struct_name, composites[struct_name], type_registry, strategy)
+        for struct_name in sorted(composites)
+    ]
+
+    pool: AbstractContextManager[Executor]
+    if executor is None:
+        if max_workers == 1 or len(jobs) < 2:
+            return {job[0]: _render_composite_hpp(*job) for job in jobs}
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=populate_type_names,
+            initargs=(list(type_registry.types.keys()),),
+        )
+    else:
+        pool = nullcontext(executor)
+
+    with pool as workers:
+        futures = {job[0]: workers.submit(_render_composite_hpp, *job) for job in jobs}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _render_composite_hpp(
+    struct_name: str,
+    uses: list[CompositeField],
+    type_registry: TypeRegistry,
+    strategy: EncodingStrategy | None,
+) -> str:
+    """Render the header of one composite struct, checking all its uses agree."""
+    code = generate_composite_hpp(uses[0], type_registry, strategy)
+    for other in uses[1:]:
+        if generate_composite_hpp(other, type_registry, strategy) != code:
+            raise ValueError(
+                f"Composite struct '{struct_name}' is defined with different fields "
+                "(composite field names must map to one C++ struct)"
+            )
+    return code
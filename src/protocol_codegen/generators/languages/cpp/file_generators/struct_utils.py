@@ -10,7 +10,9 @@ and PayloadCalculator strategy differ.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections import deque
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from protocol_codegen.core.field import CompositeField, EnumField, FieldBase, PrimitiveField
 from protocol_codegen.generators.core.naming import field_to_pascal_case
@@ -23,74 +25,74 @@ from protocol_codegen.generators.languages.cpp.file_generators.codec_utils impor
 from protocol_codegen.generators.protocols import EncodingStrategy
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
+    from protocol_codegen.core.enum_def import EnumDef
     from protocol_codegen.core.loader import TypeRegistry
 
 
 def analyze_includes_needed(
-    fields: Sequence[FieldBase], type_registry: TypeRegistry
-) -> tuple[bool, bool, bool, set[str]]:
+    fields: Sequence[FieldBase], type_registry: TypeRegistry, nested: bool = True
+) -> tuple[bool, bool]:
     """
-    Analyze fields to determine which standard includes are needed.
+    Analyze fields to determine which container includes are needed.
+
+    String and enum includes come from the message's cached summary
+    (Message.has_string_field / Message.enum_defs) instead.
+
+    Args:
+        fields: Fields to scan
+        type_registry: TypeRegistry for resolving field types
+        nested: Also scan the members of composite fields
 
     Returns:
-        Tuple of (needs_array, needs_string, needs_vector, enum_names)
+        Tuple of (needs_array, needs_vector)
     """
     needs_array = False
-    needs_string = False
     needs_vector = False
-    enum_names: set[str] = set()
-
-    def check_field(field: FieldBase) -> None:
-        nonlocal needs_array, needs_string, needs_vector
-
-        if isinstance(field, EnumField):
-            enum_names.add(field.enum_def.name)
-            if field.array:
-                needs_array = True
-        elif isinstance(field, PrimitiveField):
-            if field.type_name.value == "string":
-                needs_string = True
-            if field.array:
-                if field.dynamic:
-                    needs_vector = True
-                else:
-                    needs_array = True
-        elif isinstance(field, CompositeField):
-            if field.array:
-                needs_array = True
-            for nested in field.fields:
-                check_field(nested)
 
-    for field in fields:
-        check_field(field)
+    stack = list(fields)
+    while stack:
+        field = stack.pop()
+        if isinstance(field, PrimitiveField) and field.dynamic:
+            needs_vector = True
+        elif field.array:
+            needs_array = True
+        if nested and isinstance(field, CompositeField):
+            stack.extend(field.fields)
 
-    return needs_array, needs_string, needs_vector, enum_names
+    return needs_array, needs_vector
 
 
 def generate_header(
+    lines: list[str],
     struct_name: str,
     description: str,
     fields: Sequence[FieldBase],
     type_registry: TypeRegistry,
     encoding_description: str,
-) -> str:
+    enum_defs: Sequence[EnumDef],
+    needs_string: bool,
+    name_only: bool = False,
+) -> None:
     """
-    Generate file header with conditional includes based on field analysis.
+    Append the file header, with conditional includes based on field analysis.
 
     Args:
+        lines: Output lines of the whole header file
         struct_name: Name of the struct (e.g., "TransportPlayMessage")
         description: Description for the header comment
         fields: Message fields
         type_registry: TypeRegistry for resolving field types
         encoding_description: Encoding description for comment (e.g., "8-bit binary (Binary)")
+        enum_defs: Enums used by the message, nested composites included
+        needs_string: Whether any field (nested included) is a string
+        name_only: Whether the struct derives from detail::NameOnlyMessage
     """
-    needs_array, needs_string, needs_vector, enum_names = analyze_includes_needed(
-        fields, type_registry
-    )
+    needs_array, needs_vector = analyze_includes_needed(fields, type_registry)
+    enum_names = {enum_def.name for enum_def in enum_defs}
 
-    # Build conditional includes - always include <cstring> for strlen(MESSAGE_NAME)
+    # Build conditional includes - always include <cstring> for std::memcpy(MESSAGE_NAME)
     std_includes = ["#include <cstdint>", "#include <cstring>", "#include <optional>"]
     if needs_array:
         std_includes.insert(0, "#include <array>")
@@ -106,8 +108,13 @@ def generate_header(
     if enum_names:
         enum_include_lines = [f'#include "../{name}.hpp"' for name in sorted(enum_names)]
         enum_includes = "\n" + "\n".join(enum_include_lines)
+    if name_only:
+        enum_includes = '\n#include "../MessageBase.hpp"' + enum_includes
+    composite_include_lines = composite_includes(fields)
+    if composite_include_lines:
+        enum_includes += "\n" + "\n".join(composite_include_lines)
 
-    return f"""/**
+    lines.append(f"""/**
  * {struct_name}.hpp - Auto-generated Protocol Struct
  *
  * AUTO-GENERATED - DO NOT EDIT
@@ -117,7 +124,7 @@ def generate_header(
  *
  * This struct uses encode/decode functions from Protocol namespace.
  * All encoding is {encoding_description}. Performance is identical to inline
- * code due to static inline + compiler optimization.
+ * code: encode()/decode() are forced inline (PROTOCOL_FORCE_INLINE).
  */
 
 #pragma once
@@ -130,10 +137,11 @@ def generate_header(
 
 namespace Protocol {{
 
-"""
+""")
 
 
 def generate_struct_definition(
+    lines: list[str],
     struct_name: str,
     message_name: str,
     pascal_name: str,
@@ -141,9 +149,18 @@ def generate_struct_definition(
     fields: Sequence[FieldBase],
     type_registry: TypeRegistry,
     include_message_name: bool = True,
-) -> str:
-    """Generate struct definition with fields (supports composites)."""
-    lines = [f"struct {struct_name} {{"]
+    strategy: EncodingStrategy | None = None,
+) -> None:
+    """
+    Append struct definition with fields (supports composites).
+
+    Fieldless messages with a MESSAGE_NAME prefix derive their encode()/decode()
+    from detail::NameOnlyMessage (MessageBase.hpp) instead of repeating them.
+    """
+    if include_message_name and not fields:
+        lines.append(f"struct {struct_name} : detail::NameOnlyMessage<{struct_name}> {{")
+    else:
+        lines.append(f"struct {struct_name} {{")
 
     # Add static MESSAGE_ID constant
     lines.append("    // Auto-detected MessageID for protocol.send()")
@@ -154,18 +171,548 @@ def generate_struct_definition(
     if include_message_name:
         lines.append("    // Message name for logging (encoded in payload)")
         lines.append(f'    static constexpr const char* MESSAGE_NAME = "{pascal_name}";')
+        lines.append(f"    static constexpr uint8_t MESSAGE_NAME_LEN = {len(pascal_name)};")
         lines.append("")
 
     # Add fields
     for field in fields:
-        cpp_type = get_cpp_type_for_field(field, type_registry)
-        lines.append(f"    {cpp_type} {field.name};")
+        lines.append(f"    {member_declaration(field, type_registry, strategy)}")
 
     lines.append("")
-    return "\n".join(lines)
+
+
+# ============================================================================
+# ENCODE/DECODE BOILERPLATE
+# ============================================================================
+# Invariant blocks are parsed once at import; per-message values go through
+# str.format() (*_TEMPLATE only, literal C++ braces doubled). Each block is
+# one element of the caller's "\n".join(lines), so its trailing newline
+# becomes the blank separator line.
+
+_PAYLOAD_SIZE_TEMPLATE = """    /**
+     * Maximum payload size in bytes ({encoding_description} encoded)
+     */
+    static constexpr uint16_t MAX_PAYLOAD_SIZE = {max_size};
+
+    /**
+     * Minimum payload size in bytes (with empty strings)
+     */
+    static constexpr uint16_t MIN_PAYLOAD_SIZE = {min_size};
+
+    /**
+     * True when every encoding has the same size (MIN == MAX)
+     */
+    static constexpr bool FIXED_SIZE = MIN_PAYLOAD_SIZE == MAX_PAYLOAD_SIZE;
+"""
+
+_ENCODE_NAME_PREFIX = """        // Encode message name (length-prefixed string for bridge logging)
+        Encoder::encodeUint8(ptr, MESSAGE_NAME_LEN);
+        std::memcpy(ptr, MESSAGE_NAME, MESSAGE_NAME_LEN);
+        ptr += MESSAGE_NAME_LEN;
+"""
+
+_ENCODE_PROLOGUE = """    /**
+     * Encode struct to MIDI-safe bytes
+     *
+     * @param buffer Output buffer (must have >= MAX_PAYLOAD_SIZE bytes)
+     * @param bufferSize Size of output buffer
+     * @return Number of bytes written, or 0 if buffer too small
+     */
+    PROTOCOL_FORCE_INLINE uint16_t encode(uint8_t* buffer, uint16_t bufferSize) const {
+        if (bufferSize < MAX_PAYLOAD_SIZE) return 0;
+
+        uint8_t* ptr = buffer;
+"""
+
+_NAME_ONLY_CODEC_NOTE = """    // encode()/decode() inherited from detail::NameOnlyMessage (MessageBase.hpp)
+"""
+
+_ENCODE_EMPTY = """    /**
+     * Encode struct to MIDI-safe bytes (empty message)
+     * @return Always 0 (no payload)
+     */
+    PROTOCOL_FORCE_INLINE uint16_t encode(uint8_t*, uint16_t) const { return 0; }
+"""
+
+_ENCODE_FIXED_SIZE = """    /**
+     * Encode a fixed-size struct (FIXED_SIZE) without a runtime size check
+     *
+     * @param buffer Output buffer (must have >= MAX_PAYLOAD_SIZE bytes)
+     * @return Number of bytes written (MAX_PAYLOAD_SIZE)
+     */
+    PROTOCOL_FORCE_INLINE uint16_t encode(uint8_t* buffer) const noexcept {
+        return encode(buffer, MAX_PAYLOAD_SIZE);
+    }
+"""
+
+_DECODE_PROLOGUE_TEMPLATE = """    /**
+     * Decode struct from MIDI-safe bytes
+     *
+     * @param data Input buffer with encoded data
+     * @param len Length of input buffer
+     * @return Decoded struct, or std::nullopt if invalid/insufficient data
+     */
+    [[nodiscard]] PROTOCOL_FORCE_INLINE static std::optional<{struct_name}> decode(
+        const uint8_t* data, uint16_t len) {{
+
+        if (len < MIN_PAYLOAD_SIZE) return std::nullopt;
+
+        const uint8_t* ptr = data;
+        size_t remaining = len;
+"""
+
+_DECODE_NAME_SKIP = """        // Skip MESSAGE_NAME prefix
+        uint8_t nameLen;
+        if (!Decoder::decodeUint8(ptr, remaining, nameLen)) return std::nullopt;
+        ptr += nameLen;
+        remaining -= nameLen;
+"""
+
+_DECODE_EMPTY_TEMPLATE = """    /**
+     * Decode struct from MIDI-safe bytes (empty message)
+     * @return Always returns empty struct
+     */
+    [[nodiscard]] PROTOCOL_FORCE_INLINE static std::optional<{struct_name}> decode(
+        const uint8_t*, uint16_t) {{
+        return {struct_name}{{}};
+    }}
+"""
+
+
+# ============================================================================
+# FIELD EMITTERS
+# ============================================================================
+# Per-field encode/decode lines, dispatched on the exact field class (field
+# classes are final dataclasses, exact lookup is safe). Nested composite
+# members reuse the same emitters with their own access path and indent.
+
+
+def _emit_enum_encode(
+    field: EnumField,
+    value: str,
+    indent: str,
+    loop_var: str,
+    type_registry: TypeRegistry,
+    lines: list[str],
+) -> None:
+    """Append encode lines for an enum value (or count-prefixed enum array)."""
+    if field.is_array():
+        lines.append(f"{indent}Encoder::encodeUint8(ptr, {value}.size());")
+        lines.append(f"{indent}for (const auto& {loop_var} : {value}) {{")
+        lines.append(f"{indent}    Encoder::encodeUint8(ptr, static_cast<uint8_t>({loop_var}));")
+        lines.append(f"{indent}}}")
+    else:
+        lines.append(f"{indent}Encoder::encodeUint8(ptr, static_cast<uint8_t>({value}));")
+
+
+def _emit_primitive_encode(
+    field: PrimitiveField,
+    value: str,
+    indent: str,
+    loop_var: str,
+    type_registry: TypeRegistry,
+    lines: list[str],
+) -> None:
+    """Append encode lines for a primitive value (or count-prefixed array)."""
+    field_type_name = field.type_name.value
+    if field.is_array():
+        lines.append(f"{indent}Encoder::encodeUint8(ptr, {value}.size());")
+        lines.append(f"{indent}for (const auto& {loop_var} : {value}) {{")
+        lines.append(f"{indent}    {get_encoder_call(loop_var, field_type_name, type_registry)}")
+        lines.append(f"{indent}}}")
+    else:
+        lines.append(f"{indent}{get_encoder_call(value, field_type_name, type_registry)}")
+
+
+def _emit_composite_encode(
+    field: CompositeField,
+    value: str,
+    indent: str,
+    loop_var: str,
+    type_registry: TypeRegistry,
+    lines: list[str],
+) -> None:
+    """Append encode lines for a composite (members inline, arrays item by item)."""
+    if field.array:
+        lines.append(f"{indent}Encoder::encodeUint8(ptr, {value}.size());")
+        lines.append(f"{indent}for (const auto& {loop_var} : {value}) {{")
+        _emit_nested_encodes(field, loop_var, f"{indent}    ", type_registry, lines)
+        lines.append(f"{indent}}}")
+    else:
+        _emit_nested_encodes(field, value, indent, type_registry, lines)
+
+
+def _emit_nested_encodes(
+    field: CompositeField,
+    owner: str,
+    indent: str,
+    type_registry: TypeRegistry,
+    lines: list[str],
+) -> None:
+    """Append encode lines for every enum/primitive member of a composite."""
+    for nested_field in field.fields:
+        entry = _NESTED_ENCODERS.get(type(nested_field))
+        if entry is not None:
+            emit, loop_var = entry
+            emit(
+                nested_field, f"{owner}.{nested_field.name}", indent, loop_var, type_registry, lines
+            )
+
+
+# Multi-line per-field blocks are single f-strings appended once: cheaper
+# than str.format() templates with keyword arguments on these hot paths.
+
+
+def _count_loop(indent: str, field: FieldBase, i: str) -> str:
+    """Count prefix of an array field, then the bounded loop over its items."""
+    name = field.name
+    size = field.array
+    assert size is not None
+    return (
+        f"{indent}uint8_t count_{name};\n"
+        f"{indent}if (!Decoder::decodeUint8(ptr, remaining, count_{name})) return std::nullopt;\n"
+        f"{indent}for (uint8_t {i} = 0; {i} < count_{name} && {i} < {size}; ++{i}) {{"
+    )
+
+
+def _enum_cast_decode(
+    indent: str, raw: str, target: str, cpp_type: str, check_bounds: bool = True
+) -> str:
+    """Decode a non-uint8_t enum through a uint8_t temporary, then cast into target."""
+    decode = f"Decoder::decodeUint8(ptr, remaining, {raw})"
+    if check_bounds:
+        decode = f"if (!{decode}) return std::nullopt"
+    return (
+        f"{indent}uint8_t {raw};\n"
+        f"{indent}{decode};\n"
+        f"{indent}{target} = static_cast<{cpp_type}>({raw});"
+    )
+
+
+def _emit_enum_decode(field: EnumField, type_registry: TypeRegistry, lines: list[str]) -> str:
+    """Append decode lines for a top-level enum field, return its local variable."""
+    name = field.name
+    cpp_type = field.enum_def.cpp_type
+    is_uint8 = cpp_type == "uint8_t"
+    if field.is_array():
+        var_name = f"{name}_data"
+        array_type = get_cpp_type_for_field(field, type_registry)
+        lines.append(f"        {array_type} {var_name};")
+        lines.append(_count_loop("        ", field, "i"))
+        if is_uint8:
+            # Decode directly into array element (no cast needed for uint8_t)
+            lines.append(
+                f"            if (!Decoder::decodeUint8(ptr, remaining, {var_name}[i])) return std::nullopt;"
+            )
+        else:
+            lines.append(_enum_cast_decode("            ", "temp_raw", f"{var_name}[i]", cpp_type))
+        lines.append("        }")
+        return var_name
+
+    if is_uint8:
+        # Decode directly into final variable (no cast needed for uint8_t)
+        lines.append(f"        uint8_t {name};")
+        lines.append(
+            f"        if (!Decoder::decodeUint8(ptr, remaining, {name})) return std::nullopt;"
+        )
+    else:
+        lines.append(_enum_cast_decode("        ", f"{name}_raw", f"{cpp_type} {name}", cpp_type))
+    return name
+
+
+def _emit_primitive_decode(
+    field: PrimitiveField, type_registry: TypeRegistry, lines: list[str]
+) -> str:
+    """Append decode lines for a top-level primitive field, return its local variable."""
+    name = field.name
+    field_type_name = field.type_name.value
+    if not field.is_array():
+        lines.append(f"        {get_decoder_call(name, field_type_name, type_registry)}")
+        return name
+
+    cpp_type = get_cpp_type_for_field(field, type_registry)
+    var_name = f"{name}_data"
+    lines.append(f"        {cpp_type} {var_name};")
+
+    # Always read count from message (consistent with encoder)
+    lines.append(_count_loop("        ", field, "i"))
+    if field.dynamic:
+        base_cpp_type = get_cpp_type(field_type_name, type_registry)
+        lines.append(f"            {base_cpp_type} temp_item;")
+        decoder_call = get_decoder_call(
+            "temp_item", field_type_name, type_registry, direct_target="temp_item"
+        )
+        lines.append(f"            {decoder_call}")
+        lines.append(f"            {var_name}.push_back(temp_item);")
+    else:
+        decoder_call = get_decoder_call(
+            "temp_item", field_type_name, type_registry, direct_target=f"{var_name}[i]"
+        )
+        lines.append(f"            {decoder_call}")
+    lines.append("        }")
+    return var_name
+
+
+# uint8/int8 arrays whose wire bytes equal their memory bytes when the
+# strategy has raw_byte_arrays: one memcpy instead of a per-item loop
+_RAW_BYTE_TYPES = frozenset({"uint8", "int8"})
+
+
+def _byte_array_encode(name: str) -> str:
+    """Encode a raw byte array as its count, then one memcpy of the items."""
+    return (
+        f"        Encoder::encodeUint8(ptr, {name}.size());\n"
+        f"        std::memcpy(ptr, {name}.data(), {name}.size());\n"
+        f"        ptr += {name}.size();"
+    )
+
+
+def _is_byte_array(field: FieldBase) -> bool:
+    """Check if a field is a uint8/int8 primitive array (fixed or dynamic)."""
+    return (
+        isinstance(field, PrimitiveField)
+        and field.array is not None
+        and field.type_name.value in _RAW_BYTE_TYPES
+    )
+
+
+def _emit_byte_array_decode(
+    field: PrimitiveField, type_registry: TypeRegistry, lines: list[str]
+) -> str:
+    """Append bulk-copy decode lines for a raw byte array, return its local variable."""
+    name = field.name
+    var_name = f"{name}_data"
+    lines.append(f"        {get_cpp_type_for_field(field, type_registry)} {var_name};")
+    lines.append(f"        uint8_t count_{name};")
+    lines.append(
+        f"        if (!Decoder::decodeUint8(ptr, remaining, count_{name})) return std::nullopt;"
+    )
+    lines.append(
+        f"        const size_t len_{name} = count_{name} < {field.array} ? count_{name} : {field.array};"
+    )
+    lines.append(f"        if (remaining < len_{name}) return std::nullopt;")
+    if field.dynamic:
+        lines.append(f"        {var_name}.assign(ptr, ptr + len_{name});")
+    else:
+        lines.append(f"        std::memcpy({var_name}.data(), ptr, len_{name});")
+    lines.append(f"        ptr += len_{name};")
+    lines.append(f"        remaining -= len_{name};")
+    return var_name
+
+
+def _emit_wire_layout_decode(
+    field: CompositeField, type_registry: TypeRegistry, lines: list[str]
+) -> str:
+    """Append one-memcpy decode lines for a wire-layout composite (or array of them)."""
+    name = field.name
+    var_name = f"{name}_data"
+    lines.append(f"        {get_cpp_type_for_field(field, type_registry)} {var_name};")
+    if not field.array:
+        lines.append(
+            f"        if (remaining < sizeof({var_name})) return std::nullopt;\n"
+            f"        std::memcpy(&{var_name}, ptr, sizeof({var_name}));\n"
+            f"        ptr += sizeof({var_name});\n"
+            f"        remaining -= sizeof({var_name});"
+        )
+        return var_name
+
+    struct_name = field_to_pascal_case(name)
+    lines.append(f"        uint8_t count_{name};")
+    lines.append(
+        f"        if (!Decoder::decodeUint8(ptr, remaining, count_{name})) return std::nullopt;"
+    )
+    lines.append(
+        f"        const size_t len_{name} = "
+        f"(count_{name} < {field.array} ? count_{name} : {field.array}) * sizeof({struct_name});"
+    )
+    lines.append(f"        if (remaining < len_{name}) return std::nullopt;")
+    lines.append(f"        std::memcpy({var_name}.data(), ptr, len_{name});")
+    lines.append(f"        ptr += len_{name};")
+    lines.append(f"        remaining -= len_{name};")
+    return var_name
+
+
+def _emit_composite_decode(
+    field: CompositeField,
+    type_registry: TypeRegistry,
+    lines: list[str],
+    fixed_size: bool = False,
+) -> str:
+    """
+    Append decode lines for a top-level composite field, return its local variable.
+
+    A fixed_size composite (fixed_wire_size, WIRE_SIZE declared) is bounds
+    checked once per value; its member decodes then cannot fail.
+    """
+    name = field.name
+    var_name = f"{name}_data"
+    struct_name = field_to_pascal_case(name)
+    if not field.array:
+        lines.append(f"        {struct_name} {var_name};")
+        if fixed_size:
+            lines.append(_wire_size_check("        ", struct_name))
+        _emit_nested_decodes(
+            field, var_name, name, "        ", type_registry, lines, check_bounds=not fixed_size
+        )
+        return var_name
+
+    lines.append(f"        uint8_t count_{name};")
+    lines.append(
+        f"        if (!Decoder::decodeUint8(ptr, remaining, count_{name})) return std::nullopt;"
+    )
+    cpp_type = get_cpp_type_for_field(field, type_registry)
+    lines.append(f"        {cpp_type} {var_name};")
+    lines.append(f"        for (uint8_t i = 0; i < count_{name} && i < {field.array}; ++i) {{")
+    if fixed_size:
+        lines.append(_wire_size_check("            ", struct_name))
+    # Decode straight into the array slot: no per-element temporary to copy
+    _emit_nested_decodes(
+        field,
+        f"{var_name}[i]",
+        "item",
+        "            ",
+        type_registry,
+        lines,
+        check_bounds=not fixed_size,
+    )
+    lines.append("        }")
+    return var_name
+
+
+def _wire_size_check(indent: str, struct_name: str) -> str:
+    """Single bounds check covering every member decode of a fixed-size composite."""
+    return (
+        f"{indent}// Fixed size: one bounds check, the member decodes below cannot fail\n"
+        f"{indent}if (remaining < {struct_name}::WIRE_SIZE) return std::nullopt;"
+    )
+
+
+def _emit_nested_decodes(
+    field: CompositeField,
+    owner: str,
+    temp_prefix: str,
+    indent: str,
+    type_registry: TypeRegistry,
+    lines: list[str],
+    check_bounds: bool = True,
+) -> None:
+    """Append decode lines for every enum/primitive member of a composite."""
+    for nested_field in field.fields:
+        emit = _NESTED_DECODERS.get(type(nested_field))
+        if emit is not None:
+            emit(nested_field, owner, temp_prefix, indent, type_registry, lines, check_bounds)
+
+
+def _emit_nested_enum_decode(
+    field: EnumField,
+    owner: str,
+    temp_prefix: str,
+    indent: str,
+    type_registry: TypeRegistry,
+    lines: list[str],
+    check_bounds: bool = True,
+) -> None:
+    """Append decode lines for an enum member, stored into owner.<member>."""
+    name = field.name
+    cpp_type = field.enum_def.cpp_type
+    is_uint8 = cpp_type == "uint8_t"
+    target = f"{owner}.{name}"
+    if field.is_array():
+        lines.append(_count_loop(indent, field, "j"))
+        if is_uint8:
+            lines.append(
+                f"{indent}    if (!Decoder::decodeUint8(ptr, remaining, {target}[j])) return std::nullopt;"
+            )
+        else:
+            lines.append(_enum_cast_decode(f"{indent}    ", "temp_raw", f"{target}[j]", cpp_type))
+        lines.append(f"{indent}}}")
+    elif is_uint8:
+        decode = f"Decoder::decodeUint8(ptr, remaining, {target})"
+        if check_bounds:
+            decode = f"if (!{decode}) return std::nullopt"
+        lines.append(f"{indent}{decode};")
+    else:
+        lines.append(_enum_cast_decode(indent, f"{name}_raw", target, cpp_type, check_bounds))
+
+
+def _emit_nested_primitive_decode(
+    field: PrimitiveField,
+    owner: str,
+    temp_prefix: str,
+    indent: str,
+    type_registry: TypeRegistry,
+    lines: list[str],
+    check_bounds: bool = True,
+) -> None:
+    """Append decode lines for a primitive member, stored into owner.<member>."""
+    name = field.name
+    field_type_name = field.type_name.value
+    target = f"{owner}.{name}"
+    if not field.is_array():
+        decoder_call = get_decoder_call(
+            f"{temp_prefix}_{name}",
+            field_type_name,
+            type_registry,
+            direct_target=target,
+            check_bounds=check_bounds,
+        )
+        lines.append(f"{indent}{decoder_call}")
+        return
+
+    lines.append(_count_loop(indent, field, "j"))
+    if field.dynamic:
+        temp = f"temp_{name}"
+        lines.append(f"{indent}    {get_cpp_type(field_type_name, type_registry)} {temp};")
+        decoder_call = get_decoder_call(temp, field_type_name, type_registry, direct_target=temp)
+        lines.append(f"{indent}    {decoder_call}")
+        lines.append(f"{indent}    {target}.push_back({temp});")
+    else:
+        decoder_call = get_decoder_call(
+            f"{temp_prefix}_{name}_j",
+            field_type_name,
+            type_registry,
+            direct_target=f"{target}[j]",
+        )
+        lines.append(f"{indent}    {decoder_call}")
+    lines.append(f"{indent}}}")
+
+
+# Field class -> encode emitter (field, value expr, indent, loop var, registry, lines)
+_FIELD_ENCODERS: dict[
+    type[FieldBase], Callable[[Any, str, str, str, TypeRegistry, list[str]], None]
+] = {
+    EnumField: _emit_enum_encode,
+    PrimitiveField: _emit_primitive_encode,
+    CompositeField: _emit_composite_encode,
+}
+
+# Composite member class -> (encode emitter, array loop variable)
+_NESTED_ENCODERS: dict[
+    type[FieldBase], tuple[Callable[[Any, str, str, str, TypeRegistry, list[str]], None], str]
+] = {
+    EnumField: (_emit_enum_encode, "e"),
+    PrimitiveField: (_emit_primitive_encode, "type"),
+}
+
+# Field class -> decode emitter returning the local variable passed to the constructor
+_FIELD_DECODERS: dict[type[FieldBase], Callable[[Any, TypeRegistry, list[str]], str]] = {
+    EnumField: _emit_enum_decode,
+    PrimitiveField: _emit_primitive_decode,
+    CompositeField: _emit_composite_decode,
+}
+
+# Composite member class -> decode emitter
+# (member, owner, temp prefix, indent, registry, lines, check bounds)
+_NESTED_DECODERS: dict[
+    type[FieldBase], Callable[[Any, str, str, str, TypeRegistry, list[str], bool], None]
+] = {
+    EnumField: _emit_nested_enum_decode,
+    PrimitiveField: _emit_nested_primitive_decode,
+}
 
 
 def generate_encode_function(
+    lines: list[str],
     struct_name: str,
     pascal_name: str,
     fields: Sequence[FieldBase],
@@ -174,11 +721,12 @@ def generate_encode_function(
     strategy: EncodingStrategy,
     encoding_description: str,
     include_message_name: bool = True,
-) -> str:
+) -> None:
     """
-    Generate encode() function calling Encoder.
+    Append encode() function calling Encoder.
 
     Args:
+        lines: Output lines of the whole header file
         struct_name: Name of the struct
         pascal_name: PascalCase name for MESSAGE_NAME encoding
         fields: Message fields
@@ -188,585 +736,527 @@ def generate_encode_function(
         encoding_description: Encoding description for comments (e.g., "8-bit", "7-bit")
         include_message_name: Whether to include MESSAGE_NAME in payload
     """
-    # Calculate max and min payload sizes using PayloadCalculator
+    # Calculate min and max payload sizes using PayloadCalculator (one walk)
     name_prefix_size = (1 + len(pascal_name)) if include_message_name else 0
     calculator = PayloadCalculator(strategy, type_registry)
-    max_size = calculator.calculate_max_payload_size(fields, string_max_length, name_prefix_size)
-    min_size = calculator.calculate_min_payload_size(fields, string_max_length, name_prefix_size)
-
-    lines = [
-        "    /**",
-        f"     * Maximum payload size in bytes ({encoding_description} encoded)",
-        "     */",
-        f"    static constexpr uint16_t MAX_PAYLOAD_SIZE = {max_size};",
-        "",
-        "    /**",
-        "     * Minimum payload size in bytes (with empty strings)",
-        "     */",
-        f"    static constexpr uint16_t MIN_PAYLOAD_SIZE = {min_size};",
-        "",
-    ]
+    min_size, max_size = calculator.calculate_payload_size_bounds(
+        fields, string_max_length, name_prefix_size
+    )
 
-    # Encode for empty messages
+    lines.append(
+        _PAYLOAD_SIZE_TEMPLATE.format(
+            encoding_description=encoding_description, max_size=max_size, min_size=min_size
+        )
+    )
+
+    # Encode for empty messages (the shared name-only codec has its own overload)
     if not fields:
         if include_message_name:
-            lines.extend(
-                [
-                    "    /**",
-                    "     * Encode struct to MIDI-safe bytes (message name only, no fields)",
-                    "     *",
-                    "     * @param buffer Output buffer (must have >= MAX_PAYLOAD_SIZE bytes)",
-                    "     * @param bufferSize Size of output buffer",
-                    "     * @return Number of bytes written, or 0 if buffer too small",
-                    "     */",
-                    "    uint16_t encode(uint8_t* buffer, uint16_t bufferSize) const {",
-                    "        if (bufferSize < MAX_PAYLOAD_SIZE) return 0;",
-                    "",
-                    "        uint8_t* ptr = buffer;",
-                    "",
-                    "        // Encode message name (length-prefixed string for bridge logging)",
-                    "        Encoder::encodeUint8(ptr, static_cast<uint8_t>(strlen(MESSAGE_NAME)));",
-                    "        for (size_t i = 0; i < strlen(MESSAGE_NAME); ++i) {",
-                    "            *ptr++ = static_cast<uint8_t>(MESSAGE_NAME[i]);",
-                    "        }",
-                    "",
-                    "        return ptr - buffer;",
-                    "    }",
-                    "",
-                ]
-            )
-        else:
-            lines.extend(
-                [
-                    "    /**",
-                    "     * Encode struct to MIDI-safe bytes (empty message)",
-                    "     * @return Always 0 (no payload)",
-                    "     */",
-                    "    uint16_t encode(uint8_t*, uint16_t) const { return 0; }",
-                    "",
-                ]
-            )
-        return "\n".join(lines)
-
-    # Standard encode for messages with fields
-    lines.extend(
-        [
-            "    /**",
-            "     * Encode struct to MIDI-safe bytes",
-            "     *",
-            "     * @param buffer Output buffer (must have >= MAX_PAYLOAD_SIZE bytes)",
-            "     * @param bufferSize Size of output buffer",
-            "     * @return Number of bytes written, or 0 if buffer too small",
-            "     */",
-            "    uint16_t encode(uint8_t* buffer, uint16_t bufferSize) const {",
-            "        if (bufferSize < MAX_PAYLOAD_SIZE) return 0;",
-            "",
-            "        uint8_t* ptr = buffer;",
-            "",
-        ]
-    )
+            lines.append(_NAME_ONLY_CODEC_NOTE)
+            return
+        lines.append(_ENCODE_EMPTY)
+    else:
+        _emit_encode_body(
+            lines, fields, type_registry, include_message_name, strategy.raw_byte_arrays
+        )
+
+    # Fixed-size messages: the size check folds away when bufferSize is MAX_PAYLOAD_SIZE
+    if min_size == max_size:
+        lines.append(_ENCODE_FIXED_SIZE)
+
+
+def _emit_encode_body(
+    lines: list[str],
+    fields: Sequence[FieldBase],
+    type_registry: TypeRegistry,
+    include_message_name: bool,
+    raw_byte_arrays: bool,
+) -> None:
+    """Append the encode() function of a message with fields."""
+    lines.append(_ENCODE_PROLOGUE)
 
     # Conditionally encode MESSAGE_NAME
     if include_message_name:
-        lines.extend(
-            [
-                "        // Encode message name (length-prefixed string for bridge logging)",
-                "        Encoder::encodeUint8(ptr, static_cast<uint8_t>(strlen(MESSAGE_NAME)));",
-                "        for (size_t i = 0; i < strlen(MESSAGE_NAME); ++i) {",
-                "            *ptr++ = static_cast<uint8_t>(MESSAGE_NAME[i]);",
-                "        }",
-                "",
-            ]
-        )
+        lines.append(_ENCODE_NAME_PREFIX)
 
     # Add encode calls for each field
     for field in fields:
-        if isinstance(field, EnumField):
-            if field.is_array():
-                lines.append(f"        Encoder::encodeUint8(ptr, {field.name}.size());")
-                lines.append(f"        for (const auto& item : {field.name}) {{")
-                lines.append("            Encoder::encodeUint8(ptr, static_cast<uint8_t>(item));")
-                lines.append("        }")
-            else:
-                lines.append(
-                    f"        Encoder::encodeUint8(ptr, static_cast<uint8_t>({field.name}));"
-                )
-        elif isinstance(field, PrimitiveField):
-            field_type_name = field.type_name.value
-            if field.is_array():
-                lines.append(f"        Encoder::encodeUint8(ptr, {field.name}.size());")
-                lines.append(f"        for (const auto& item : {field.name}) {{")
-                encoder_call = get_encoder_call("item", field_type_name, type_registry)
-                lines.append(f"            {encoder_call}")
-                lines.append("        }")
-            else:
-                encoder_call = get_encoder_call(field.name, field_type_name, type_registry)
-                lines.append(f"        {encoder_call}")
-        elif isinstance(field, CompositeField):
-            if field.array:
-                lines.append(f"        Encoder::encodeUint8(ptr, {field.name}.size());")
-                lines.append(f"        for (const auto& item : {field.name}) {{")
-                for nested_field in field.fields:
-                    if isinstance(nested_field, EnumField):
-                        if nested_field.is_array():
-                            lines.append(
-                                f"            Encoder::encodeUint8(ptr, item.{nested_field.name}.size());"
-                            )
-                            lines.append(
-                                f"            for (const auto& e : item.{nested_field.name}) {{"
-                            )
-                            lines.append(
-                                "                Encoder::encodeUint8(ptr, static_cast<uint8_t>(e));"
-                            )
-                            lines.append("            }")
-                        else:
-                            lines.append(
-                                f"            Encoder::encodeUint8(ptr, static_cast<uint8_t>(item.{nested_field.name}));"
-                            )
-                    elif isinstance(nested_field, PrimitiveField):
-                        if nested_field.is_array():
-                            lines.append(
-                                f"            Encoder::encodeUint8(ptr, item.{nested_field.name}.size());"
-                            )
-                            lines.append(
-                                f"            for (const auto& type : item.{nested_field.name}) {{"
-                            )
-                            encoder_call = get_encoder_call(
-                                "type", nested_field.type_name.value, type_registry
-                            )
-                            lines.append(f"                {encoder_call}")
-                            lines.append("            }")
-                        else:
-                            encoder_call = get_encoder_call(
-                                f"item.{nested_field.name}",
-                                nested_field.type_name.value,
-                                type_registry,
-                            )
-                            lines.append(f"            {encoder_call}")
-                lines.append("        }")
-            else:
-                for nested_field in field.fields:
-                    if isinstance(nested_field, EnumField):
-                        lines.append(
-                            f"        Encoder::encodeUint8(ptr, static_cast<uint8_t>({field.name}.{nested_field.name}));"
-                        )
-                    elif isinstance(nested_field, PrimitiveField):
-                        encoder_call = get_encoder_call(
-                            f"{field.name}.{nested_field.name}",
-                            nested_field.type_name.value,
-                            type_registry,
-                        )
-                        lines.append(f"        {encoder_call}")
-
+        if raw_byte_arrays and _is_byte_array(field):
+            lines.append(_byte_array_encode(field.name))
+            continue
+        emit = _FIELD_ENCODERS.get(type(field))
+        if emit is not None:
+            emit(field, field.name, "        ", "item", type_registry, lines)
     lines.append("")
     lines.append("        return ptr - buffer;")
     lines.extend(["    }", ""])
 
-    return "\n".join(lines)
-
 
 def generate_decode_function(
+    lines: list[str],
     struct_name: str,
     fields: Sequence[FieldBase],
     type_registry: TypeRegistry,
     string_max_length: int,
     include_message_name: bool = True,
-) -> str:
+    strategy: EncodingStrategy | None = None,
+) -> None:
     """
-    Generate static decode() function calling Decoder.
+    Append static decode() function calling Decoder.
 
     Args:
+        lines: Output lines of the whole header file
         struct_name: Name of the struct
         fields: Message fields
         type_registry: TypeRegistry for resolving field types
         string_max_length: Maximum string length from config
         include_message_name: Whether MESSAGE_NAME is in payload
+        strategy: EncodingStrategy, to bulk-copy raw byte arrays and wire-layout
+            composites (None = member by member)
     """
-    # Decode for empty messages
+    # Decode for empty messages (name-only ones inherit decode(), see generate_encode_function)
     if not fields:
-        if include_message_name:
-            return f"""    /**
-     * Decode struct from MIDI-safe bytes (empty message with name prefix)
-     * @return Always returns empty struct after skipping name prefix
-     */
-    static std::optional<{struct_name}> decode(const uint8_t* data, uint16_t len) {{
-        if (len < MIN_PAYLOAD_SIZE) return std::nullopt;
-        const uint8_t* ptr = data;
-        size_t remaining = len;
-        // Skip MESSAGE_NAME prefix
-        uint8_t nameLen;
-        if (!Decoder::decodeUint8(ptr, remaining, nameLen)) return std::nullopt;
-        ptr += nameLen;
-        remaining -= nameLen;
-        return {struct_name}{{}};
-    }}
-"""
-        else:
-            return f"""    /**
-     * Decode struct from MIDI-safe bytes (empty message)
-     * @return Always returns empty struct
-     */
-    static std::optional<{struct_name}> decode(const uint8_t*, uint16_t) {{
-        return {struct_name}{{}};
-    }}
-"""
+        if not include_message_name:
+            lines.append(_DECODE_EMPTY_TEMPLATE.format(struct_name=struct_name))
+        return
 
     # Standard decode for messages with fields
-    lines = [
-        "    /**",
-        "     * Decode struct from MIDI-safe bytes",
-        "     *",
-        "     * @param data Input buffer with encoded data",
-        "     * @param len Length of input buffer",
-        "     * @return Decoded struct, or std::nullopt if invalid/insufficient data",
-        "     */",
-        f"    static std::optional<{struct_name}> decode(",
-        "        const uint8_t* data, uint16_t len) {",
-        "",
-        "        if (len < MIN_PAYLOAD_SIZE) return std::nullopt;",
-        "",
-        "        const uint8_t* ptr = data;",
-        "        size_t remaining = len;",
-        "",
-    ]
+    lines.append(_DECODE_PROLOGUE_TEMPLATE.format(struct_name=struct_name))
 
     # Conditionally skip MESSAGE_NAME prefix
     if include_message_name:
-        lines.extend(
-            [
-                "        // Skip MESSAGE_NAME prefix",
-                "        uint8_t nameLen;",
-                "        if (!Decoder::decodeUint8(ptr, remaining, nameLen)) return std::nullopt;",
-                "        ptr += nameLen;",
-                "        remaining -= nameLen;",
-                "",
-            ]
-        )
+        lines.append(_DECODE_NAME_SKIP)
 
     lines.append("        // Decode fields")
 
     # Add decode calls for each field
+    raw_byte_arrays = strategy is not None and strategy.raw_byte_arrays
     field_vars: list[str] = []
     for field in fields:
-        if isinstance(field, EnumField):
-            cpp_type = field.enum_def.cpp_type
-            is_uint8 = cpp_type == "uint8_t"
-            if field.is_array():
-                var_name = f"{field.name}_data"
-                array_type = get_cpp_type_for_field(field, type_registry)
-                lines.append(f"        {array_type} {var_name};")
-                lines.append(f"        uint8_t count_{field.name};")
-                lines.append(
-                    f"        if (!Decoder::decodeUint8(ptr, remaining, count_{field.name})) return std::nullopt;"
-                )
-                lines.append(
-                    f"        for (uint8_t i = 0; i < count_{field.name} && i < {field.array}; ++i) {{"
-                )
-                if is_uint8:
-                    # Decode directly into array element (no cast needed for uint8_t)
-                    lines.append(
-                        f"            if (!Decoder::decodeUint8(ptr, remaining, {var_name}[i])) return std::nullopt;"
-                    )
-                else:
-                    lines.append("            uint8_t temp_raw;")
-                    lines.append(
-                        "            if (!Decoder::decodeUint8(ptr, remaining, temp_raw)) return std::nullopt;"
-                    )
-                    lines.append(f"            {var_name}[i] = static_cast<{cpp_type}>(temp_raw);")
-                lines.append("        }")
-                field_vars.append(var_name)
-            else:
-                if is_uint8:
-                    # Decode directly into final variable (no cast needed for uint8_t)
-                    lines.append(f"        uint8_t {field.name};")
-                    lines.append(
-                        f"        if (!Decoder::decodeUint8(ptr, remaining, {field.name})) return std::nullopt;"
-                    )
-                else:
-                    lines.append(f"        uint8_t {field.name}_raw;")
-                    lines.append(
-                        f"        if (!Decoder::decodeUint8(ptr, remaining, {field.name}_raw)) return std::nullopt;"
-                    )
-                    lines.append(
-                        f"        {cpp_type} {field.name} = static_cast<{cpp_type}>({field.name}_raw);"
-                    )
-                field_vars.append(field.name)
-        elif isinstance(field, PrimitiveField):
-            field_type_name = field.type_name.value
-            if field.is_array():
-                cpp_type = get_cpp_type_for_field(field, type_registry)
-                var_name = f"{field.name}_data"
-                lines.append(f"        {cpp_type} {var_name};")
-
-                # Always read count from message (consistent with encoder)
-                lines.append(f"        uint8_t count_{field.name};")
-                lines.append(
-                    f"        if (!Decoder::decodeUint8(ptr, remaining, count_{field.name})) return std::nullopt;"
-                )
-                if field.dynamic:
-                    lines.append(
-                        f"        for (uint8_t i = 0; i < count_{field.name} && i < {field.array}; ++i) {{"
-                    )
-                    base_cpp_type = get_cpp_type(field_type_name, type_registry)
-                    lines.append(f"            {base_cpp_type} temp_item;")
-                    decoder_call = get_decoder_call(
-                        "temp_item", field_type_name, type_registry, direct_target="temp_item"
-                    )
-                    lines.append(f"            {decoder_call}")
-                    lines.append(f"            {var_name}.push_back(temp_item);")
-                    lines.append("        }")
-                else:
-                    lines.append(
-                        f"        for (uint8_t i = 0; i < count_{field.name} && i < {field.array}; ++i) {{"
-                    )
-                    decoder_call = get_decoder_call(
-                        "temp_item", field_type_name, type_registry, direct_target=f"{var_name}[i]"
-                    )
-                    lines.append(f"            {decoder_call}")
-                    lines.append("        }")
-
-                field_vars.append(var_name)
-            else:
-                decoder_call = get_decoder_call(field.name, field_type_name, type_registry)
-                lines.append(f"        {decoder_call}")
-                field_vars.append(field.name)
-        elif isinstance(field, CompositeField):
-            var_name = f"{field.name}_data"
-            if field.array:
-                lines.append(f"        uint8_t count_{field.name};")
-                lines.append(
-                    f"        if (!Decoder::decodeUint8(ptr, remaining, count_{field.name})) return std::nullopt;"
-                )
-                cpp_type = get_cpp_type_for_field(field, type_registry)
-                lines.append(f"        {cpp_type} {var_name};")
-                item_struct_name = field_to_pascal_case(field.name)
-                lines.append(
-                    f"        for (uint8_t i = 0; i < count_{field.name} && i < {field.array}; ++i) {{"
-                )
-                lines.append(f"            {item_struct_name} item;")
-                for nested_field in field.fields:
-                    if isinstance(nested_field, EnumField):
-                        nested_cpp_type = nested_field.enum_def.cpp_type
-                        nested_is_uint8 = nested_cpp_type == "uint8_t"
-                        if nested_field.is_array():
-                            lines.append(f"            uint8_t count_{nested_field.name};")
-                            lines.append(
-                                f"            if (!Decoder::decodeUint8(ptr, remaining, count_{nested_field.name})) return std::nullopt;"
-                            )
-                            lines.append(
-                                f"            for (uint8_t j = 0; j < count_{nested_field.name} && j < {nested_field.array}; ++j) {{"
-                            )
-                            if nested_is_uint8:
-                                lines.append(
-                                    f"                if (!Decoder::decodeUint8(ptr, remaining, item.{nested_field.name}[j])) return std::nullopt;"
-                                )
-                            else:
-                                lines.append("                uint8_t temp_raw;")
-                                lines.append(
-                                    "                if (!Decoder::decodeUint8(ptr, remaining, temp_raw)) return std::nullopt;"
-                                )
-                                lines.append(
-                                    f"                item.{nested_field.name}[j] = static_cast<{nested_cpp_type}>(temp_raw);"
-                                )
-                            lines.append("            }")
-                        else:
-                            if nested_is_uint8:
-                                lines.append(
-                                    f"            if (!Decoder::decodeUint8(ptr, remaining, item.{nested_field.name})) return std::nullopt;"
-                                )
-                            else:
-                                lines.append(f"            uint8_t {nested_field.name}_raw;")
-                                lines.append(
-                                    f"            if (!Decoder::decodeUint8(ptr, remaining, {nested_field.name}_raw)) return std::nullopt;"
-                                )
-                                lines.append(
-                                    f"            item.{nested_field.name} = static_cast<{nested_cpp_type}>({nested_field.name}_raw);"
-                                )
-                    elif isinstance(nested_field, PrimitiveField):
-                        if nested_field.is_array():
-                            lines.append(f"            uint8_t count_{nested_field.name};")
-                            lines.append(
-                                f"            if (!Decoder::decodeUint8(ptr, remaining, count_{nested_field.name})) return std::nullopt;"
-                            )
-                            if nested_field.dynamic:
-                                lines.append(
-                                    f"            for (uint8_t j = 0; j < count_{nested_field.name} && j < {nested_field.array}; ++j) {{"
-                                )
-                                cpp_type = get_cpp_type(nested_field.type_name.value, type_registry)
-                                lines.append(
-                                    f"                {cpp_type} temp_{nested_field.name};"
-                                )
-                                decoder_call = get_decoder_call(
-                                    f"temp_{nested_field.name}",
-                                    nested_field.type_name.value,
-                                    type_registry,
-                                    direct_target=f"temp_{nested_field.name}",
-                                )
-                                lines.append(f"                {decoder_call}")
-                                lines.append(
-                                    f"                item.{nested_field.name}.push_back(temp_{nested_field.name});"
-                                )
-                                lines.append("            }")
-                            else:
-                                lines.append(
-                                    f"            for (uint8_t j = 0; j < count_{nested_field.name} && j < {nested_field.array}; ++j) {{"
-                                )
-                                direct_target = f"item.{nested_field.name}[j]"
-                                decoder_call = get_decoder_call(
-                                    f"item_{nested_field.name}_j",
-                                    nested_field.type_name.value,
-                                    type_registry,
-                                    direct_target=direct_target,
-                                )
-                                lines.append(f"                {decoder_call}")
-                                lines.append("            }")
-                        else:
-                            direct_target = f"item.{nested_field.name}"
-                            decoder_call = get_decoder_call(
-                                f"item_{nested_field.name}",
-                                nested_field.type_name.value,
-                                type_registry,
-                                direct_target=direct_target,
-                            )
-                            lines.append(f"            {decoder_call}")
-                lines.append(f"            {var_name}[i] = item;")
-                lines.append("        }")
-            else:
-                struct_type = field.name[0].upper() + field.name[1:]
-                lines.append(f"        {struct_type} {var_name};")
-                for nested_field in field.fields:
-                    if isinstance(nested_field, EnumField):
-                        nested_cpp_type = nested_field.enum_def.cpp_type
-                        nested_is_uint8 = nested_cpp_type == "uint8_t"
-                        if nested_is_uint8:
-                            lines.append(
-                                f"        if (!Decoder::decodeUint8(ptr, remaining, {var_name}.{nested_field.name})) return std::nullopt;"
-                            )
-                        else:
-                            lines.append(f"        uint8_t {nested_field.name}_raw;")
-                            lines.append(
-                                f"        if (!Decoder::decodeUint8(ptr, remaining, {nested_field.name}_raw)) return std::nullopt;"
-                            )
-                            lines.append(
-                                f"        {var_name}.{nested_field.name} = static_cast<{nested_cpp_type}>({nested_field.name}_raw);"
-                            )
-                    elif isinstance(nested_field, PrimitiveField):
-                        direct_target = f"{var_name}.{nested_field.name}"
-                        decoder_call = get_decoder_call(
-                            f"{field.name}_{nested_field.name}",
-                            nested_field.type_name.value,
-                            type_registry,
-                            direct_target=direct_target,
-                        )
-                        lines.append(f"        {decoder_call}")
-            field_vars.append(var_name)
+        if raw_byte_arrays and isinstance(field, PrimitiveField) and _is_byte_array(field):
+            field_vars.append(_emit_byte_array_decode(field, type_registry, lines))
+            continue
+        if (
+            strategy is not None
+            and isinstance(field, CompositeField)
+            and wire_layout_size(field, strategy) is not None
+        ):
+            field_vars.append(_emit_wire_layout_decode(field, type_registry, lines))
+            continue
+        if isinstance(field, CompositeField) and strategy is not None and is_fixed_size(field):
+            field_vars.append(_emit_composite_decode(field, type_registry, lines, fixed_size=True))
+            continue
+        emit = _FIELD_DECODERS.get(type(field))
+        if emit is not None:
+            field_vars.append(emit(field, type_registry, lines))
 
     # Construct and return struct
-    field_values: list[str] = []
-    for i, field in enumerate(fields):
-        var = field_vars[i]
-        if field.is_primitive() and not field.is_array():
-            field_values.append(var)
-        else:
-            field_values.append(var)
-
-    field_list = ", ".join(field_values)
+    field_list = ", ".join(field_vars)
     lines.extend(["", f"        return {struct_name}{{{field_list}}};", "    }", ""])
 
-    return "\n".join(lines)
 
+_TAG_STRUCT_TEMPLATE = """struct {struct_name} {{
+    // Auto-detected MessageID for protocol.send()
+    static constexpr MessageID MESSAGE_ID = MessageID::{message_name};
 
-def generate_footer() -> str:
-    """Generate struct closing brace."""
-    return ""
+    // Tag-only message: no fields and no payload
+    static constexpr uint16_t MAX_PAYLOAD_SIZE = 0;
+    static constexpr uint16_t MIN_PAYLOAD_SIZE = 0;
+    static constexpr bool FIXED_SIZE = true;
 
+    /**
+     * Encode struct to MIDI-safe bytes (tag-only message)
+     * @return Always 0 (no payload)
+     */
+    [[nodiscard]] constexpr uint16_t encode(uint8_t*, uint16_t = 0) const noexcept {{ return 0; }}
 
-def generate_composite_structs(
-    fields: Sequence[FieldBase], type_registry: TypeRegistry, depth: int = 0
-) -> str:
+    /**
+     * Decode struct from MIDI-safe bytes (tag-only message)
+     * @return Always returns empty struct
+     */
+    [[nodiscard]] static constexpr std::optional<{struct_name}> decode(
+        const uint8_t*, uint16_t) noexcept {{
+        return {struct_name}{{}};
+    }}
+"""
+
+
+def generate_tag_struct(lines: list[str], struct_name: str, message_name: str) -> None:
     """
-    Recursively generate all composite struct definitions from fields.
-    Returns empty string if no composites found.
+    Append a tag-only struct: MESSAGE_ID plus constexpr encode()/decode().
+
+    Used for messages without fields and without MESSAGE_NAME prefix, whose
+    payload is always empty; closed by generate_footer() like any struct.
     """
-    if depth > 3:
-        return ""
+    lines.append(_TAG_STRUCT_TEMPLATE.format(struct_name=struct_name, message_name=message_name))
 
-    structs: list[str] = []
-    for field in fields:
+
+def generate_footer(lines: list[str]) -> None:
+    """Append struct closing brace and namespace close."""
+    lines.append("};")
+    lines.append("\n}  // namespace Protocol\n")
+
+
+# ============================================================================
+# COMPOSITE HEADERS
+# ============================================================================
+# Each composite struct lives in struct/composites/<Name>.hpp, rendered once
+# per protocol and included by every message (or composite) that uses it.
+
+
+def composite_includes(fields: Sequence[FieldBase], prefix: str = "composites/") -> list[str]:
+    """#include lines for the composite types used directly by fields (sorted, unique)."""
+    names = {field_to_pascal_case(field.name) for field in fields if field.is_composite()}
+    return [f'#include "{prefix}{name}.hpp"' for name in sorted(names)]
+
+
+def collect_composite_fields(
+    fields: Sequence[FieldBase], composites: dict[str, list[CompositeField]]
+) -> None:
+    """
+    Group every composite field (nested included) by its struct name.
+
+    Walks an explicit work queue, without a depth cutoff: nesting is bounded
+    by the validator, and every composite reached must get its header.
+    """
+    queue = deque(fields)
+    while queue:
+        field = queue.popleft()
         if field.is_composite():
             assert isinstance(field, CompositeField)
-            nested = generate_composite_structs(field.fields, type_registry, depth + 1)
-            if nested:
-                structs.append(nested)
-            struct_code = generate_single_composite_struct(field, type_registry)
-            structs.append(struct_code)
+            composites.setdefault(field_to_pascal_case(field.name), []).append(field)
+            queue.extend(field.fields)
 
-    return "\n".join(structs)
 
+_COMPOSITE_HPP_TEMPLATE = """/**
+ * {struct_name}.hpp - Auto-generated Protocol Composite
+ *
+ * AUTO-GENERATED - DO NOT EDIT
+ *
+ * Shared by every message and composite with a member of this type.
+ */
 
-def generate_single_composite_struct(field: CompositeField, type_registry: TypeRegistry) -> str:
+#pragma once
+
+{includes}
+
+namespace Protocol {{
+
+struct {struct_name} {{
+{members}
+}};
+
+// Built by brace-init (e.g. {struct_name}{{...}}): keep it an aggregate
+static_assert(std::is_aggregate_v<{struct_name}>, "{struct_name} must be an aggregate");
+{layout_checks}
+}}  // namespace Protocol
+"""
+
+# Compile-time guards of a composite decoded by memcpy (see wire_layout_size)
+_WIRE_LAYOUT_CHECKS_TEMPLATE = """
+// Decoded by one memcpy from the wire: the struct layout must be the wire layout
+static_assert(std::is_trivially_copyable_v<{struct_name}>, "{struct_name} must be trivially copyable");
+static_assert(sizeof({struct_name}) == {size}, "{struct_name} must have no padding");
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ != __ORDER_LITTLE_ENDIAN__
+#error "{struct_name} is decoded by memcpy from little-endian wire bytes"
+#endif
+"""
+
+
+def generate_composite_hpp(
+    field: CompositeField, type_registry: TypeRegistry, strategy: EncodingStrategy | None = None
+) -> str:
     """
-    Generate a single composite struct definition with include guards.
+    Generate the shared header of one composite struct.
+
+    The header is self-contained: it includes the containers, enums and
+    nested composites its members need. Members are declared by descending
+    alignment when that saves padding (see declared_members); encode/decode
+    access them by name, in schema order, so the wire layout is unchanged.
+
+    A composite whose layout is its wire layout (wire_layout_size) keeps the
+    schema order instead, with static_asserts guarding its memcpy decode.
+    A composite of fixed encoded size (fixed_wire_size) declares it as
+    WIRE_SIZE.
     """
+    wire_size = wire_layout_size(field, strategy) if strategy is not None else None
+    fixed_size = fixed_wire_size(field, type_registry, strategy) if strategy is not None else None
+    includes = [
+        f'#include "../../{name}.hpp"'
+        for name in sorted(
+            {nested.enum_def.name for nested in field.fields if isinstance(nested, EnumField)}
+        )
+    ]
+    includes.extend(composite_includes(field.fields, prefix=""))
+    needs_array, needs_vector = analyze_includes_needed(field.fields, type_registry, nested=False)
+    if needs_array:
+        includes.append("#include <array>")
+    includes.append("#include <cstdint>")
+    if any(
+        isinstance(nested, PrimitiveField) and nested.type_name.value == "string"
+        for nested in field.fields
+    ):
+        includes.append("#include <string>")
+    includes.append("#include <type_traits>")
+    if needs_vector:
+        includes.append("#include <vector>")
+
     struct_name = field_to_pascal_case(field.name)
-    guard_macro = f"PROTOCOL_{struct_name.upper()}_STRUCT"
+    if wire_size is None:
+        members = declared_members(field, type_registry)
+        layout_checks = ""
+    else:
+        members = field.fields
+        layout_checks = _WIRE_LAYOUT_CHECKS_TEMPLATE.format(struct_name=struct_name, size=wire_size)
+    member_lines = [f"    {member_declaration(nested, type_registry)}" for nested in members]
+    if fixed_size is not None:
+        member_lines.append(_WIRE_SIZE_CONSTANT.format(size=fixed_size))
+    return _COMPOSITE_HPP_TEMPLATE.format(
+        struct_name=struct_name,
+        includes="\n".join(includes),
+        members="\n".join(member_lines),
+        layout_checks=layout_checks,
+    )
 
-    lines = [f"#ifndef {guard_macro}", f"#define {guard_macro}", "", f"struct {struct_name} {{"]
 
-    for nested_field in field.fields:
-        if isinstance(nested_field, PrimitiveField):
-            base_type = get_cpp_type(nested_field.type_name.value, type_registry)
-            if nested_field.array:
-                if nested_field.dynamic:
-                    lines.append(f"    std::vector<{base_type}> {nested_field.name};")
-                else:
-                    lines.append(
-                        f"    std::array<{base_type}, {nested_field.array}> {nested_field.name};"
-                    )
-            else:
-                lines.append(f"    {base_type} {nested_field.name};")
-        elif isinstance(nested_field, EnumField):
-            enum_type = nested_field.enum_def.cpp_type
-            if nested_field.array:
-                lines.append(
-                    f"    std::array<{enum_type}, {nested_field.array}> {nested_field.name};"
-                )
-            else:
-                lines.append(f"    {enum_type} {nested_field.name};")
-        elif isinstance(nested_field, CompositeField):
-            nested_struct_name = field_to_pascal_case(nested_field.name)
-            if nested_field.array:
-                lines.append(
-                    f"    std::array<{nested_struct_name}, {nested_field.array}> {nested_field.name};"
-                )
-            else:
-                lines.append(f"    {nested_struct_name} {nested_field.name};")
+_WIRE_SIZE_CONSTANT = """
+    // Encoded size in bytes (fixed: scalar members only)
+    static constexpr uint16_t WIRE_SIZE = {size};"""
 
-    lines.append("};")
-    lines.append("")
-    lines.append(f"#endif // {guard_macro}")
-    lines.append("")
-    return "\n".join(lines)
 
+def is_fixed_size(field: CompositeField) -> bool:
+    """
+    Whether every value of a composite encodes to the same number of bytes.
 
-def get_cpp_type_for_field(field: FieldBase, type_registry: TypeRegistry) -> str:
-    """Get C++ type for a field (handles primitive, composite, and enum)."""
+    Its members must all be scalar enums or non-string primitives: arrays
+    (even fixed-size ones, whose count prefix bounds the items actually
+    sent) and strings vary in size, and nested composites are not encoded
+    member by member (see _NESTED_ENCODERS).
+    """
+    return all(
+        not nested.array
+        and (
+            isinstance(nested, EnumField)
+            or (isinstance(nested, PrimitiveField) and nested.type_name.value != "string")
+        )
+        for nested in field.fields
+    )
+
+
+def fixed_wire_size(
+    field: CompositeField, type_registry: TypeRegistry, strategy: EncodingStrategy
+) -> int | None:
+    """Encoded size of a fixed-size composite (is_fixed_size), else None."""
+    if not is_fixed_size(field):
+        return None
+    calculator = PayloadCalculator(strategy, type_registry)
+    return calculator.calculate_min_payload_size(field.fields, 0)
+
+
+# Member types whose raw little-endian wire bytes (strategy.is_raw_little_endian)
+# are also their in-memory bytes, by C++ size. bool and norm8/norm16 are
+# converted on decode, strings and arrays carry a length/count prefix.
+_WIRE_LAYOUT_SIZES: dict[str, int] = {
+    "uint8": 1,
+    "int8": 1,
+    "uint16": 2,
+    "int16": 2,
+    "uint32": 4,
+    "int32": 4,
+    "float32": 4,
+}
+
+
+def wire_layout_size(field: CompositeField, strategy: EncodingStrategy) -> int | None:
+    """
+    Size of a composite whose C++ struct layout is its wire layout, else None.
+
+    Every member must be a scalar of _WIRE_LAYOUT_SIZES (or a uint8_t enum)
+    sent as raw little-endian bytes, and the schema order must leave no
+    padding (each member naturally aligned, no tail padding). Such a
+    composite is decoded by a single memcpy.
+    """
+    offset = 0
+    max_size = 1
+    for nested in field.fields:
+        if nested.array:
+            return None
+        if isinstance(nested, EnumField):
+            type_name = "uint8" if nested.enum_def.cpp_type == "uint8_t" else ""
+        elif isinstance(nested, PrimitiveField):
+            type_name = nested.type_name.value
+        else:
+            return None
+        size = _WIRE_LAYOUT_SIZES.get(type_name)
+        if size is None or offset % size or not strategy.is_raw_little_endian(type_name):
+            return None
+        offset += size
+        max_size = max(max_size, size)
+    if not offset or offset % max_size:
+        return None
+    return offset
+
+
+# Natural alignment of the builtin C++ member types. Containers (std::string,
+# std::vector) and unknown types sort with the pointer-aligned members.
+_CPP_TYPE_ALIGNMENT: dict[str, int] = {
+    "bool": 1,
+    "uint8_t": 1,
+    "int8_t": 1,
+    "uint16_t": 2,
+    "int16_t": 2,
+    "uint32_t": 4,
+    "int32_t": 4,
+    "float": 4,
+}
+_POINTER_ALIGNMENT = 8
+
+
+def member_alignment(field: FieldBase, type_registry: TypeRegistry) -> int:
+    """Alignment in bytes of a field's C++ member, as declared by member_declaration()."""
+    if isinstance(field, PrimitiveField) and field.dynamic:
+        return _POINTER_ALIGNMENT  # std::vector
+    if isinstance(field, CompositeField):
+        return max((member_alignment(nested, type_registry) for nested in field.fields), default=1)
     if isinstance(field, EnumField):
-        cpp_type = field.enum_def.cpp_type
-        if field.array:
-            return f"std::array<{cpp_type}, {field.array}>"
-        return cpp_type
-    elif isinstance(field, PrimitiveField):
-        base_type = get_cpp_type(field.type_name.value, type_registry)
-        if field.array:
-            if field.dynamic:
-                return f"std::vector<{base_type}>"
-            else:
-                return f"std::array<{base_type}, {field.array}>"
-        return base_type
+        return 1  # enum class : uint8_t, and uint8_t bitflags
+    assert isinstance(field, PrimitiveField)
+    cpp_type = get_cpp_type(field.type_name.value, type_registry)
+    return _CPP_TYPE_ALIGNMENT.get(cpp_type, _POINTER_ALIGNMENT)
+
+
+# Size of the container members (std::string, std::vector), as laid out by the
+# common 64-bit standard libraries: a multiple of their 8-byte alignment, which
+# is all the padding estimate of declared_members() depends on
+_CONTAINER_SIZE = 32
+
+
+def member_size(field: FieldBase, type_registry: TypeRegistry) -> int:
+    """Size in bytes of a field's C++ member, as declared by member_declaration()."""
+    if isinstance(field, PrimitiveField) and field.dynamic:
+        return _CONTAINER_SIZE  # std::vector
+    if isinstance(field, CompositeField):
+        item = struct_size(declared_members(field, type_registry), type_registry)
+    elif isinstance(field, EnumField):
+        item = 1
     else:
-        assert isinstance(field, CompositeField)
-        struct_name = field_to_pascal_case(field.name)
-        if field.array:
-            return f"std::array<{struct_name}, {field.array}>"
-        return struct_name
+        assert isinstance(field, PrimitiveField)
+        cpp_type = get_cpp_type(field.type_name.value, type_registry)
+        # Builtin scalars are as large as they are aligned
+        item = _CPP_TYPE_ALIGNMENT.get(cpp_type, _CONTAINER_SIZE)
+    if not field.array:
+        return item
+    return item * field.array
+
+
+def struct_size(members: Sequence[FieldBase], type_registry: TypeRegistry) -> int:
+    """sizeof() of a struct declaring members in this order, padding included."""
+    offset = 0
+    alignment = 1
+    for member in members:
+        member_align = member_alignment(member, type_registry)
+        offset = -(-offset // member_align) * member_align + member_size(member, type_registry)
+        alignment = max(alignment, member_align)
+    return -(-offset // alignment) * alignment
+
+
+def declared_members(field: CompositeField, type_registry: TypeRegistry) -> list[FieldBase]:
+    """
+    Members of a composite in C++ declaration order.
+
+    Schema order, unless declaring by descending alignment (see
+    member_alignment) makes the struct smaller: the order is what
+    positional brace-init ({struct_name}{...}) follows, so it only changes
+    to save padding.
+    """
+    # sorted() is stable: equally aligned members keep their schema order
+    by_alignment = sorted(field.fields, key=lambda nested: -member_alignment(nested, type_registry))
+    if struct_size(by_alignment, type_registry) < struct_size(field.fields, type_registry):
+        return by_alignment
+    return list(field.fields)
+
+
+# Bulk-copied fixed arrays from this length up are 16-byte aligned, so that
+# their memcpy can use aligned vector moves
+_ALIGNED_ARRAY_MIN_LENGTH = 8
+
+
+def _is_bulk_copied_array(field: FieldBase, strategy: EncodingStrategy) -> bool:
+    """
+    Check if a message field is a std::array copied by one memcpy.
+
+    Raw byte arrays (strategy.raw_byte_arrays) and arrays of wire-layout
+    composites (wire_layout_size) are; composite members never are.
+    """
+    if isinstance(field, PrimitiveField) and field.dynamic:
+        return False  # std::vector
+    if isinstance(field, CompositeField):
+        return wire_layout_size(field, strategy) is not None
+    return strategy.raw_byte_arrays and _is_byte_array(field)
+
+
+def member_declaration(
+    field: FieldBase, type_registry: TypeRegistry, strategy: EncodingStrategy | None = None
+) -> str:
+    """
+    C++ member declaration of a field.
+
+    Message fields (strategy given) that are bulk-copied arrays of 8+
+    elements are alignas(16).
+    """
+    cpp_type = get_cpp_type_for_field(field, type_registry)
+    if (
+        strategy is not None
+        and field.array is not None
+        and field.array >= _ALIGNED_ARRAY_MIN_LENGTH
+        and _is_bulk_copied_array(field, strategy)
+    ):
+        return f"alignas(16) {cpp_type} {field.name};"
+    return f"{cpp_type} {field.name};"
+
+
+def _enum_member_type(field: EnumField, type_registry: TypeRegistry) -> str:
+    """C++ member type of an enum field."""
+    cpp_type = field.enum_def.cpp_type
+    if field.array:
+        return f"std::array<{cpp_type}, {field.array}>"
+    return cpp_type
+
+
+def _primitive_member_type(field: PrimitiveField, type_registry: TypeRegistry) -> str:
+    """C++ member type of a primitive field (std::vector when dynamic)."""
+    return _primitive_container_type(
+        field.type_name.value, field.array, field.dynamic, type_registry
+    )
+
+
+@lru_cache(maxsize=4096)
+def _primitive_container_type(
+    type_name: str, array: int | None, dynamic: bool, type_registry: TypeRegistry
+) -> str:
+    """C++ type of a primitive, wrapped in its container (cached per shape)."""
+    base_type = get_cpp_type(type_name, type_registry)
+    if not array:
+        return base_type
+    return f"std::vector<{base_type}>" if dynamic else f"std::array<{base_type}, {array}>"
+
+
+def _composite_member_type(field: CompositeField, type_registry: TypeRegistry) -> str:
+    """C++ member type of a composite field (its PascalCase struct)."""
+    struct_name = field_to_pascal_case(field.name)
+    if field.array:
+        return f"std::array<{struct_name}, {field.array}>"
+    return struct_name
+
+
+# Field class -> C++ member type resolver (exact lookup, see _FIELD_ENCODERS)
+_MEMBER_TYPES: dict[type[FieldBase], Callable[[Any, TypeRegistry], str]] = {
+    EnumField: _enum_member_type,
+    PrimitiveField: _primitive_member_type,
+    CompositeField: _composite_member_type,
+}
+
+
+def get_cpp_type_for_field(field: FieldBase, type_registry: TypeRegistry) -> str:
+    """Get C++ type for a field (handles primitive, composite, and enum)."""
+    return _MEMBER_TYPES[type(field)](field, type_registry)
@@ -213,9 +213,12 @@ class JavaBackend(LanguageBackend):
                 scale = parts.get("NORM_SCALE", "255")
                 body_lines.append(f"int norm = (int)(val * {scale}.0f + 0.5f);")
 
-        # Handle signed cast for multi-byte
+        # Handle signed cast for multi-byte (a short is widened to its 16-bit
+        # pattern; an int already holds all 32 bits, masking would drop 16)
         if spec.needs_signed_cast:
-            body_lines.append("int val = value & 0xFFFF;")
+            body_lines.append(
+                "int val = value & 0xFFFF;" if java_type == "short" else "int val = value;"
+            )
             param_name = "value"
         else:
             param_name = "val"
@@ -26,10 +26,14 @@ from protocol_codegen.generators.languages.java.file_generators.method import (
     generate_protocol_methods_java,
 )
 from protocol_codegen.generators.languages.java.file_generators.struct import (
+    clear_struct_cache,
+    generate_all_struct_java,
     generate_struct_java,
 )
 
 __all__ = [
+    "clear_struct_cache",
+    "generate_all_struct_java",
     "generate_protocol_callbacks_java",
     "generate_constants_java",
     "generate_decoder_registry_java",
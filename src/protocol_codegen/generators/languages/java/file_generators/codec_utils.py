@@ -13,11 +13,19 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from protocol_codegen.core.loader import BUILTIN_TYPES
 from protocol_codegen.generators.core.naming import capitalize_first
 
 if TYPE_CHECKING:
     from protocol_codegen.core.loader import TypeRegistry
 
+# Encoder call prefix per builtin type, built once at import.
+# The call is completed with the value expression and ");".
+_ENCODER_CALL_PREFIXES: dict[str, str] = {
+    type_name: f"offset += Encoder.encode{capitalize_first(type_name)}(buffer, offset, "
+    for type_name in BUILTIN_TYPES
+}
+
 
 def get_encoder_call(field_name: str, field_type: str, type_registry: TypeRegistry) -> str:
     """
@@ -29,15 +37,13 @@ def get_encoder_call(field_name: str, field_type: str, type_registry: TypeRegist
     # Extract base type (handle arrays)
     base_type = field_type.split("[")[0]
 
+    # Builtin - Encoder.encodeXxx(), streaming, zero allocation
+    prefix = _ENCODER_CALL_PREFIXES.get(base_type)
+    if prefix is not None:
+        return f"{prefix}{field_name});"
+
     if not type_registry.is_atomic(base_type):
         raise ValueError(f"Unknown type: {base_type}")
 
-    atomic = type_registry.get(base_type)
-
-    if atomic.is_builtin:
-        # Call Encoder.encodeXxx() - streaming, zero allocation
-        encoder_name = f"encode{capitalize_first(base_type)}"
-        return f"offset += Encoder.{encoder_name}(buffer, offset, {field_name});"
-    else:
-        # Nested struct - call its encodeTo()
-        return f"offset += {field_name}.encodeTo(buffer, offset);"
+    # Nested struct - call its encodeTo()
+    return f"offset += {field_name}.encodeTo(buffer, offset);"
@@ -40,7 +40,7 @@ def generate_enum_java(enum_def: EnumDef, output_path: Path, package: str) -> st
     lines.append("")
 
     # Header comment
-    lines.append(_generate_header(enum_def, output_path))
+    lines.append(_generate_header(enum_def, output_path.name))
 
     if enum_def.is_bitflags:
         lines.append(_generate_bitflags_class(enum_def))
@@ -50,27 +50,20 @@ def generate_enum_java(enum_def: EnumDef, output_path: Path, package: str) -> st
     return "\n".join(lines)
 
 
-def _generate_header(enum_def: EnumDef, output_path: Path) -> str:
-    """Generate file header comment."""
-    header_lines = [
-        "/**",
-        f" * {output_path.name} - Auto-generated Protocol Enum",
-        " *",
-        " * AUTO-GENERATED - DO NOT EDIT",
-        " *",
-    ]
-
-    if enum_def.description:
-        header_lines.append(f" * <p>{enum_def.description}</p>")
-        header_lines.append(" *")
-
-    if enum_def.is_bitflags:
-        header_lines.append(" * <p>Note: This is a bitflags type - values can be combined with |</p>")
-        header_lines.append(" *")
+# Invariant header comment parts (only the file name and description vary)
+_HEADER_NOTICE = " *\n * AUTO-GENERATED - DO NOT EDIT\n *\n"
+_BITFLAGS_NOTE = " * <p>Note: This is a bitflags type - values can be combined with |</p>\n *\n"
+_HEADER_TAIL = " */"
 
-    header_lines.append(" */")
 
-    return "\n".join(header_lines)
+def _generate_header(enum_def: EnumDef, file_name: str) -> str:
+    """Generate file header comment."""
+    description = f" * <p>{enum_def.description}</p>\n *\n" if enum_def.description else ""
+    note = _BITFLAGS_NOTE if enum_def.is_bitflags else ""
+    return (
+        f"/**\n * {file_name} - Auto-generated Protocol Enum\n"
+        f"{_HEADER_NOTICE}{description}{note}{_HEADER_TAIL}"
+    )
 
 
 def _generate_enum(enum_def: EnumDef) -> str:
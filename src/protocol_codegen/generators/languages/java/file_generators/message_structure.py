@@ -41,8 +41,7 @@ def generate_message_structure_java(
     class_refs: list[str] = []
 
     for message in messages:
-        # Convert SCREAMING_SNAKE_CASE to PascalCase
-        pascal_name = "".join(word.capitalize() for word in message.name.split("_"))
+        pascal_name = message.pascal_name
         class_name = f"{pascal_name}Message"
 
         imports.append(f"import {struct_package}.{class_name};")
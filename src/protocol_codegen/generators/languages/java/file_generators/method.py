@@ -15,7 +15,6 @@ from protocol_codegen.generators.core.naming import (
     message_name_to_callback_name,
     message_name_to_method_name,
     should_exclude_field,
-    to_pascal_case,
 )
 
 if TYPE_CHECKING:
@@ -114,23 +113,12 @@ def _collect_enum_names(messages: list[Message]) -> set[str]:
     Bitflags enums are int types and don't need imports.
     Regular enums need to be imported.
     """
-    from protocol_codegen.core.field import CompositeField, EnumField
-
     enum_names: set[str] = set()
-
-    def collect_from_fields(fields: list) -> None:
-        for field in fields:
-            if isinstance(field, EnumField):
-                # Only add non-bitflags enums (bitflags are int, no import needed)
-                if not field.enum_def.is_bitflags:
-                    enum_names.add(field.enum_def.name)
-            elif isinstance(field, CompositeField):
-                collect_from_fields(list(field.fields))
-
     for msg in messages:
         if msg.is_legacy() or msg.deprecated:
             continue
-        collect_from_fields(list(msg.fields))
+        # Only non-bitflags enums (bitflags are int, no import needed)
+        enum_names.update(enum_def.name for enum_def in msg.enum_defs if not enum_def.is_bitflags)
 
     return enum_names
 
@@ -164,7 +152,7 @@ def generate_protocol_methods_java(
         if msg.is_legacy() or msg.deprecated:
             continue
 
-        struct_name = to_pascal_case(msg.name) + "Message"
+        struct_name = msg.pascal_name + "Message"
 
         if msg.is_to_host():
             # Controller sends to Host -> generate callback declaration
@@ -19,11 +19,13 @@ Generated Output:
 
 from __future__ import annotations
 
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from typing import TYPE_CHECKING
 
-from protocol_codegen.generators.core.naming import to_pascal_case
+from protocol_codegen.core.field import populate_type_names
 from protocol_codegen.generators.languages.java.file_generators.struct_utils import (
-    collect_enum_names,
     generate_constructor,
     generate_decode_method,
     generate_encode_method,
@@ -33,11 +35,16 @@ from protocol_codegen.generators.languages.java.file_generators.struct_utils imp
     generate_header,
     generate_inner_classes,
     generate_message_id_constant,
-    needs_constants_import,
-    needs_list_import,
+    resolve_member_types,
+    uses_byte_buffer_encode,
+    uses_table_codec,
+    walk_field_codecs,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from concurrent.futures import Executor
+    from contextlib import AbstractContextManager
     from pathlib import Path
 
     from protocol_codegen.core.loader import TypeRegistry
@@ -45,6 +52,19 @@ if TYPE_CHECKING:
     from protocol_codegen.generators.protocols import EncodingStrategy
 
 
+# Generated class per (message, registry, generation options). Keys use object
+# identities; the weak references guard against id() reuse once a message or
+# registry is garbage-collected, and dead messages evict their own entries.
+_STRUCT_CACHE: dict[
+    tuple[object, ...], tuple[weakref.ref[Message], weakref.ref[TypeRegistry], str]
+] = {}
+
+
+def clear_struct_cache() -> None:
+    """Drop every memoized generate_struct_java() result."""
+    _STRUCT_CACHE.clear()
+
+
 def generate_struct_java(
     message: Message,
     message_id: int,
@@ -54,10 +74,15 @@ def generate_struct_java(
     package: str,
     strategy: EncodingStrategy,
     include_message_name: bool | None = None,
+    table_codec_threshold: int = 0,
 ) -> str:
     """
     Generate Java message class for a message using the provided encoding strategy.
 
+    Results are memoized per message object and options (messages are treated
+    as immutable once loaded): regenerating the same message returns the
+    cached code. Call clear_struct_cache() after mutating a loaded message.
+
     Args:
         message: Message instance to generate class for
         message_id: Allocated message ID
@@ -67,6 +92,7 @@ def generate_struct_java(
         package: Java package name (e.g., 'protocol.struct')
         strategy: Encoding strategy (BinaryEncodingStrategy or SysExEncodingStrategy)
         include_message_name: Include MESSAGE_NAME prefix in payload (None = use strategy default)
+        table_codec_threshold: Use StructCodec encode()/decode() above this many fields (0 = disabled)
 
     Returns:
         Generated Java code as string
@@ -75,8 +101,48 @@ def generate_struct_java(
     if include_message_name is None:
         include_message_name = strategy.include_message_name_default
 
+    key = (
+        id(message),
+        id(type_registry),
+        message_id,
+        string_max_length,
+        package,
+        type(strategy),
+        include_message_name,
+        table_codec_threshold,
+    )
+    cached = _STRUCT_CACHE.get(key)
+    if cached is not None and cached[0]() is message and cached[1]() is type_registry:
+        return cached[2]
+
+    code = _render_struct_java(
+        message,
+        message_id,
+        type_registry,
+        string_max_length,
+        package,
+        strategy,
+        include_message_name,
+        table_codec_threshold,
+    )
+    _STRUCT_CACHE[key] = (weakref.ref(message), weakref.ref(type_registry), code)
+    weakref.finalize(message, _STRUCT_CACHE.pop, key, None)
+    return code
+
+
+def _render_struct_java(
+    message: Message,
+    message_id: int,
+    type_registry: TypeRegistry,
+    string_max_length: int,
+    package: str,
+    strategy: EncodingStrategy,
+    include_message_name: bool,
+    table_codec_threshold: int,
+) -> str:
+    """Render the Java message class (uncached body of generate_struct_java())."""
     # Convert SCREAMING_SNAKE_CASE to PascalCase
-    pascal_name = to_pascal_case(message.name)
+    pascal_name = message.pascal_name
     class_name = f"{pascal_name}Message"
     fields = message.fields
     description = f"{message.name} message"
@@ -84,21 +150,29 @@ def generate_struct_java(
     # Get encoding description from strategy
     encoding_description = f"{strategy.description} ({strategy.name})"
 
-    # Analyze what imports are needed based on fields
+    # Imports come from the message's cached field summary (has_string_field, enum_defs)
     has_fields = len(fields) > 0
-    enum_names = collect_enum_names(fields)
+    # Table-driven messages go through StructCodec instead of Encoder/Decoder
+    table_codec = uses_table_codec(fields, type_registry, table_codec_threshold)
+    inline_codec = has_fields and not table_codec
+    # Raw little-endian scalar messages encode with one ByteBuffer put chain
+    byte_buffer = not table_codec and uses_byte_buffer_encode(fields, type_registry, strategy)
 
     # Generate all parts using common utilities
     header = generate_header(
         class_name=class_name,
         description=description,
-        needs_encoder=has_fields,
-        # Decoder is needed if there are fields OR if we need to skip message name prefix
-        needs_decoder=has_fields or include_message_name,
-        needs_list=needs_list_import(fields),
-        needs_arraylist=needs_list_import(fields),
-        needs_constants=needs_constants_import(fields, type_registry),
-        enum_names=enum_names,
+        needs_encoder=inline_codec and not byte_buffer,
+        # Decoder is needed for inline decode OR if we need to skip message name prefix
+        needs_decoder=inline_codec or include_message_name,
+        # Arrays are T[] (aligned with C++ std::array), never List
+        needs_list=False,
+        needs_arraylist=False,
+        needs_constants=message.has_string_field,
+        needs_struct_codec=table_codec,
+        needs_byte_buffer=byte_buffer,
+        # Bitflags are int, no import needed
+        enum_names={e.name for e in message.enum_defs if not e.is_bitflags},
         package=package,
         encoding_description=encoding_description,
     )
@@ -106,9 +180,13 @@ def generate_struct_java(
         message.name, pascal_name, include_message_name
     )
     inner_classes = generate_inner_classes(fields, type_registry)
-    field_declarations = generate_field_declarations(fields, type_registry)
-    constructor = generate_constructor(class_name, fields, type_registry)
-    getters = generate_getters(fields, type_registry)
+    # Member types resolved once for declarations, constructor and getters
+    member_types = resolve_member_types(fields, type_registry)
+    field_declarations = generate_field_declarations(fields, type_registry, member_types)
+    constructor = generate_constructor(class_name, fields, type_registry, member_types)
+    getters = generate_getters(fields, type_registry, member_types)
+    # Single field walk shared by encode() and decode() (unused in table mode)
+    codec = None if table_codec else walk_field_codecs(fields, type_registry, strategy)
     encode_method = generate_encode_method(
         class_name=class_name,
         pascal_name=pascal_name,
@@ -117,6 +195,8 @@ def generate_struct_java(
         string_max_length=string_max_length,
         strategy=strategy,
         include_message_name=include_message_name,
+        codec=codec,
+        table_codec_threshold=table_codec_threshold,
     )
     decode_method = generate_decode_method(
         class_name=class_name,
@@ -126,8 +206,89 @@ def generate_struct_java(
         string_max_length=string_max_length,
         strategy=strategy,
         include_message_name=include_message_name,
+        table_codec_threshold=table_codec_threshold,
+        codec=codec,
     )
     footer = generate_footer()
 
-    full_code = f"{header}\n{message_id_constant}\n{inner_classes}\n{field_declarations}\n{constructor}\n{getters}\n{encode_method}\n{decode_method}\n{footer}"
-    return full_code
+    sections = (
+        header,
+        message_id_constant,
+        inner_classes,
+        field_declarations,
+        constructor,
+        getters,
+        encode_method,
+        decode_method,
+        footer,
+    )
+    return "\n".join(sections)
+
+
+def generate_all_struct_java(
+    messages: Sequence[Message],
+    allocations: dict[str, int],
+    type_registry: TypeRegistry,
+    output_dir: Path,
+    string_max_length: int,
+    package: str,
+    strategy: EncodingStrategy,
+    include_message_name: bool | None = None,
+    table_codec_threshold: int = 0,
+    max_workers: int | None = 1,
+    executor: Executor | None = None,
+) -> dict[str, str]:
+    """
+    Generate Java message classes for a batch of messages.
+
+    Each message is rendered independently by generate_struct_java(), so the
+    batch can be spread over a process pool. Workers re-populate the Type enum
+    from the registry before unpickling any field definitions.
+
+    Args:
+        messages: Messages to generate classes for
+        allocations: Message name -> allocated message ID
+        type_registry: TypeRegistry for resolving field types
+        output_dir: Directory where Message*.java files will be written
+        string_max_length: Max string length from protocol config
+        package: Java package name (e.g., 'protocol.struct')
+        strategy: Encoding strategy (BinaryEncodingStrategy or SysExEncodingStrategy)
+        include_message_name: Include MESSAGE_NAME prefix in payload (None = use strategy default)
+        table_codec_threshold: Use StructCodec encode()/decode() above this many fields (0 = disabled)
+        max_workers: Worker processes (1 = generate in-process, None = one per CPU)
+        executor: Running pool to submit to instead (its workers must have
+            populated the Type enum); max_workers is then ignored
+
+    Returns:
+        Dict mapping message name to generated Java code, in input order
+    """
+    jobs = [
+        (
+            message,
+            allocations[message.name],
+            type_registry,
+            output_dir / f"{message.pascal_name}Message.java",
+            string_max_length,
+            package,
+            strategy,
+            include_message_name,
+            table_codec_threshold,
+        )
+        for message in messages
+    ]
+
+    pool: AbstractContextManager[Executor]
+    if executor is None:
+        if max_workers == 1 or len(jobs) < 2:
+            return {job[0].name: generate_struct_java(*job) for job in jobs}
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=populate_type_names,
+            initargs=(list(type_registry.types.keys()),),
+        )
+    else:
+        pool = nullcontext(executor)
+
+    with pool as workers:
+        futures = {job[0].name: workers.submit(generate_struct_java, *job) for job in jobs}
+        return {name: future.result() for name, future in futures.items()}
@@ -13,23 +13,41 @@ This module provides:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from protocol_codegen.core.field import CompositeField, EnumField, FieldBase, PrimitiveField
+from protocol_codegen.core.loader import BUILTIN_TYPES
 from protocol_codegen.generators.core.naming import (
     capitalize_first,
     field_to_pascal_case,
 )
 from protocol_codegen.generators.core.payload import PayloadCalculator
 from protocol_codegen.generators.languages.java.file_generators.codec_utils import get_encoder_call
+from protocol_codegen.generators.templates.struct_codec import (
+    JAVA_FROM_RAW_BITS,
+    JAVA_TO_RAW_BITS,
+    is_struct_codec_type,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
 
+    from protocol_codegen.core.enum_def import EnumDef
     from protocol_codegen.core.loader import TypeRegistry
     from protocol_codegen.generators.protocols import EncodingStrategy
 
 
+# Rule line framing every section banner of the generated class
+_BANNER = "    // " + "=" * 76
+
+
+def _section_banner(title: str) -> list[str]:
+    """Return the comment banner lines opening a class section."""
+    return [_BANNER, f"    // {title}", _BANNER, ""]
+
+
 # ============================================================================
 # FIELD ANALYSIS HELPERS
 # ============================================================================
@@ -57,27 +75,17 @@ def collect_enum_names(fields: Sequence[FieldBase]) -> set[str]:
     return enum_names
 
 
-def needs_list_import(fields: Sequence[FieldBase]) -> bool:
-    """Check if List import is needed.
-
-    Since composite arrays now use T[] (aligned with C++ std::array),
-    List is no longer needed for any message types.
-    """
-    # All arrays (primitive and composite) now use T[] - no List import needed
-    return False
-
-
 def needs_constants_import(fields: Sequence[FieldBase], type_registry: TypeRegistry) -> bool:
-    """Check if ProtocolConstants import is needed (any string field)."""
-    for field in fields:
+    """Check if ProtocolConstants import is needed (any string field, nested included)."""
+    # Explicit stack instead of recursion over composite fields
+    stack = list(fields)
+    while stack:
+        field = stack.pop()
         if isinstance(field, PrimitiveField):
             if field.type_name.value == "string":
                 return True
-        elif isinstance(field, CompositeField) and needs_constants_import(
-            field.fields, type_registry
-        ):
-            # Check nested fields recursively
-            return True
+        elif isinstance(field, CompositeField):
+            stack.extend(field.fields)
         # EnumField doesn't need constants import
     return False
 
@@ -87,10 +95,14 @@ def needs_constants_import(fields: Sequence[FieldBase], type_registry: TypeRegis
 # ============================================================================
 
 
+@lru_cache(maxsize=4096)
 def get_java_type(field_type: str, type_registry: TypeRegistry) -> str:
     """
     Get Java type for a field type string.
 
+    Results are cached per (field_type, registry): every field of every
+    message resolves its type several times per run.
+
     Handles:
     - Builtin types (uint8 → byte, float32 → float)
     - Array notation (uint8[8] → byte[])
@@ -163,6 +175,8 @@ def generate_header(
     enum_names: set[str],
     package: str,
     encoding_description: str,
+    needs_struct_codec: bool = False,
+    needs_byte_buffer: bool = False,
 ) -> str:
     """Generate file header with package and class declaration, importing only what's needed.
 
@@ -178,29 +192,30 @@ def generate_header(
         package: Java package name
         encoding_description: Protocol-specific encoding description
             (e.g., "8-bit binary (Binary)" or "7-bit MIDI-safe")
+        needs_struct_codec: Whether StructCodec import is needed (table-driven codec)
+        needs_byte_buffer: Whether java.nio ByteBuffer/ByteOrder imports are needed
     """
     # Extract base package for imports
     # If package is "protocol.struct", base is "protocol"
     # If package is "protocol", base is "protocol"
     base_package = package.rsplit(".", 1)[0] if "." in package else package
 
-    imports = [f"import {base_package}.MessageID;"]
-
-    if needs_encoder:
-        imports.append(f"import {base_package}.Encoder;")
-    if needs_decoder:
-        imports.append(f"import {base_package}.Decoder;")
-    if needs_constants:
-        imports.append(f"import {base_package}.ProtocolConstants;")
-
-    # Add enum imports (non-bitflags only)
-    for enum_name in sorted(enum_names):
-        imports.append(f"import {base_package}.{enum_name};")
-
-    if needs_list:
-        imports.append("import java.util.List;")
-    if needs_arraylist:
-        imports.append("import java.util.ArrayList;")
+    # Enum imports are non-bitflags only
+    imports = [
+        f"import {base_package}.MessageID;",
+        *([f"import {base_package}.Encoder;"] if needs_encoder else []),
+        *([f"import {base_package}.Decoder;"] if needs_decoder else []),
+        *([f"import {base_package}.ProtocolConstants;"] if needs_constants else []),
+        *([f"import {base_package}.StructCodec;"] if needs_struct_codec else []),
+        *[f"import {base_package}.{enum_name};" for enum_name in sorted(enum_names)],
+        *(
+            ["import java.nio.ByteBuffer;", "import java.nio.ByteOrder;"]
+            if needs_byte_buffer
+            else []
+        ),
+        *(["import java.util.List;"] if needs_list else []),
+        *(["import java.util.ArrayList;"] if needs_arraylist else []),
+    ]
 
     imports_str = "\n".join(imports)
 
@@ -234,10 +249,7 @@ def generate_message_id_constant(
     """Generate MESSAGE_ID and MESSAGE_NAME constants for auto-detection and logging."""
     lines = [
         "",
-        "    // ============================================================================",
-        "    // Auto-detected MessageID for protocol.send()",
-        "    // ============================================================================",
-        "",
+        *_section_banner("Auto-detected MessageID for protocol.send()"),
         f"    public static final MessageID MESSAGE_ID = MessageID.{message_name};",
     ]
 
@@ -247,6 +259,10 @@ def generate_message_id_constant(
                 "",
                 "    // Message name for logging (encoded in payload)",
                 f'    public static final String MESSAGE_NAME = "{pascal_name}";',
+                "",
+                "    // Pre-encoded MESSAGE_NAME (ASCII), copied in bulk by encode()",
+                "    private static final byte[] MESSAGE_NAME_BYTES =",
+                "        MESSAGE_NAME.getBytes(java.nio.charset.StandardCharsets.US_ASCII);",
             ]
         )
 
@@ -255,41 +271,82 @@ def generate_message_id_constant(
 
 
 # ============================================================================
-# FIELD DECLARATIONS
+# MEMBER TYPES
 # ============================================================================
 
 
-def generate_field_declarations(fields: Sequence[FieldBase], type_registry: TypeRegistry) -> str:
-    """Generate private final field declarations (supports composites and enums)."""
-    lines: list[str] = ["    // ============================================================================"]
-    lines.append("    // Fields")
-    lines.append("    // ============================================================================")
-    lines.append("")
+def _primitive_member_type(field: PrimitiveField, type_registry: TypeRegistry) -> str:
+    """Java type of a primitive member (arrays are T[], no boxing)."""
+    java_type = get_java_type(field.type_name.value, type_registry)
+    return f"{java_type}[]" if field.is_array() else java_type
 
+
+def _enum_member_type(field: EnumField, type_registry: TypeRegistry) -> str:
+    """Java type of an enum member (bitflags → int)."""
+    java_type = field.enum_def.java_type
+    return f"{java_type}[]" if field.is_array() else java_type
+
+
+def _composite_member_type(field: CompositeField, type_registry: TypeRegistry) -> str:
+    """Java type of a composite message member (arrays are T[], aligned with C++ std::array)."""
+    class_name = field_to_pascal_case(field.name)
+    return f"{class_name}[]" if field.array else class_name
+
+
+def _composite_list_member_type(field: CompositeField, type_registry: TypeRegistry) -> str:
+    """Java type of a nested composite inner-class member."""
+    class_name = field_to_pascal_case(field.name)
+    return f"List<{class_name}>" if field.array else class_name
+
+
+# Field class -> message member type resolver (exact lookup, see _FIELD_CODEC_EMITTERS)
+_MEMBER_TYPES: dict[type[FieldBase], Callable[[Any, TypeRegistry], str]] = {
+    PrimitiveField: _primitive_member_type,
+    EnumField: _enum_member_type,
+    CompositeField: _composite_member_type,
+}
+
+
+def resolve_member_types(
+    fields: Sequence[FieldBase], type_registry: TypeRegistry
+) -> list[str | None]:
+    """
+    Resolve the Java member type of each message field once.
+
+    The result is shared by the field declarations, constructor and getters.
+    Unknown field kinds resolve to None and are skipped by those generators.
+    """
+    resolved: list[str | None] = []
     for field in fields:
-        if isinstance(field, EnumField):
-            # Enum field - use enum's Java type
-            java_type = field.enum_def.java_type
-            if field.is_array():
-                lines.append(f"    private final {java_type}[] {field.name};")
-            else:
-                lines.append(f"    private final {java_type} {field.name};")
-        elif isinstance(field, PrimitiveField):
-            field_type_name = field.type_name.value
-            java_type = get_java_type(field_type_name, type_registry)
-            if field.is_array():
-                # Primitive arrays use T[] (no boxing, zero-allocation)
-                lines.append(f"    private final {java_type}[] {field.name};")
-            else:
-                lines.append(f"    private final {java_type} {field.name};")
-        elif isinstance(field, CompositeField):
-            # Composite field
-            class_name = field_to_pascal_case(field.name)
-            if field.array:
-                # Composite arrays use T[] (aligned with C++ std::array)
-                lines.append(f"    private final {class_name}[] {field.name};")
-            else:
-                lines.append(f"    private final {class_name} {field.name};")
+        resolve = _MEMBER_TYPES.get(type(field))
+        resolved.append(None if resolve is None else resolve(field, type_registry))
+    return resolved
+
+
+# ============================================================================
+# FIELD DECLARATIONS
+# ============================================================================
+
+
+def generate_field_declarations(
+    fields: Sequence[FieldBase],
+    type_registry: TypeRegistry,
+    member_types: Sequence[str | None] | None = None,
+) -> str:
+    """Generate private final field declarations (supports composites and enums).
+
+    Args:
+        fields: Sequence of message fields
+        type_registry: TypeRegistry for resolving types
+        member_types: Precomputed resolve_member_types() result (resolved here if None)
+    """
+    if member_types is None:
+        member_types = resolve_member_types(fields, type_registry)
+
+    lines = _section_banner("Fields")
+    for field, java_type in zip(fields, member_types, strict=True):
+        if java_type is not None:
+            lines.append(f"    private final {java_type} {field.name};")
 
     lines.append("")
     return "\n".join(lines)
@@ -301,13 +358,23 @@ def generate_field_declarations(fields: Sequence[FieldBase], type_registry: Type
 
 
 def generate_constructor(
-    class_name: str, fields: Sequence[FieldBase], type_registry: TypeRegistry
+    class_name: str,
+    fields: Sequence[FieldBase],
+    type_registry: TypeRegistry,
+    member_types: Sequence[str | None] | None = None,
 ) -> str:
-    """Generate public constructor."""
-    lines: list[str] = ["    // ============================================================================"]
-    lines.append("    // Constructor")
-    lines.append("    // ============================================================================")
-    lines.append("")
+    """Generate public constructor.
+
+    Args:
+        class_name: The Java class name
+        fields: Sequence of message fields
+        type_registry: TypeRegistry for resolving types
+        member_types: Precomputed resolve_member_types() result (resolved here if None)
+    """
+    if member_types is None:
+        member_types = resolve_member_types(fields, type_registry)
+
+    lines = _section_banner("Constructor")
     lines.append("    /**")
     lines.append(f"     * Construct a new {class_name}")
     lines.append("     *")
@@ -319,31 +386,11 @@ def generate_constructor(
     lines.append("     */")
 
     # Constructor signature
-    params: list[str] = []
-    for field in fields:
-        if isinstance(field, EnumField):
-            java_type = field.enum_def.java_type
-            if field.is_array():
-                params.append(f"{java_type}[] {field.name}")
-            else:
-                params.append(f"{java_type} {field.name}")
-        elif isinstance(field, PrimitiveField):
-            field_type_name = field.type_name.value
-            java_type = get_java_type(field_type_name, type_registry)
-            if field.is_array():
-                # Primitive arrays use T[] (no boxing)
-                params.append(f"{java_type}[] {field.name}")
-            else:
-                params.append(f"{java_type} {field.name}")
-        elif isinstance(field, CompositeField):
-            # Composite field
-            class_name_inner = field_to_pascal_case(field.name)
-            if field.array:
-                # Composite arrays use T[] (aligned with C++ std::array)
-                params.append(f"{class_name_inner}[] {field.name}")
-            else:
-                params.append(f"{class_name_inner} {field.name}")
-
+    params = [
+        f"{java_type} {field.name}"
+        for field, java_type in zip(fields, member_types, strict=True)
+        if java_type is not None
+    ]
     param_str = ", ".join(params)
     lines.append(f"    public {class_name}({param_str}) {{")
 
@@ -362,29 +409,25 @@ def generate_constructor(
 # ============================================================================
 
 
-def generate_getters(fields: Sequence[FieldBase], type_registry: TypeRegistry) -> str:
-    """Generate public getters."""
-    lines: list[str] = ["    // ============================================================================"]
-    lines.append("    // Getters")
-    lines.append("    // ============================================================================")
-    lines.append("")
+def generate_getters(
+    fields: Sequence[FieldBase],
+    type_registry: TypeRegistry,
+    member_types: Sequence[str | None] | None = None,
+) -> str:
+    """Generate public getters.
 
-    for field in fields:
-        if isinstance(field, EnumField):
-            java_type = field.enum_def.java_type
-            if field.is_array():
-                java_type = f"{java_type}[]"
-        elif isinstance(field, PrimitiveField):
-            field_type_name = field.type_name.value
-            java_type = get_java_type(field_type_name, type_registry)
-            if field.is_array():
-                # Primitive arrays use T[] (no boxing)
-                java_type = f"{java_type}[]"
-        elif isinstance(field, CompositeField):
-            class_name = field_to_pascal_case(field.name)
-            # Composite arrays use T[] (aligned with C++ std::array)
-            java_type = f"{class_name}[]" if field.array else class_name
-        else:
+    Args:
+        fields: Sequence of message fields
+        type_registry: TypeRegistry for resolving types
+        member_types: Precomputed resolve_member_types() result (resolved here if None)
+    """
+    if member_types is None:
+        member_types = resolve_member_types(fields, type_registry)
+
+    lines = _section_banner("Getters")
+
+    for field, java_type in zip(fields, member_types, strict=True):
+        if java_type is None:
             continue  # Unknown field type
 
         getter_name = to_getter_name(field.name)
@@ -402,11 +445,594 @@ def generate_getters(fields: Sequence[FieldBase], type_registry: TypeRegistry) -
     return "\n".join(lines)
 
 
+# ============================================================================
+# FIELD CODEC WALK (encode + decode in one pass)
+# ============================================================================
+
+
+@dataclass(slots=True)
+class FieldCodecLines:
+    """encode()/decode() body lines produced by a single walk over message fields."""
+
+    encode: list[str]
+    decode: list[str]
+    decode_vars: list[str]
+
+
+def walk_field_codecs(
+    fields: Sequence[FieldBase], type_registry: TypeRegistry, strategy: EncodingStrategy
+) -> FieldCodecLines:
+    """
+    Walk message fields once, emitting both encode() and decode() body lines.
+
+    Type dispatch (one dict lookup on the field class) and Java type resolution
+    happen once per field and are shared by both directions.
+
+    Args:
+        fields: Sequence of message fields
+        type_registry: TypeRegistry for resolving types
+        strategy: Encoding strategy (Binary or SysEx)
+    """
+    codec = FieldCodecLines(encode=[], decode=[], decode_vars=[])
+    for field in fields:
+        emit = _FIELD_CODEC_EMITTERS.get(type(field))
+        if emit is not None:
+            emit(field, type_registry, strategy, codec)
+    return codec
+
+
+# Java fragments rendered once per field with str.format(): each field kind
+# appends one multi-line entry (a trailing newline stands for a blank line)
+_UINT8_ENCODE = "offset += Encoder.encodeUint8(buffer, offset, {value});"
+_ENUM_DECODE = "{indent}{java_type} {name} = {value};\n{indent}offset += 1;"
+_ARRAY_ENCODE = """\
+        offset += Encoder.encodeUint8(buffer, offset, {name}.length);
+
+        for ({item_type} item : {name}) {{
+{body}
+        }}
+"""
+_ARRAY_DECODE = """\
+        int count_{name} = Decoder.decodeUint8(data, offset);
+        offset += 1;
+
+        {item_type}[] {name} = new {item_type}[count_{name}];
+        for (int i = 0; i < count_{name}; i++) {{
+{body}
+        }}
+"""
+
+# Composite-array member templates, selected by (field class, is array, is bitflags)
+# and rendered with format_map(): (encode, decode), one block each per member.
+# Keys: getter, java_type, name, size, plus item_encode/decoder_call for primitives.
+_NESTED_COUNT_ENCODE = """\
+            offset += Encoder.encodeUint8(buffer, offset, {getter}.length);
+"""
+_NESTED_COUNT_DECODE = """\
+            byte count_{name} = (byte) Decoder.decodeUint8(data, offset);
+            offset += 1;
+            {java_type}[] item_{name} = new {java_type}[count_{name}];
+            for (int j = 0; j < count_{name} && j < {size}; j++) {{
+"""
+_NESTED_MEMBER_TEMPLATES: dict[tuple[type[FieldBase], bool, bool], tuple[str, str]] = {
+    (EnumField, True, False): (
+        _NESTED_COUNT_ENCODE
+        + """\
+            for ({java_type} e : {getter}) {{
+                offset += Encoder.encodeUint8(buffer, offset, e.getValue());
+            }}""",
+        _NESTED_COUNT_DECODE
+        + """\
+                item_{name}[j] = {java_type}.fromValue(Decoder.decodeUint8(data, offset));
+                offset += 1;
+            }}""",
+    ),
+    (EnumField, True, True): (
+        _NESTED_COUNT_ENCODE
+        + """\
+            for ({java_type} e : {getter}) {{
+                offset += Encoder.encodeUint8(buffer, offset, e);
+            }}""",
+        _NESTED_COUNT_DECODE
+        + """\
+                item_{name}[j] = Decoder.decodeUint8(data, offset);
+                offset += 1;
+            }}""",
+    ),
+    (EnumField, False, False): (
+        "            offset += Encoder.encodeUint8(buffer, offset, {getter}.getValue());",
+        """\
+            {java_type} item_{name} = {java_type}.fromValue(Decoder.decodeUint8(data, offset));
+            offset += 1;""",
+    ),
+    (EnumField, False, True): (
+        "            offset += Encoder.encodeUint8(buffer, offset, {getter});",
+        """\
+            {java_type} item_{name} = Decoder.decodeUint8(data, offset);
+            offset += 1;""",
+    ),
+    (PrimitiveField, True, False): (
+        _NESTED_COUNT_ENCODE
+        + """\
+            for ({java_type} type : {getter}) {{
+                {item_encode}
+            }}""",
+        _NESTED_COUNT_DECODE
+        + """\
+                {decoder_call}
+                item_{name}[j] = item_{name}_j;
+            }}""",
+    ),
+    (PrimitiveField, False, False): (
+        "            {item_encode}",
+        "            {decoder_call}",
+    ),
+}
+
+
+def _enum_encode_value(expr: str, enum_def: EnumDef) -> str:
+    """Java expression for the uint8 wire value of an enum (bitflags are plain int)."""
+    return expr if enum_def.is_bitflags else f"{expr}.getValue()"
+
+
+def _enum_decode_value(enum_def: EnumDef) -> str:
+    """Java expression decoding an enum from its uint8 wire value."""
+    if enum_def.is_bitflags:
+        return "Decoder.decodeUint8(data, offset)"
+    return f"{enum_def.java_type}.fromValue(Decoder.decodeUint8(data, offset))"
+
+
+def _emit_enum_codec(
+    field: EnumField,
+    type_registry: TypeRegistry,
+    strategy: EncodingStrategy,
+    codec: FieldCodecLines,
+) -> None:
+    """Emit encode/decode lines for a top-level enum field (encoded as uint8)."""
+    enum_def = field.enum_def
+    java_type = enum_def.java_type
+    decoded = _enum_decode_value(enum_def)
+    if field.is_array():
+        item_encode = _UINT8_ENCODE.format(value=_enum_encode_value("item", enum_def))
+        codec.encode.append(
+            _ARRAY_ENCODE.format(
+                name=field.name, item_type=java_type, body=f"            {item_encode}"
+            )
+        )
+        codec.decode.append(
+            _ARRAY_DECODE.format(
+                name=field.name,
+                item_type=java_type,
+                body=f"            {field.name}[i] = {decoded};\n            offset += 1;",
+            )
+        )
+    else:
+        value = _enum_encode_value(field.name, enum_def)
+        codec.encode.append(f"        {_UINT8_ENCODE.format(value=value)}")
+        codec.decode.append(
+            _ENUM_DECODE.format(
+                indent="        ", java_type=java_type, name=field.name, value=decoded
+            )
+            + "\n"
+        )
+    codec.decode_vars.append(field.name)
+
+
+def _emit_primitive_codec(
+    field: PrimitiveField,
+    type_registry: TypeRegistry,
+    strategy: EncodingStrategy,
+    codec: FieldCodecLines,
+) -> None:
+    """Emit encode/decode lines for a top-level primitive field."""
+    field_type_name = field.type_name.value
+    java_type = get_java_type(field_type_name, type_registry)
+    if field.is_array():
+        # Primitive arrays use T[] and .length (no boxing)
+        item_encode = get_encoder_call("item", field_type_name, type_registry)
+        codec.encode.append(
+            _ARRAY_ENCODE.format(
+                name=field.name, item_type=java_type, body=f"            {item_encode}"
+            )
+        )
+
+        if java_type == "byte" and strategy.raw_byte_arrays:
+            # Raw int8 payload bytes: one Arrays.copyOfRange in Decoder
+            codec.decode.append(
+                f"        byte[] {field.name} = Decoder.decodeByteArray(data, offset);\n"
+                f"        offset += 1 + {field.name}.length;\n"
+            )
+        else:
+            # Array assignment directly (avoid variable declaration)
+            decoder_name = _DECODER_NAMES[field_type_name]
+            if field_type_name == "string":
+                body = (
+                    f"            {field.name}[i] = Decoder.{decoder_name}(data, offset, ProtocolConstants.STRING_MAX_LENGTH);\n"
+                    f"            offset += 1 + {field.name}[i].length();"
+                )
+            else:
+                encoded_size = strategy.get_encoded_size(field_type_name, 0)
+                body = (
+                    f"            {field.name}[i] = Decoder.{decoder_name}(data, offset);\n"
+                    f"            offset += {encoded_size};"
+                )
+            codec.decode.append(
+                _ARRAY_DECODE.format(name=field.name, item_type=java_type, body=body)
+            )
+    else:
+        codec.encode.append(
+            f"        {get_encoder_call(field.name, field_type_name, type_registry)}"
+        )
+        decoder_call = get_decoder_call(
+            field.name, field_type_name, java_type, type_registry, strategy.get_encoded_size
+        )
+        codec.decode.append(f"        {decoder_call}")
+    codec.decode_vars.append(field.name)
+
+
+# Composite members with inline encode/decode (nested composites are skipped)
+_CODEC_MEMBER_KINDS = (EnumField, PrimitiveField)
+
+
+def _emit_composite_array_codec(
+    field: CompositeField,
+    type_registry: TypeRegistry,
+    strategy: EncodingStrategy,
+    codec: FieldCodecLines,
+) -> None:
+    """Emit encode/decode lines for an array of composites (T[] of inner classes)."""
+    composite_class = field_to_pascal_case(field.name)
+    item_enc: list[str] = []
+    item_dec: list[str] = []
+    for nested_field in field.fields:
+        name = nested_field.name
+        is_array = nested_field.is_array()
+        values: dict[str, str] = {
+            "getter": f"item.{to_getter_name(name)}()",
+            "name": name,
+            "size": str(nested_field.array),
+        }
+        if isinstance(nested_field, EnumField):
+            enum_def = nested_field.enum_def
+            values["java_type"] = enum_def.java_type
+            templates = _NESTED_MEMBER_TEMPLATES[EnumField, is_array, enum_def.is_bitflags]
+        elif isinstance(nested_field, PrimitiveField):
+            nested_type_name = nested_field.type_name.value
+            java_type = get_java_type(nested_type_name, type_registry)
+            values["java_type"] = java_type
+            # Arrays decode each element into item_<name>_j, one level deeper
+            values["item_encode"] = get_encoder_call(
+                "type" if is_array else values["getter"], nested_type_name, type_registry
+            )
+            values["decoder_call"] = get_decoder_call(
+                f"item_{name}_j" if is_array else f"item_{name}",
+                nested_type_name,
+                java_type,
+                type_registry,
+                strategy.get_encoded_size,
+                indent="                " if is_array else "            ",
+            )
+            templates = _NESTED_MEMBER_TEMPLATES[PrimitiveField, is_array, False]
+        else:
+            continue
+
+        encode_template, decode_template = templates
+        item_enc.append(encode_template.format_map(values))
+        item_dec.append(decode_template.format_map(values))
+
+    # Construct item and assign to array (aligned with C++ std::array)
+    item_params = ", ".join(
+        f"item_{nf.name}" for nf in field.fields if type(nf) in _CODEC_MEMBER_KINDS
+    )
+    item_dec.append(f"            {field.name}[i] = new {composite_class}({item_params});")
+    codec.encode.append(
+        _ARRAY_ENCODE.format(name=field.name, item_type=composite_class, body="\n".join(item_enc))
+    )
+    codec.decode.append(
+        _ARRAY_DECODE.format(name=field.name, item_type=composite_class, body="\n".join(item_dec))
+    )
+    codec.decode_vars.append(field.name)
+
+
+def _emit_composite_codec(
+    field: CompositeField,
+    type_registry: TypeRegistry,
+    strategy: EncodingStrategy,
+    codec: FieldCodecLines,
+) -> None:
+    """Emit encode/decode lines for a single (non-array) composite field."""
+    composite_class = field_to_pascal_case(field.name)
+    for nested_field in field.fields:
+        local_name = f"{field.name}_{nested_field.name}"
+        getter = f"{field.name}.{to_getter_name(nested_field.name)}()"
+        if isinstance(nested_field, EnumField):
+            enum_def = nested_field.enum_def
+            value = _enum_encode_value(getter, enum_def)
+            codec.encode.append(f"        {_UINT8_ENCODE.format(value=value)}")
+            codec.decode.append(
+                _ENUM_DECODE.format(
+                    indent="        ",
+                    java_type=enum_def.java_type,
+                    name=local_name,
+                    value=_enum_decode_value(enum_def),
+                )
+            )
+        elif isinstance(nested_field, PrimitiveField):
+            nested_type_name = nested_field.type_name.value
+            java_type = get_java_type(nested_type_name, type_registry)
+            codec.encode.append(
+                f"        {get_encoder_call(getter, nested_type_name, type_registry)}"
+            )
+            decoder_call = get_decoder_call(
+                local_name, nested_type_name, java_type, type_registry, strategy.get_encoded_size
+            )
+            codec.decode.append(f"        {decoder_call}")
+
+    # Construct composite
+    composite_params = ", ".join(
+        f"{field.name}_{nf.name}" for nf in field.fields if type(nf) in _CODEC_MEMBER_KINDS
+    )
+    codec.decode.append(
+        f"        {composite_class} {field.name} = new {composite_class}({composite_params});\n"
+    )
+    codec.decode_vars.append(field.name)
+
+
+def _emit_composite_field_codec(
+    field: CompositeField,
+    type_registry: TypeRegistry,
+    strategy: EncodingStrategy,
+    codec: FieldCodecLines,
+) -> None:
+    """Emit encode/decode lines for a composite field (single or array)."""
+    if field.array:
+        _emit_composite_array_codec(field, type_registry, strategy, codec)
+    else:
+        _emit_composite_codec(field, type_registry, strategy, codec)
+
+
+# Field class -> emitter (field classes are final dataclasses, exact lookup is safe)
+_FIELD_CODEC_EMITTERS: dict[
+    type[FieldBase],
+    Callable[[Any, TypeRegistry, EncodingStrategy, FieldCodecLines], None],
+] = {
+    EnumField: _emit_enum_codec,
+    PrimitiveField: _emit_primitive_codec,
+    CompositeField: _emit_composite_field_codec,
+}
+
+
+# ============================================================================
+# TABLE-DRIVEN CODEC (StructCodec)
+# ============================================================================
+
+
+def is_table_codable(fields: Sequence[FieldBase], type_registry: TypeRegistry) -> bool:
+    """Check if every field is a fixed-size scalar that StructCodec handles."""
+    for field in fields:
+        if field.is_array():
+            return False
+        if isinstance(field, PrimitiveField):
+            if not is_struct_codec_type(type_registry.get(field.type_name.value)):
+                return False
+        elif not isinstance(field, EnumField):
+            return False
+    return True
+
+
+def uses_table_codec(
+    fields: Sequence[FieldBase], type_registry: TypeRegistry, table_codec_threshold: int
+) -> bool:
+    """Check if a message encodes/decodes through StructCodec and a SCHEMA table."""
+    return 0 < table_codec_threshold < len(fields) and is_table_codable(fields, type_registry)
+
+
+@dataclass(frozen=True, slots=True)
+class _TableEntry:
+    """One field's slot in the StructCodec SCHEMA / raw-bits value array."""
+
+    code: str
+    encode_value: str
+    decode_arg: str
+
+
+def _enum_table_entry(field: EnumField, type_registry: TypeRegistry, slot: str) -> _TableEntry:
+    enum_def = field.enum_def
+    if enum_def.is_bitflags:
+        return _TableEntry("StructCodec.TYPE_UINT8", field.name, f"(int) {slot}")
+    return _TableEntry(
+        "StructCodec.TYPE_UINT8",
+        f"{field.name}.getValue()",
+        f"{enum_def.java_type}.fromValue((int) {slot})",
+    )
+
+
+def _primitive_table_entry(
+    field: PrimitiveField, type_registry: TypeRegistry, slot: str
+) -> _TableEntry:
+    type_name = field.type_name.value
+    java_type = get_java_type(type_name, type_registry)
+    return _TableEntry(
+        f"StructCodec.TYPE_{type_name.upper()}",
+        JAVA_TO_RAW_BITS.get(java_type, "{value}").format(value=field.name),
+        JAVA_FROM_RAW_BITS[java_type].format(value=slot),
+    )
+
+
+# Field class -> table entry builder (exact lookup, see _FIELD_CODEC_EMITTERS)
+_TABLE_ENTRIES: dict[type[FieldBase], Callable[[Any, TypeRegistry, str], _TableEntry]] = {
+    EnumField: _enum_table_entry,
+    PrimitiveField: _primitive_table_entry,
+}
+
+
+def _table_entries(fields: Sequence[FieldBase], type_registry: TypeRegistry) -> list[_TableEntry]:
+    """Resolve the table entry of each field, slot i reading v[i] on decode."""
+    return [
+        _TABLE_ENTRIES[type(field)](field, type_registry, f"v[{i}]")
+        for i, field in enumerate(fields)
+    ]
+
+
+def _generate_table_schema(fields: Sequence[FieldBase], type_registry: TypeRegistry) -> list[str]:
+    """Generate the static SCHEMA table of StructCodec.TYPE_* codes."""
+    codes = [entry.code for entry in _table_entries(fields, type_registry)]
+
+    lines = [
+        "    /**",
+        "     * Field type codes for table-driven encode/decode (StructCodec.TYPE_*)",
+        "     */",
+        "    private static final byte[] SCHEMA = {",
+    ]
+    lines.extend(f"        {code}," for code in codes)
+    lines.append("    };")
+    lines.append("")
+    return lines
+
+
+def _generate_table_encode_body(
+    fields: Sequence[FieldBase], type_registry: TypeRegistry
+) -> list[str]:
+    """Generate the encodeStruct() call passing every field as raw bits."""
+    values = [entry.encode_value for entry in _table_entries(fields, type_registry)]
+
+    lines = ["        offset = StructCodec.encodeStruct(buffer, offset, SCHEMA, new long[] {"]
+    lines.extend(f"            {value}," for value in values)
+    lines.append("        });")
+    return lines
+
+
+def _generate_table_decode_body(
+    class_name: str, fields: Sequence[FieldBase], type_registry: TypeRegistry
+) -> list[str]:
+    """Generate the decodeStruct() call and constructor for table-driven decode."""
+    args = [entry.decode_arg for entry in _table_entries(fields, type_registry)]
+
+    lines = [
+        "        long[] v = new long[SCHEMA.length];",
+        "        StructCodec.decodeStruct(data, offset, SCHEMA, v);",
+        "",
+        f"        return new {class_name}(",
+    ]
+    lines.extend(f"            {arg}," for arg in args[:-1])
+    lines.append(f"            {args[-1]});")
+    return lines
+
+
+# ============================================================================
+# BYTEBUFFER ENCODE FAST PATH
+# ============================================================================
+
+# Builtin type -> ByteBuffer put call writing the field value
+_BYTE_BUFFER_PUTS: dict[str, str] = {
+    "bool": "put((byte) ({value} ? 1 : 0))",
+    "uint8": "put((byte) {value})",
+    "int8": "put({value})",
+    "uint16": "putShort((short) {value})",
+    "int16": "putShort({value})",
+    "uint32": "putInt((int) {value})",
+    "int32": "putInt({value})",
+    "float32": "putFloat({value})",
+}
+
+
+def _is_byte_buffer_type(type_name: str, strategy: EncodingStrategy) -> bool:
+    """Check if a builtin type is written by ByteBuffer exactly as Encoder does."""
+    if type_name not in _BYTE_BUFFER_PUTS:
+        return False
+    if type_name == "bool":
+        return (
+            strategy.get_encoded_size("bool", 1) == 1
+            and strategy.bool_true_value == 1
+            and strategy.bool_false_value == 0
+        )
+    return strategy.is_raw_little_endian(type_name)
+
+
+def uses_byte_buffer_encode(
+    fields: Sequence[FieldBase], type_registry: TypeRegistry, strategy: EncodingStrategy
+) -> bool:
+    """Check if encode() can be a single ByteBuffer put chain.
+
+    Every field must be a non-array builtin primitive that the protocol sends
+    as raw little-endian bytes (Binary, not SysEx 7-bit).
+    """
+    if not fields:
+        return False
+    for field in fields:
+        if not isinstance(field, PrimitiveField) or field.is_array():
+            return False
+        type_name = field.type_name.value
+        if not type_registry.get(type_name).is_builtin:
+            return False
+        if not _is_byte_buffer_type(type_name, strategy):
+            return False
+    return True
+
+
+def _generate_byte_buffer_encode_body(
+    fields: Sequence[FieldBase], include_message_name: bool
+) -> list[str]:
+    """Generate encode() body as one chained ByteBuffer write."""
+    puts: list[str] = []
+    if include_message_name:
+        puts.append("put((byte) MESSAGE_NAME_BYTES.length)")
+        puts.append("put(MESSAGE_NAME_BYTES)")
+    for field in fields:
+        assert isinstance(field, PrimitiveField)
+        puts.append(_BYTE_BUFFER_PUTS[field.type_name.value].format(value=field.name))
+
+    lines = [
+        "        ByteBuffer bb = ByteBuffer.wrap(buffer, startOffset, MAX_PAYLOAD_SIZE)",
+        "            .order(ByteOrder.LITTLE_ENDIAN);",
+        f"        bb.{puts[0]}",
+    ]
+    lines.extend(f"            .{put}" for put in puts[1:])
+    lines[-1] += ";"
+    lines.append("        return bb.position() - startOffset;")
+    lines.append("    }")
+    lines.append("")
+    return lines
+
+
 # ============================================================================
 # ENCODE METHOD GENERATION
 # ============================================================================
 
 
+# Fixed runs of encode() lines, shared by every generated message. The Javadoc
+# summary line comes first, from _ENCODE_SUMMARIES (one per encode path).
+_ENCODE_SUMMARIES = {
+    "stream": "     * Encode message directly into provided buffer (zero allocation)",
+    "byte_buffer": "     * Encode message directly into provided buffer (allocates one ByteBuffer view)",
+    "table": "     * Encode message directly into provided buffer (allocates one long[] of field bits)",
+}
+_ENCODE_SIGNATURE = (
+    "     *",
+    "     * @param buffer Output buffer (must have enough space)",
+    "     * @param startOffset Starting position in buffer",
+    "     * @return Number of bytes written",
+    "     */",
+    "    public int encode(byte[] buffer, int startOffset) {",
+)
+_ENCODE_OFFSET_INIT = (
+    "        int offset = startOffset;",
+    "",
+)
+_ENCODE_NAME_PREFIX = (
+    "        // Encode MESSAGE_NAME prefix",
+    "        buffer[offset++] = (byte) MESSAGE_NAME_BYTES.length;",
+    "        System.arraycopy(MESSAGE_NAME_BYTES, 0, buffer, offset, MESSAGE_NAME_BYTES.length);",
+    "        offset += MESSAGE_NAME_BYTES.length;",
+    "",
+)
+_ENCODE_RETURN = (
+    "        return offset - startOffset;",
+    "    }",
+    "",
+)
+
+
 def generate_encode_method(
     class_name: str,
     pascal_name: str,
@@ -415,9 +1041,18 @@ def generate_encode_method(
     string_max_length: int,
     strategy: EncodingStrategy,
     include_message_name: bool,
+    codec: FieldCodecLines | None = None,
+    table_codec_threshold: int = 0,
 ) -> str:
     """Generate encode() method calling Encoder (streaming, zero-allocation).
 
+    Messages with more than table_codec_threshold fields, all fixed-size
+    scalars, encode through a static SCHEMA table and StructCodec.encodeStruct()
+    instead (smaller class files, one long[] per call). Otherwise, messages made
+    only of scalar primitives on a raw little-endian protocol encode as a single
+    ByteBuffer put chain (one ByteBuffer wrapper per call). The Javadoc states
+    which of these allocations the generated encode() makes.
+
     Args:
         class_name: The Java class name
         pascal_name: PascalCase message name
@@ -426,181 +1061,59 @@ def generate_encode_method(
         string_max_length: Max string length from protocol config
         strategy: Encoding strategy (Binary or SysEx)
         include_message_name: Whether to include MESSAGE_NAME prefix in payload
+        codec: Precomputed walk_field_codecs() result (walked here if None)
+        table_codec_threshold: Field count above which encode is table-driven (0 = never)
     """
     # Calculate max payload size using PayloadCalculator
     name_prefix_size = (1 + len(pascal_name)) if include_message_name else 0
     calculator = PayloadCalculator(strategy, type_registry)
     max_size = calculator.calculate_max_payload_size(fields, string_max_length, name_prefix_size)
 
-    lines: list[str] = ["    // ============================================================================"]
-    lines.append("    // Encoding")
-    lines.append("    // ============================================================================")
-    lines.append("")
+    lines = _section_banner("Encoding")
     lines.append("    /**")
     lines.append(f"     * Maximum payload size in bytes ({strategy.description})")
     lines.append("     */")
     lines.append(f"    public static final int MAX_PAYLOAD_SIZE = {max_size};")
     lines.append("")
 
-    # Generate encode(buffer, offset) method - streaming, zero-allocation
-    lines.append("    /**")
-    lines.append("     * Encode message directly into provided buffer (zero allocation)")
-    lines.append("     *")
-    lines.append("     * @param buffer Output buffer (must have enough space)")
-    lines.append("     * @param startOffset Starting position in buffer")
-    lines.append("     * @return Number of bytes written")
-    lines.append("     */")
-    lines.append("    public int encode(byte[] buffer, int startOffset) {")
-    lines.append("        int offset = startOffset;")
-    lines.append("")
+    use_table = uses_table_codec(fields, type_registry, table_codec_threshold)
+    if use_table:
+        lines.extend(_generate_table_schema(fields, type_registry))
+
+    # Generate encode(buffer, offset) method
+    if use_table:
+        path = "table"
+    elif uses_byte_buffer_encode(fields, type_registry, strategy):
+        path = "byte_buffer"
+    else:
+        path = "stream"
+    lines.extend(["    /**", _ENCODE_SUMMARIES[path]])
+    lines.extend(_ENCODE_SIGNATURE)
+
+    if path == "byte_buffer":
+        lines.extend(_generate_byte_buffer_encode_body(fields, include_message_name))
+        return "\n".join(lines)
+
+    lines.extend(_ENCODE_OFFSET_INIT)
 
     # Conditionally encode MESSAGE_NAME
     if include_message_name:
-        lines.append("        // Encode MESSAGE_NAME prefix")
-        lines.append("        buffer[offset++] = (byte) MESSAGE_NAME.length();")
-        lines.append("        for (int i = 0; i < MESSAGE_NAME.length(); i++) {")
-        lines.append("            buffer[offset++] = (byte) MESSAGE_NAME.charAt(i);")
-        lines.append("        }")
-        lines.append("")
+        lines.extend(_ENCODE_NAME_PREFIX)
 
     # Empty messages
     if not fields:
-        lines.append("        return offset - startOffset;")
-        lines.append("    }")
-        lines.append("")
+        lines.extend(_ENCODE_RETURN)
         return "\n".join(lines)
 
-    # Add encode calls for each field
-    for field in fields:
-        if isinstance(field, EnumField):
-            # Enum field - encode as uint8
-            # Bitflags are int (no getValue needed), regular enums use getValue()
-            is_bitflags = field.enum_def.is_bitflags
-            if field.is_array():
-                lines.append(
-                    f"        offset += Encoder.encodeUint8(buffer, offset, {field.name}.length);"
-                )
-                lines.append("")
-                java_type = field.enum_def.java_type
-                lines.append(f"        for ({java_type} item : {field.name}) {{")
-                if is_bitflags:
-                    lines.append("            offset += Encoder.encodeUint8(buffer, offset, item);")
-                else:
-                    lines.append(
-                        "            offset += Encoder.encodeUint8(buffer, offset, item.getValue());"
-                    )
-                lines.append("        }")
-                lines.append("")
-            else:
-                if is_bitflags:
-                    lines.append(
-                        f"        offset += Encoder.encodeUint8(buffer, offset, {field.name});"
-                    )
-                else:
-                    lines.append(
-                        f"        offset += Encoder.encodeUint8(buffer, offset, {field.name}.getValue());"
-                    )
-        elif isinstance(field, PrimitiveField):
-            field_type_name = field.type_name.value
-            if field.is_array():
-                # Primitive arrays use .length (no boxing)
-                lines.append(
-                    f"        offset += Encoder.encodeUint8(buffer, offset, {field.name}.length);"
-                )
-                lines.append("")
-                lines.append(
-                    f"        for ({get_java_type(field_type_name, type_registry)} item : {field.name}) {{"
-                )
-                encoder_call = get_encoder_call("item", field_type_name, type_registry)
-                lines.append(f"            {encoder_call}")
-                lines.append("        }")
-                lines.append("")
-            else:
-                encoder_call = get_encoder_call(field.name, field_type_name, type_registry)
-                lines.append(f"        {encoder_call}")
-        elif isinstance(field, CompositeField):
-            # Composite field
-            if field.array:
-                lines.append(
-                    f"        offset += Encoder.encodeUint8(buffer, offset, {field.name}.length);"
-                )
-                lines.append("")
-                class_name_inner = field_to_pascal_case(field.name)
-                lines.append(f"        for ({class_name_inner} item : {field.name}) {{")
-                for nested_field in field.fields:
-                    if isinstance(nested_field, EnumField):
-                        getter_name = to_getter_name(nested_field.name)
-                        is_bitflags = nested_field.enum_def.is_bitflags
-                        if nested_field.is_array():
-                            java_type = nested_field.enum_def.java_type
-                            lines.append(
-                                f"            offset += Encoder.encodeUint8(buffer, offset, item.{getter_name}().length);"
-                            )
-                            lines.append(f"            for ({java_type} e : item.{getter_name}()) {{")
-                            if is_bitflags:
-                                lines.append(
-                                    "                offset += Encoder.encodeUint8(buffer, offset, e);"
-                                )
-                            else:
-                                lines.append(
-                                    "                offset += Encoder.encodeUint8(buffer, offset, e.getValue());"
-                                )
-                            lines.append("            }")
-                        else:
-                            if is_bitflags:
-                                lines.append(
-                                    f"            offset += Encoder.encodeUint8(buffer, offset, item.{getter_name}());"
-                                )
-                            else:
-                                lines.append(
-                                    f"            offset += Encoder.encodeUint8(buffer, offset, item.{getter_name}().getValue());"
-                                )
-                    elif isinstance(nested_field, PrimitiveField):
-                        getter_name = to_getter_name(nested_field.name)
-                        if nested_field.is_array():
-                            java_type = get_java_type(nested_field.type_name.value, type_registry)
-                            lines.append(
-                                f"            offset += Encoder.encodeUint8(buffer, offset, item.{getter_name}().length);"
-                            )
-                            lines.append(f"            for ({java_type} type : item.{getter_name}()) {{")
-                            encoder_call = get_encoder_call(
-                                "type", nested_field.type_name.value, type_registry
-                            )
-                            lines.append(f"                {encoder_call}")
-                            lines.append("            }")
-                        else:
-                            encoder_call = get_encoder_call(
-                                f"item.{getter_name}()", nested_field.type_name.value, type_registry
-                            )
-                            lines.append(f"            {encoder_call}")
-                lines.append("        }")
-                lines.append("")
-            else:
-                for nested_field in field.fields:
-                    if isinstance(nested_field, EnumField):
-                        getter_name = to_getter_name(nested_field.name)
-                        is_bitflags = nested_field.enum_def.is_bitflags
-                        if is_bitflags:
-                            lines.append(
-                                f"        offset += Encoder.encodeUint8(buffer, offset, {field.name}.{getter_name}());"
-                            )
-                        else:
-                            lines.append(
-                                f"        offset += Encoder.encodeUint8(buffer, offset, {field.name}.{getter_name}().getValue());"
-                            )
-                    elif isinstance(nested_field, PrimitiveField):
-                        getter_name = to_getter_name(nested_field.name)
-                        encoder_call = get_encoder_call(
-                            f"{field.name}.{getter_name}()",
-                            nested_field.type_name.value,
-                            type_registry,
-                        )
-                        lines.append(f"        {encoder_call}")
+    if use_table:
+        lines.extend(_generate_table_encode_body(fields, type_registry))
+    else:
+        if codec is None:
+            codec = walk_field_codecs(fields, type_registry, strategy)
+        lines.extend(codec.encode)
 
     lines.append("")
-    lines.append("        return offset - startOffset;")
-    lines.append("    }")
-    lines.append("")
+    lines.extend(_ENCODE_RETURN)
 
     return "\n".join(lines)
 
@@ -610,12 +1123,19 @@ def generate_encode_method(
 # ============================================================================
 
 
+# Decoder method name per builtin type, built once at import
+_DECODER_NAMES: dict[str, str] = {
+    type_name: f"decode{capitalize_first(type_name)}" for type_name in BUILTIN_TYPES
+}
+
+
 def get_decoder_call(
     field_name: str,
     field_type: str,
     java_type: str,
     type_registry: TypeRegistry,
     get_encoded_size: Callable[[str, int], int],
+    indent: str = "        ",
 ) -> str:
     """
     Generate Decoder method call for decoding a field.
@@ -626,31 +1146,38 @@ def get_decoder_call(
         java_type: Java type string
         type_registry: TypeRegistry for type lookup
         get_encoded_size: Function to get encoded size for a type
+        indent: Indentation of the offset line (the caller indents the first line)
 
     Returns:
         Java code lines calling appropriate Decoder method
     """
     base_type = field_type.split("[")[0]
 
+    # Builtins: Decoder.decodeXXX() from the precomputed table, no registry lookup
+    decoder_name = _DECODER_NAMES.get(base_type)
+    if decoder_name is not None:
+        if base_type == "string":
+            # String decoder takes buffer, offset, and maxLength
+            return f"{java_type} {field_name} = Decoder.{decoder_name}(data, offset, ProtocolConstants.STRING_MAX_LENGTH);\n{indent}offset += 1 + {field_name}.length();"
+        # Other types - calculate size based on type
+        encoded_size = get_encoded_size(base_type, 0)
+        return f"{java_type} {field_name} = Decoder.{decoder_name}(data, offset);\n{indent}offset += {encoded_size};"
+
     if not type_registry.is_atomic(base_type):
         raise ValueError(f"Unknown type: {base_type}")
+    if type_registry.get(base_type).is_builtin:
+        raise ValueError(f"Missing Decoder method for builtin type: {base_type}")
 
-    atomic = type_registry.get(base_type)
+    # Nested struct - call its decode()
+    return f"{java_type} {field_name} = {java_type}.decode(data);\n{indent}offset += {java_type}.MAX_PAYLOAD_SIZE;"
 
-    if atomic.is_builtin:
-        # Call Decoder.decodeXXX() - uniform naming with C++
-        decoder_name = f"decode{capitalize_first(base_type)}"
 
-        if base_type == "string":
-            # String decoder takes buffer, offset, and maxLength
-            return f"{java_type} {field_name} = Decoder.{decoder_name}(data, offset, ProtocolConstants.STRING_MAX_LENGTH);\n        offset += 1 + {field_name}.length();"
-        else:
-            # Other types - calculate size based on type
-            encoded_size = get_encoded_size(base_type, 0)
-            return f"{java_type} {field_name} = Decoder.{decoder_name}(data, offset);\n        offset += {encoded_size};"
-    else:
-        # Nested struct - call its decode()
-        return f"{java_type} {field_name} = {java_type}.decode(data);\n        offset += {java_type}.MAX_PAYLOAD_SIZE;"
+# Fixed run of decode() lines skipping the MESSAGE_NAME prefix
+_DECODE_NAME_SKIP = (
+    "        // Skip MESSAGE_NAME prefix",
+    "        int nameLen = Decoder.decodeUint8(data, offset);",
+    "        offset += 1 + nameLen;",
+)
 
 
 def generate_decode_method(
@@ -661,9 +1188,15 @@ def generate_decode_method(
     string_max_length: int,
     strategy: EncodingStrategy,
     include_message_name: bool,
+    table_codec_threshold: int = 0,
+    codec: FieldCodecLines | None = None,
 ) -> str:
     """Generate static decode() factory method.
 
+    Messages with more than table_codec_threshold fields, all fixed-size
+    scalars, decode through the SCHEMA table (emitted with encode()) and
+    StructCodec.decodeStruct() instead of unrolled per-field code.
+
     Args:
         class_name: The Java class name
         pascal_name: PascalCase message name
@@ -672,20 +1205,15 @@ def generate_decode_method(
         string_max_length: Max string length from protocol config
         strategy: Encoding strategy (Binary or SysEx)
         include_message_name: Whether MESSAGE_NAME prefix is in payload
+        table_codec_threshold: Field count above which decode is table-driven (0 = never)
+        codec: Precomputed walk_field_codecs() result (walked here if None)
     """
     # Calculate min payload size using PayloadCalculator
     name_prefix_size = (1 + len(pascal_name)) if include_message_name else 0
     calculator = PayloadCalculator(strategy, type_registry)
     min_size = calculator.calculate_min_payload_size(fields, string_max_length, name_prefix_size)
 
-    # Create a closure for get_encoded_size that uses the strategy
-    def _get_encoded_size(type_name: str, raw_size: int) -> int:
-        return strategy.get_encoded_size(type_name, raw_size)
-
-    lines: list[str] = ["    // ============================================================================"]
-    lines.append("    // Decoding")
-    lines.append("    // ============================================================================")
-    lines.append("")
+    lines = _section_banner("Decoding")
 
     # Simplified decode for empty messages
     if not fields:
@@ -700,7 +1228,9 @@ def generate_decode_method(
             lines.append("     * Decode message from bytes (no fields, with name prefix)")
             lines.append("     * @param data Input buffer")
             lines.append(f"     * @return New {class_name} instance")
-            lines.append("     * @throws IllegalArgumentException if data is invalid or insufficient")
+            lines.append(
+                "     * @throws IllegalArgumentException if data is invalid or insufficient"
+            )
             lines.append("     */")
             lines.append(f"    public static {class_name} decode(byte[] data) {{")
             lines.append("        if (data.length < MIN_PAYLOAD_SIZE) {")
@@ -710,8 +1240,7 @@ def generate_decode_method(
             lines.append("        }")
             lines.append("        // Skip MESSAGE_NAME prefix")
             lines.append("        int offset = 0;")
-            lines.append("        int nameLen = Decoder.decodeUint8(data, offset);")
-            lines.append("        offset += 1 + nameLen;")
+            lines.extend(_DECODE_NAME_SKIP[1:])
             lines.append(f"        return new {class_name}();")
             lines.append("    }")
             lines.append("")
@@ -735,6 +1264,8 @@ def generate_decode_method(
     lines.append(f"    private static final int MIN_PAYLOAD_SIZE = {min_size};")
     lines.append("")
 
+    use_table = uses_table_codec(fields, type_registry, table_codec_threshold)
+
     # Standard decode for messages with fields
     lines.append("    /**")
     lines.append("     * Decode message from MIDI-safe bytes")
@@ -755,211 +1286,21 @@ def generate_decode_method(
 
     # Conditionally skip MESSAGE_NAME prefix
     if include_message_name:
-        lines.append("        // Skip MESSAGE_NAME prefix")
-        lines.append("        int nameLen = Decoder.decodeUint8(data, offset);")
-        lines.append("        offset += 1 + nameLen;")
+        lines.extend(_DECODE_NAME_SKIP)
         lines.append("")
 
-    # Add decode calls for each field
-    field_vars: list[str] = []
-    for field in fields:
-        if isinstance(field, EnumField):
-            # Enum field - decode uint8 and convert to enum
-            # Bitflags are int (no fromValue needed), regular enums use fromValue()
-            java_type = field.enum_def.java_type
-            is_bitflags = field.enum_def.is_bitflags
-            if field.is_array():
-                lines.append(f"        int count_{field.name} = Decoder.decodeUint8(data, offset);")
-                lines.append("        offset += 1;")
-                lines.append("")
-                lines.append(f"        {java_type}[] {field.name} = new {java_type}[count_{field.name}];")
-                lines.append(f"        for (int i = 0; i < count_{field.name}; i++) {{")
-                if is_bitflags:
-                    lines.append(f"            {field.name}[i] = Decoder.decodeUint8(data, offset);")
-                else:
-                    lines.append(
-                        f"            {field.name}[i] = {java_type}.fromValue(Decoder.decodeUint8(data, offset));"
-                    )
-                lines.append("            offset += 1;")
-                lines.append("        }")
-                lines.append("")
-            else:
-                if is_bitflags:
-                    lines.append(f"        {java_type} {field.name} = Decoder.decodeUint8(data, offset);")
-                else:
-                    lines.append(
-                        f"        {java_type} {field.name} = {java_type}.fromValue(Decoder.decodeUint8(data, offset));"
-                    )
-                lines.append("        offset += 1;")
-                lines.append("")
-            field_vars.append(field.name)
-        elif isinstance(field, PrimitiveField):
-            field_type_name = field.type_name.value
-            java_type = get_java_type(field_type_name, type_registry)
-            if field.is_array():
-                # Primitive array - use T[] (no boxing, zero-allocation)
-                lines.append(f"        int count_{field.name} = Decoder.decodeUint8(data, offset);")
-                lines.append("        offset += 1;")
-                lines.append("")
-                lines.append(f"        {java_type}[] {field.name} = new {java_type}[count_{field.name}];")
-                lines.append(f"        for (int i = 0; i < count_{field.name}; i++) {{")
-                # Generate array assignment directly (avoid variable declaration)
-                decoder_name = f"decode{capitalize_first(field_type_name)}"
-                if field_type_name == "string":
-                    lines.append(
-                        f"            {field.name}[i] = Decoder.{decoder_name}(data, offset, ProtocolConstants.STRING_MAX_LENGTH);"
-                    )
-                    lines.append(f"            offset += 1 + {field.name}[i].length();")
-                else:
-                    encoded_size = _get_encoded_size(field_type_name, 0)
-                    lines.append(f"            {field.name}[i] = Decoder.{decoder_name}(data, offset);")
-                    lines.append(f"            offset += {encoded_size};")
-                lines.append("        }")
-                lines.append("")
-                field_vars.append(field.name)
-            else:
-                # Scalar primitive
-                decoder_call = get_decoder_call(
-                    field.name, field_type_name, java_type, type_registry, _get_encoded_size
-                )
-                lines.append(f"        {decoder_call}")
-                field_vars.append(field.name)
-        elif isinstance(field, CompositeField):
-            if field.array:
-                # Decode array count
-                lines.append(f"        int count_{field.name} = Decoder.decodeUint8(data, offset);")
-                lines.append("        offset += 1;")
-                lines.append("")
-                # Decode items into array (aligned with C++ std::array)
-                composite_class = field_to_pascal_case(field.name)
-                lines.append(
-                    f"        {composite_class}[] {field.name} = new {composite_class}[count_{field.name}];"
-                )
-                lines.append(f"        for (int i = 0; i < count_{field.name}; i++) {{")
-                # Decode each nested field
-                for nested_field in field.fields:
-                    if isinstance(nested_field, EnumField):
-                        # Nested enum field
-                        nested_java_type = nested_field.enum_def.java_type
-                        is_bitflags = nested_field.enum_def.is_bitflags
-                        if nested_field.is_array():
-                            lines.append(
-                                f"            byte count_{nested_field.name} = (byte) Decoder.decodeUint8(data, offset);"
-                            )
-                            lines.append("            offset += 1;")
-                            lines.append(
-                                f"            {nested_java_type}[] item_{nested_field.name} = new {nested_java_type}[count_{nested_field.name}];"
-                            )
-                            lines.append(
-                                f"            for (int j = 0; j < count_{nested_field.name} && j < {nested_field.array}; j++) {{"
-                            )
-                            if is_bitflags:
-                                lines.append(
-                                    f"                item_{nested_field.name}[j] = Decoder.decodeUint8(data, offset);"
-                                )
-                            else:
-                                lines.append(
-                                    f"                item_{nested_field.name}[j] = {nested_java_type}.fromValue(Decoder.decodeUint8(data, offset));"
-                                )
-                            lines.append("                offset += 1;")
-                            lines.append("            }")
-                        else:
-                            if is_bitflags:
-                                lines.append(
-                                    f"            {nested_java_type} item_{nested_field.name} = Decoder.decodeUint8(data, offset);"
-                                )
-                            else:
-                                lines.append(
-                                    f"            {nested_java_type} item_{nested_field.name} = {nested_java_type}.fromValue(Decoder.decodeUint8(data, offset));"
-                                )
-                            lines.append("            offset += 1;")
-                    elif isinstance(nested_field, PrimitiveField):
-                        java_type = get_java_type(nested_field.type_name.value, type_registry)
-                        if nested_field.is_array():
-                            # Nested array of primitives - decode count for dynamic arrays
-                            lines.append(
-                                f"            byte count_{nested_field.name} = (byte) Decoder.decodeUint8(data, offset);"
-                            )
-                            lines.append("            offset += 1;")
-                            lines.append(
-                                f"            {java_type}[] item_{nested_field.name} = new {java_type}[count_{nested_field.name}];"
-                            )
-                            lines.append(
-                                f"            for (int j = 0; j < count_{nested_field.name} && j < {nested_field.array}; j++) {{"
-                            )
-                            decoder_call = get_decoder_call(
-                                f"item_{nested_field.name}_j",
-                                nested_field.type_name.value,
-                                java_type,
-                                type_registry,
-                                _get_encoded_size,
-                            )
-                            # Indent by 16 spaces (4 levels)
-                            for line in decoder_call.split("\n"):
-                                lines.append(f"        {line}")
-                            lines.append(f"                item_{nested_field.name}[j] = item_{nested_field.name}_j;")
-                            lines.append("            }")
-                        else:
-                            decoder_call = get_decoder_call(
-                                f"item_{nested_field.name}",
-                                nested_field.type_name.value,
-                                java_type,
-                                type_registry,
-                                _get_encoded_size,
-                            )
-                            for line in decoder_call.split("\n"):
-                                lines.append(f"    {line}")
-                # Construct item and assign to array
-                item_params: list[str] = []
-                for nested_field in field.fields:
-                    if isinstance(nested_field, (EnumField, PrimitiveField)):
-                        item_params.append(f"item_{nested_field.name}")
-                item_params_str = ", ".join(item_params)
-                lines.append(
-                    f"            {field.name}[i] = new {field_to_pascal_case(field.name)}({item_params_str});"
-                )
-                lines.append("        }")
-                lines.append("")
-                field_vars.append(field.name)
-            else:
-                # Single composite - decode nested fields
-                for nested_field in field.fields:
-                    if isinstance(nested_field, EnumField):
-                        nested_java_type = nested_field.enum_def.java_type
-                        is_bitflags = nested_field.enum_def.is_bitflags
-                        if is_bitflags:
-                            lines.append(
-                                f"        {nested_java_type} {field.name}_{nested_field.name} = Decoder.decodeUint8(data, offset);"
-                            )
-                        else:
-                            lines.append(
-                                f"        {nested_java_type} {field.name}_{nested_field.name} = {nested_java_type}.fromValue(Decoder.decodeUint8(data, offset));"
-                            )
-                        lines.append("        offset += 1;")
-                    elif isinstance(nested_field, PrimitiveField):
-                        java_type = get_java_type(nested_field.type_name.value, type_registry)
-                        decoder_call = get_decoder_call(
-                            f"{field.name}_{nested_field.name}",
-                            nested_field.type_name.value,
-                            java_type,
-                            type_registry,
-                            _get_encoded_size,
-                        )
-                        lines.append(f"        {decoder_call}")
-                # Construct composite
-                composite_params: list[str] = []
-                for nested_field in field.fields:
-                    if isinstance(nested_field, (EnumField, PrimitiveField)):
-                        composite_params.append(f"{field.name}_{nested_field.name}")
-                composite_params_str = ", ".join(composite_params)
-                lines.append(
-                    f"        {field_to_pascal_case(field.name)} {field.name} = new {field_to_pascal_case(field.name)}({composite_params_str});"
-                )
-                lines.append("")
-                field_vars.append(field.name)
+    if use_table:
+        lines.extend(_generate_table_decode_body(class_name, fields, type_registry))
+        lines.append("    }")
+        lines.append("")
+        return "\n".join(lines)
+
+    if codec is None:
+        codec = walk_field_codecs(fields, type_registry, strategy)
+    lines.extend(codec.decode)
 
     # Construct and return instance
-    field_list = ", ".join(field_vars)
+    field_list = ", ".join(codec.decode_vars)
     lines.append("")
     lines.append(f"        return new {class_name}({field_list});")
     lines.append("    }")
@@ -992,113 +1333,73 @@ def generate_inner_classes(
     Returns empty string if no composites found.
     Safety: Max depth 3 to prevent infinite recursion.
     """
+    classes: list[str] = []
+    _collect_inner_classes(fields, type_registry, depth, classes)
+    return "\n".join(classes)
+
+
+def _collect_inner_classes(
+    fields: Sequence[FieldBase], type_registry: TypeRegistry, depth: int, classes: list[str]
+) -> None:
+    """Append inner classes depth-first into one shared list (joined once at the top)."""
     if depth > 3:
-        return ""
+        return
 
-    classes: list[str] = []
     for field in fields:
-        if isinstance(field, CompositeField):
+        if type(field) is CompositeField:
             # Generate nested composites first (depth-first like C++)
-            nested = generate_inner_classes(field.fields, type_registry, depth + 1)
-            if nested:
-                classes.append(nested)
-
-            # Generate this composite class
-            class_code = generate_single_inner_class(field, type_registry)
-            classes.append(class_code)
+            _collect_inner_classes(field.fields, type_registry, depth + 1, classes)
+            classes.append(generate_single_inner_class(field, type_registry))
         # EnumField and PrimitiveField don't need inner classes
 
-    return "\n".join(classes)
 
+# Field class -> inner-class member type resolver (nested composites are List<T>)
+_INNER_MEMBER_TYPES: dict[type[FieldBase], Callable[[Any, TypeRegistry], str]] = {
+    PrimitiveField: _primitive_member_type,
+    EnumField: _enum_member_type,
+    CompositeField: _composite_list_member_type,
+}
 
-def generate_single_inner_class(field: CompositeField, type_registry: TypeRegistry) -> str:
-    """Generate a single inner static class for a composite field."""
-    class_name = field_to_pascal_case(field.name)
 
-    lines: list[str] = [
-        "    // ============================================================================",
-        f"    // Inner Class: {class_name}",
-        "    // ============================================================================",
-        "",
-        f"    public static final class {class_name} {{",
-    ]
-
-    # Fields
-    for nested_field in field.fields:
-        if isinstance(nested_field, PrimitiveField):
-            java_type = get_java_type(nested_field.type_name.value, type_registry)
-            if nested_field.is_array():
-                # Primitive array in inner class (e.g., childrenTypes which is uint8[4])
-                lines.append(f"        private final {java_type}[] {nested_field.name};")
-            else:
-                lines.append(f"        private final {java_type} {nested_field.name};")
-        elif isinstance(nested_field, EnumField):
-            # Enum field - use the enum's Java type (handles bitflags → int)
-            java_type = nested_field.enum_def.java_type
-            if nested_field.is_array():
-                lines.append(f"        private final {java_type}[] {nested_field.name};")
-            else:
-                lines.append(f"        private final {java_type} {nested_field.name};")
-        elif isinstance(nested_field, CompositeField):  # Nested composite
-            nested_class_name = field_to_pascal_case(nested_field.name)
-            if nested_field.array:
-                lines.append(f"        private final List<{nested_class_name}> {nested_field.name};")
-            else:
-                lines.append(f"        private final {nested_class_name} {nested_field.name};")
+def generate_single_inner_class(field: CompositeField, type_registry: TypeRegistry) -> str:
+    """Generate a single inner static class for a composite field.
 
-    lines.append("")
+    Members are resolved once and fed to the field declarations, constructor
+    and getters in a single pass.
+    """
+    class_name = field_to_pascal_case(field.name)
 
-    # Constructor
+    declarations: list[str] = []
     params: list[str] = []
+    assignments: list[str] = []
+    getters: list[str] = []
     for nested_field in field.fields:
-        if isinstance(nested_field, PrimitiveField):
-            java_type = get_java_type(nested_field.type_name.value, type_registry)
-            if nested_field.is_array():
-                params.append(f"{java_type}[] {nested_field.name}")
-            else:
-                params.append(f"{java_type} {nested_field.name}")
-        elif isinstance(nested_field, EnumField):
-            java_type = nested_field.enum_def.java_type
-            if nested_field.is_array():
-                params.append(f"{java_type}[] {nested_field.name}")
-            else:
-                params.append(f"{java_type} {nested_field.name}")
-        elif isinstance(nested_field, CompositeField):
-            nested_class_name = field_to_pascal_case(nested_field.name)
-            if nested_field.array:
-                params.append(f"List<{nested_class_name}> {nested_field.name}")
-            else:
-                params.append(f"{nested_class_name} {nested_field.name}")
-
-    param_str = ", ".join(params)
-    lines.append(f"        public {class_name}({param_str}) {{")
-    for nested_field in field.fields:
-        lines.append(f"            this.{nested_field.name} = {nested_field.name};")
-    lines.append("        }")
-    lines.append("")
-
-    # Getters
-    for nested_field in field.fields:
-        getter_name = to_getter_name(nested_field.name)
-        if isinstance(nested_field, PrimitiveField):
-            java_type = get_java_type(nested_field.type_name.value, type_registry)
-            if nested_field.is_array():
-                java_type = f"{java_type}[]"
-        elif isinstance(nested_field, EnumField):
-            enum_java_type = nested_field.enum_def.java_type
-            java_type = f"{enum_java_type}[]" if nested_field.is_array() else enum_java_type
-        elif isinstance(nested_field, CompositeField):
-            nested_class_name = field_to_pascal_case(nested_field.name)
-            java_type = f"List<{nested_class_name}>" if nested_field.array else nested_class_name
-        else:
+        member_type = _INNER_MEMBER_TYPES.get(type(nested_field))
+        if member_type is None:
             raise TypeError(f"Unknown field type: {type(nested_field)}")
+        java_type = member_type(nested_field, type_registry)
+        name = nested_field.name
+
+        declarations.append(f"        private final {java_type} {name};")
+        params.append(f"{java_type} {name}")
+        assignments.append(f"            this.{name} = {name};")
+        getters.append(
+            f"        public {java_type} {to_getter_name(name)}() {{\n"
+            f"            return {name};\n"
+            "        }\n"
+        )
 
-        lines.append(f"        public {java_type} {getter_name}() {{")
-        lines.append(f"            return {nested_field.name};")
-        lines.append("        }")
-        lines.append("")
-
-    lines.append("    }")
-    lines.append("")
-
+    lines = [
+        *_section_banner(f"Inner Class: {class_name}"),
+        f"    public static final class {class_name} {{",
+        *declarations,
+        "",
+        f"        public {class_name}({', '.join(params)}) {{",
+        *assignments,
+        "        }",
+        "",
+        *getters,
+        "    }",
+        "",
+    ]
     return "\n".join(lines)
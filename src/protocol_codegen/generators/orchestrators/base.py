@@ -17,6 +17,8 @@ import importlib.util
 import io
 import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
@@ -34,20 +36,23 @@ from protocol_codegen.core.message import Message
 from protocol_codegen.core.plugin_types import PluginPathsConfig
 from protocol_codegen.core.validator import ProtocolValidator
 from protocol_codegen.generators.core.config import ProtocolConfig
-from protocol_codegen.generators.core.naming import to_pascal_case
 from protocol_codegen.generators.languages.cpp import CppBackend
 from protocol_codegen.generators.languages.cpp.file_generators import (
+    generate_all_composite_hpp,
+    generate_all_enum_hpp,
+    generate_all_struct_hpp,
     generate_constants_hpp,
     generate_decoder_registry_hpp,
-    generate_enum_hpp,
+    generate_message_base_hpp,
     generate_message_structure_hpp,
     generate_messageid_hpp,
     generate_protocol_callbacks_hpp,
     generate_protocol_methods_hpp,
-    generate_struct_hpp,
+    needs_message_base,
 )
 from protocol_codegen.generators.languages.java import JavaBackend
 from protocol_codegen.generators.languages.java.file_generators import (
+    generate_all_struct_java,
     generate_constants_java,
     generate_decoder_registry_java,
     generate_enum_java,
@@ -55,11 +60,14 @@ from protocol_codegen.generators.languages.java.file_generators import (
     generate_messageid_java,
     generate_protocol_callbacks_java,
     generate_protocol_methods_java,
-    generate_struct_java,
 )
 from protocol_codegen.generators.orchestrators.common import collect_enum_defs
 from protocol_codegen.generators.orchestrators.protocol_components import ProtocolComponents
-from protocol_codegen.generators.templates import DecoderTemplate, EncoderTemplate
+from protocol_codegen.generators.templates import (
+    DecoderTemplate,
+    EncoderTemplate,
+    StructCodecTemplate,
+)
 
 if TYPE_CHECKING:
     from types import ModuleType
@@ -75,6 +83,9 @@ class LimitsProtocol(Protocol):
     @property
     def include_message_name(self) -> bool: ...
 
+    @property
+    def table_codec_threshold(self) -> int: ...
+
 
 @runtime_checkable
 class ProtocolConfigProtocol(Protocol):
@@ -103,8 +114,9 @@ class BaseProtocolGenerator[ConfigT: ProtocolConfigProtocol](ABC):
     - Protocol-specific validation via _validate_protocol_specific()
     """
 
-    def __init__(self, verbose: bool = False) -> None:
+    def __init__(self, verbose: bool = False, jobs: int | None = 1) -> None:
         self.verbose = verbose
+        self.jobs = jobs
         self.registry: TypeRegistry | None = None
         self.protocol_config: ConfigT | None = None
         self.plugin_paths: PluginPathsConfig | None = None
@@ -196,19 +208,36 @@ class BaseProtocolGenerator[ConfigT: ProtocolConfigProtocol](ABC):
         # Step 5: Allocate message IDs
         self._step5_allocate_ids()
 
-        # Step 6: Generate C++ code
-        self._log("[6/7] Generating C++ code...")
-        self._generate_cpp(output_base)
+        # Steps 6-7 share one worker pool, so process start-up is paid once
+        with self._open_worker_pool() as executor:
+            # Step 6: Generate C++ code
+            self._log("[6/7] Generating C++ code...")
+            self._generate_cpp(output_base, executor)
+
+            # Step 7: Generate Java code
+            self._log("[7/7] Generating Java code...")
+            self._generate_java(output_base, executor)
 
-        # Step 7: Generate Java code
-        self._log("[7/7] Generating Java code...")
-        self._generate_java(output_base)
+    def _open_worker_pool(self) -> AbstractContextManager[Executor | None]:
+        """
+        Open the process pool shared by the per-message and per-enum batches.
+
+        Workers re-populate the Type enum once at start-up. With jobs=1 no
+        pool is created and every batch is generated in-process.
+        """
+        if self.jobs == 1 or self.registry is None:
+            return nullcontext()
+        return ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=populate_type_names,
+            initargs=(list(self.registry.types.keys()),),
+        )
 
     # =========================================================================
     # UNIFIED C++ GENERATION
     # =========================================================================
 
-    def _generate_cpp(self, output_base: Path) -> None:
+    def _generate_cpp(self, output_base: Path, executor: Executor | None = None) -> None:
         """
         Generate all C++ files for this protocol.
 
@@ -216,6 +245,8 @@ class BaseProtocolGenerator[ConfigT: ProtocolConfigProtocol](ABC):
         Protocol-specific behavior is delegated to:
         - get_components() for encoding strategy and renderers
         - _convert_config_to_cpp() for config conversion
+
+        Batch generators run on executor when given (see _open_worker_pool()).
         """
         if self.registry is None or self.plugin_paths is None or self.protocol_config is None:
             raise RuntimeError("Generator not properly initialized")
@@ -300,11 +331,21 @@ class BaseProtocolGenerator[ConfigT: ProtocolConfigProtocol](ABC):
         )
         stats.record_write(cpp_protocol_template_path, was_written)
 
+        # MessageBase.hpp (shared codec of fieldless messages, only when one exists)
+        if needs_message_base(self.messages, self.protocol_config.limits.include_message_name):
+            cpp_message_base_path = cpp_base / "MessageBase.hpp"
+            was_written = write_if_changed(
+                cpp_message_base_path, generate_message_base_hpp(cpp_message_base_path)
+            )
+            stats.record_write(cpp_message_base_path, was_written)
+
         # Generate enum files
         enum_stats = GenerationStats()
-        for enum_def in self.enum_defs:
-            cpp_enum_path = cpp_base / f"{enum_def.name}.hpp"
-            cpp_enum_code = generate_enum_hpp(enum_def, cpp_enum_path)
+        cpp_enum_codes = generate_all_enum_hpp(
+            self.enum_defs, cpp_base, max_workers=self.jobs, executor=executor
+        )
+        for enum_name, cpp_enum_code in cpp_enum_codes.items():
+            cpp_enum_path = cpp_base / f"{enum_name}.hpp"
             was_written = write_if_changed(cpp_enum_path, cpp_enum_code)
             enum_stats.record_write(cpp_enum_path, was_written)
 
@@ -324,24 +365,33 @@ class BaseProtocolGenerator[ConfigT: ProtocolConfigProtocol](ABC):
         cpp_struct_dir.mkdir(parents=True, exist_ok=True)
 
         struct_stats = GenerationStats()
+        # Rendered first: conflicting composite definitions fail before any write
+        cpp_composite_codes = generate_all_composite_hpp(
+            self.messages, self.registry, strategy, max_workers=self.jobs, executor=executor
+        )
+        cpp_codes = generate_all_struct_hpp(
+            self.messages,
+            self.allocations,
+            self.registry,
+            cpp_struct_dir,
+            self.protocol_config.limits.string_max_length,
+            strategy,
+            self.protocol_config.limits.include_message_name,
+            max_workers=self.jobs,
+            executor=executor,
+        )
         for message in self.messages:
-            pascal_name = to_pascal_case(message.name)
-            struct_name = f"{pascal_name}Message"
-            cpp_output_path = cpp_struct_dir / f"{struct_name}.hpp"
-            message_id = self.allocations[message.name]
-
-            cpp_code = generate_struct_hpp(
-                message,
-                message_id,
-                self.registry,
-                cpp_output_path,
-                self.protocol_config.limits.string_max_length,
-                strategy,
-                self.protocol_config.limits.include_message_name,
-            )
-            was_written = write_if_changed(cpp_output_path, cpp_code)
+            cpp_output_path = cpp_struct_dir / f"{message.pascal_name}Message.hpp"
+            was_written = write_if_changed(cpp_output_path, cpp_codes[message.name])
             struct_stats.record_write(cpp_output_path, was_written)
 
+        # Composite structs: one shared header each, included by the messages
+        cpp_composite_dir = cpp_struct_dir / "composites"
+        for struct_name, composite_code in cpp_composite_codes.items():
+            cpp_composite_path = cpp_composite_dir / f"{struct_name}.hpp"
+            was_written = write_if_changed(cpp_composite_path, composite_code)
+            struct_stats.record_write(cpp_composite_path, was_written)
+
         if self.verbose:
             print(f"  ✓ C++ base files: {stats.summary()}")
             if self.enum_defs:
@@ -355,7 +405,7 @@ class BaseProtocolGenerator[ConfigT: ProtocolConfigProtocol](ABC):
     # UNIFIED JAVA GENERATION
     # =========================================================================
 
-    def _generate_java(self, output_base: Path) -> None:
+    def _generate_java(self, output_base: Path, executor: Executor | None = None) -> None:
         """
         Generate all Java files for this protocol.
 
@@ -363,6 +413,8 @@ class BaseProtocolGenerator[ConfigT: ProtocolConfigProtocol](ABC):
         Protocol-specific behavior is delegated to:
         - get_components() for encoding strategy and renderers
         - _convert_config_to_java() for config conversion
+
+        Batch generators run on executor when given (see _open_worker_pool()).
         """
         if self.registry is None or self.plugin_paths is None or self.protocol_config is None:
             raise RuntimeError("Generator not properly initialized")
@@ -400,6 +452,17 @@ class BaseProtocolGenerator[ConfigT: ProtocolConfigProtocol](ABC):
         )
         stats.record_write(java_decoder_path, was_written)
 
+        # StructCodec.java (only when table-driven message codecs are enabled)
+        table_codec_threshold = self.protocol_config.limits.table_codec_threshold
+        if table_codec_threshold > 0:
+            java_struct_codec_path = java_base / "StructCodec.java"
+            struct_codec_template = StructCodecTemplate(java_backend, strategy)
+            was_written = write_if_changed(
+                java_struct_codec_path,
+                struct_codec_template.generate(self.registry, java_struct_codec_path),
+            )
+            stats.record_write(java_struct_codec_path, was_written)
+
         # ProtocolConstants.java
         java_constants_path = java_base / "ProtocolConstants.java"
         was_written = write_if_changed(
@@ -488,23 +551,23 @@ class BaseProtocolGenerator[ConfigT: ProtocolConfigProtocol](ABC):
         java_struct_dir.mkdir(parents=True, exist_ok=True)
 
         struct_stats = GenerationStats()
+        java_codes = generate_all_struct_java(
+            self.messages,
+            self.allocations,
+            self.registry,
+            java_struct_dir,
+            self.protocol_config.limits.string_max_length,
+            struct_package,
+            strategy,
+            self.protocol_config.limits.include_message_name,
+            table_codec_threshold,
+            max_workers=self.jobs,
+            executor=executor,
+        )
         for message in self.messages:
-            pascal_name = to_pascal_case(message.name)
-            class_name = f"{pascal_name}Message"
+            class_name = f"{message.pascal_name}Message"
             java_output_path = java_struct_dir / f"{class_name}.java"
-            message_id = self.allocations[message.name]
-
-            java_code = generate_struct_java(
-                message,
-                message_id,
-                self.registry,
-                java_output_path,
-                self.protocol_config.limits.string_max_length,
-                struct_package,
-                strategy,
-                self.protocol_config.limits.include_message_name,
-            )
-            was_written = write_if_changed(java_output_path, java_code)
+            was_written = write_if_changed(java_output_path, java_codes[message.name])
             struct_stats.record_write(java_output_path, was_written)
 
         if self.verbose:
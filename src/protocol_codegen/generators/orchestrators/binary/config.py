@@ -45,6 +45,12 @@ class BinaryLimits(BaseModel):
         description="Include message name prefix in payload for bridge logging",
     )
 
+    table_codec_threshold: int = Field(
+        default=0,
+        ge=0,
+        description="Java encode()/decode() go through StructCodec above this many scalar fields (0 = disabled)",
+    )
+
 
 class BinaryStructure(BaseModel):
     """Message structure offsets for Binary protocol."""
@@ -87,6 +87,7 @@ def generate_binary_protocol(
     plugin_paths_path: Path,
     output_base: Path,
     verbose: bool = False,
+    jobs: int | None = 1,
 ) -> None:
     """
     Generate Binary protocol code from message definitions.
@@ -99,6 +100,7 @@ def generate_binary_protocol(
         plugin_paths_path: Path to plugin_paths.py
         output_base: Base output directory
         verbose: Enable verbose output
+        jobs: Worker processes for per-message generation (1 = sequential, None = one per CPU)
     """
-    generator = BinaryGenerator(verbose=verbose)
+    generator = BinaryGenerator(verbose=verbose, jobs=jobs)
     generator.generate(messages_dir, config_path, plugin_paths_path, output_base)
@@ -9,7 +9,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from protocol_codegen.core.enum_def import EnumDef
-from protocol_codegen.core.field import CompositeField, EnumField
 
 if TYPE_CHECKING:
     from protocol_codegen.core.message import Message
@@ -31,18 +30,11 @@ def collect_enum_defs(messages: list[Message]) -> list[EnumDef]:
     seen_names: set[str] = set()
     enum_defs: list[EnumDef] = []
 
-    def collect_from_fields(fields: list) -> None:
-        """Recursively collect EnumDefs from a list of fields."""
-        for field in fields:
-            if isinstance(field, EnumField):
-                if field.enum_def.name not in seen_names:
-                    seen_names.add(field.enum_def.name)
-                    enum_defs.append(field.enum_def)
-            elif isinstance(field, CompositeField):
-                # Recurse into composite fields
-                collect_from_fields(list(field.fields))
-
+    # Each message walks its field tree once (Message.enum_defs is cached)
     for message in messages:
-        collect_from_fields(list(message.fields))
+        for enum_def in message.enum_defs:
+            if enum_def.name not in seen_names:
+                seen_names.add(enum_def.name)
+                enum_defs.append(enum_def)
 
     return enum_defs
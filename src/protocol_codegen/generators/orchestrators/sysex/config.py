@@ -144,6 +144,12 @@ class SysExLimits(BaseModel):
         description="Include message name prefix in payload for bridge logging",
     )
 
+    table_codec_threshold: int = Field(
+        default=0,
+        ge=0,
+        description="Java encode()/decode() go through StructCodec above this many scalar fields (0 = disabled)",
+    )
+
     @field_validator("max_message_size")
     @classmethod
     def message_larger_than_payload(cls, v: int, info: Any) -> int:
@@ -209,6 +215,7 @@ class SysExConfig(BaseModel):
                 "max_payload_size": self.limits.max_payload_size,
                 "max_message_size": self.limits.max_message_size,
                 "include_message_name": self.limits.include_message_name,
+                "table_codec_threshold": self.limits.table_codec_threshold,
             },
         }
 
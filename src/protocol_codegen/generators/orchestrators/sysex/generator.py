@@ -114,6 +114,7 @@ def generate_sysex_protocol(
     plugin_paths_path: Path,
     output_base: Path,
     verbose: bool = False,
+    jobs: int | None = 1,
 ) -> None:
     """
     Generate SysEx protocol code from message definitions.
@@ -126,6 +127,7 @@ def generate_sysex_protocol(
         plugin_paths_path: Path to plugin_paths.py
         output_base: Base output directory
         verbose: Enable verbose output
+        jobs: Worker processes for per-message generation (1 = sequential, None = one per CPU)
     """
-    generator = SysExGenerator(verbose=verbose)
+    generator = SysExGenerator(verbose=verbose, jobs=jobs)
     generator.generate(messages_dir, config_path, plugin_paths_path, output_base)
@@ -168,3 +168,33 @@ class EncodingStrategy(ABC):
     def include_message_name_default(self) -> bool:
         """Default value for include_message_name in struct generation."""
         ...
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Derived Capabilities
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @property
+    def raw_byte_arrays(self) -> bool:
+        """True if uint8/int8 travel as one unmasked byte each.
+
+        Byte arrays (uint8 count + int8 items) can then be copied in bulk
+        instead of being decoded element by element.
+        """
+        for type_name in ("uint8", "int8"):
+            spec = self.get_integer_spec(type_name)
+            if spec is None or spec.shifts != (0,) or spec.masks != (0xFF,):
+                return False
+        return True
+
+    def is_raw_little_endian(self, type_name: str) -> bool:
+        """True if an integer type travels as plain little-endian bytes.
+
+        Such fields can be written with java.nio.ByteBuffer in LITTLE_ENDIAN
+        order instead of shifting and masking each byte.
+        """
+        spec = self.get_integer_spec(type_name)
+        if spec is None:
+            return False
+        return spec.shifts == tuple(range(0, 8 * spec.byte_count, 8)) and all(
+            mask == 0xFF for mask in spec.masks
+        )
@@ -70,6 +70,20 @@ _SERIAL8_NORM_SPECS: dict[str, NormEncodingSpec] = {
     ),
 }
 
+# Encoded size per builtin type (no expansion)
+_SERIAL8_ENCODED_SIZES: dict[str, int] = {
+    "bool": 1,
+    "uint8": 1,
+    "int8": 1,
+    "norm8": 1,
+    "uint16": 2,
+    "int16": 2,
+    "norm16": 2,
+    "uint32": 4,
+    "int32": 4,
+    "float32": 4,
+}
+
 _SERIAL8_STRING_SPEC = StringEncodingSpec(
     length_mask=0xFF,
     char_mask=0xFF,
@@ -94,18 +108,8 @@ class BinaryEncodingStrategy(EncodingStrategy):
     # ─────────────────────────────────────────────────────────────────────────
 
     def get_encoded_size(self, type_name: str, raw_size: int) -> int:
-        """Direct 8-bit sizes (no expansion)."""
-        # bool, uint8, int8, norm8: 1 byte
-        if type_name in ("bool", "uint8", "int8", "norm8"):
-            return 1
-        # uint16, int16, norm16: 2 bytes
-        if type_name in ("uint16", "int16", "norm16"):
-            return 2
-        # uint32, int32, float32: 4 bytes
-        if type_name in ("uint32", "int32", "float32"):
-            return 4
-        # Default: use raw size
-        return raw_size
+        """Direct 8-bit sizes (no expansion), raw size for unlisted types."""
+        return _SERIAL8_ENCODED_SIZES.get(type_name, raw_size)
 
     def get_string_max_encoded_size(self, max_length: int) -> int:
         """String: 1 byte length prefix + chars."""
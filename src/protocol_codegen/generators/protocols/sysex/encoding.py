@@ -70,6 +70,20 @@ _SYSEX_NORM_SPECS: dict[str, NormEncodingSpec] = {
     ),
 }
 
+# Encoded size per builtin type (16-bit -> 3 bytes, 32-bit -> 5 bytes)
+_SYSEX_ENCODED_SIZES: dict[str, int] = {
+    "bool": 1,
+    "uint8": 1,
+    "int8": 1,
+    "norm8": 1,
+    "uint16": 3,
+    "int16": 3,
+    "norm16": 3,
+    "uint32": 5,
+    "int32": 5,
+    "float32": 5,
+}
+
 _SYSEX_STRING_SPEC = StringEncodingSpec(
     length_mask=0x7F,
     char_mask=0x7F,
@@ -94,21 +108,11 @@ class SysExEncodingStrategy(EncodingStrategy):
     # ─────────────────────────────────────────────────────────────────────────
 
     def get_encoded_size(self, type_name: str, raw_size: int) -> int:
-        """7-bit encoded sizes (with expansion)."""
-        # bool: 1 byte (0x00 or 0x01)
-        if type_name == "bool":
-            return 1
-        # uint8, int8, norm8: 1 byte (no encoding needed, values < 128)
-        if type_name in ("uint8", "int8", "norm8"):
-            return 1
-        # uint16, int16, norm16: 2 -> 3 bytes (7-bit expansion)
-        if type_name in ("uint16", "int16", "norm16"):
-            return 3
-        # uint32, int32, float32: 4 -> 5 bytes (7-bit expansion)
-        if type_name in ("uint32", "int32", "float32"):
-            return 5
-        # Default: 7-bit encoding formula
-        return ((raw_size * 8) + 6) // 7
+        """7-bit encoded sizes (with expansion), 7-bit formula for unlisted types."""
+        size = _SYSEX_ENCODED_SIZES.get(type_name)
+        if size is None:
+            return ((raw_size * 8) + 6) // 7
+        return size
 
     def get_string_max_encoded_size(self, max_length: int) -> int:
         """String: 1 byte length prefix + chars (all 7-bit safe)."""
@@ -1,24 +1,60 @@
 """
 C++ Code Generators
 Generates C++ protocol files (Encoder.hpp, Decoder.hpp, structs, MessageID, etc.)
+
+Generators are loaded lazily (PEP 562): importing one submodule, or one
+generator, does not load the rest of the backend.
 """
 
-from .callbacks_generator import generate_protocol_callbacks_hpp
-from .constants_generator import generate_constants_hpp
-from .decoder_generator import generate_decoder_hpp
-from .decoder_registry_generator import generate_decoder_registry_hpp
-from .encoder_generator import generate_encoder_hpp
-from .message_structure_generator import generate_message_structure_hpp
-from .messageid_generator import generate_messageid_hpp
-from .struct_generator import generate_struct_hpp
+from __future__ import annotations
 
-__all__ = [
-    "generate_encoder_hpp",
-    "generate_decoder_hpp",
-    "generate_messageid_hpp",
-    "generate_struct_hpp",
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Static view of the lazy exports below, for type checkers and IDEs
+    from .callbacks_generator import generate_protocol_callbacks_hpp
+    from .constants_generator import generate_constants_hpp
+    from .decoder_generator import generate_decoder_hpp
+    from .decoder_registry_generator import generate_decoder_registry_hpp
+    from .encoder_generator import generate_encoder_hpp
+    from .message_structure_generator import generate_message_structure_hpp
+    from .messageid_generator import generate_messageid_hpp
+    from .struct_generator import generate_struct_hpp
+
+# Public generator -> submodule that defines it
+_LAZY_EXPORTS: dict[str, str] = {
+    "generate_encoder_hpp": "encoder_generator",
+    "generate_decoder_hpp": "decoder_generator",
+    "generate_messageid_hpp": "messageid_generator",
+    "generate_struct_hpp": "struct_generator",
+    "generate_constants_hpp": "constants_generator",
+    "generate_message_structure_hpp": "message_structure_generator",
+    "generate_decoder_registry_hpp": "decoder_registry_generator",
+    "generate_protocol_callbacks_hpp": "callbacks_generator",
+}
+
+__all__ = (
     "generate_constants_hpp",
-    "generate_message_structure_hpp",
+    "generate_decoder_hpp",
     "generate_decoder_registry_hpp",
+    "generate_encoder_hpp",
+    "generate_message_structure_hpp",
+    "generate_messageid_hpp",
     "generate_protocol_callbacks_hpp",
-]
+    "generate_struct_hpp",
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a generator's submodule on first access and cache the attribute."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -21,30 +21,8 @@ if TYPE_CHECKING:
     from protocol_codegen.core.message import Message
 
 
-def generate_protocol_template_hpp(messages: list[Message], output_path: Path) -> str:
-    """
-    Generate Protocol.hpp.template for SysEx transport.
-
-    Args:
-        messages: List of message definitions
-        output_path: Where to write Protocol.hpp.template
-
-    Returns:
-        Generated C++ template code with TODO comments
-    """
-    # Generate example callback assignments
-    callback_examples: list[str] = []
-    for message in messages[:3]:  # Show first 3 as examples
-        pascal_name = "".join(word.capitalize() for word in message.name.split("_"))
-        callback_name = f"on{pascal_name}"
-        class_name = f"{pascal_name}Message"
-        callback_examples.append(
-            f"    // protocol.{callback_name} = [](const {class_name}& msg) {{ }};"
-        )
-
-    callback_examples_str = "\n".join(callback_examples)
-
-    code = f"""/**
+# Static template text around the callback examples, built once at import
+_TEMPLATE_HEAD = """/**
  * Protocol.hpp.template - SysEx Protocol Handler Template
  *
  * ============================================================================
@@ -108,7 +86,7 @@ def generate_protocol_template_hpp(messages: list[Message], output_path: Path) -
 //   #include <oc/core/event/IEventBus.hpp>  // For EventBus subscription
 //   #include <oc/core/event/Events.hpp>     // For SysExEvent
 
-namespace Protocol {{
+namespace Protocol {
 
 /**
  * SysEx Protocol Handler
@@ -118,7 +96,7 @@ namespace Protocol {{
  * Inherits from ProtocolCallbacks which provides typed callback members
  * for each message type (e.g., onTransportPlay, onDeviceChange, etc.)
  */
-class Protocol : public ProtocolCallbacks {{
+class Protocol : public ProtocolCallbacks {
 public:
     // ========================================================================
     // TODO: Constructor - adapt to your transport
@@ -129,20 +107,20 @@ public:
      *
      *   Protocol(oc::api::MidiAPI& midi, oc::core::event::IEventBus& events)
      *       : midi_(midi), events_(events)
-     *   {{
+     *   {
      *       using namespace oc::core::event;
      *       subscriptionId_ = events_.on(
      *           EventCategory::MIDI,
      *           MidiEvent::SYSEX,
-     *           [this](const Event& evt) {{
+     *           [this](const Event& evt) {
      *               const auto& sysex = static_cast<const SysExEvent&>(evt);
      *               dispatch(sysex.data, sysex.length);
-     *           }});
-     *   }}
+     *           });
+     *   }
      *
-     *   ~Protocol() {{
+     *   ~Protocol() {
      *       events_.off(subscriptionId_);
-     *   }}
+     *   }
      */
 
     // Non-copyable
@@ -162,7 +140,7 @@ public:
      * @param message Message to send
      */
     template<typename T>
-    void send(const T& message) {{
+    void send(const T& message) {
         // Encode payload
         uint8_t payload[T::MAX_PAYLOAD_SIZE];
         uint16_t payloadLen = message.encode(payload, sizeof(payload));
@@ -185,7 +163,7 @@ public:
         // TODO: Send via your transport
         // Example:
         //   midi_.sendSysEx(sysex, offset);
-    }}
+    }
 
     // ========================================================================
     // Receive / Dispatch
@@ -199,19 +177,19 @@ public:
      * @param sysex Raw SysEx data (including F0/F7)
      * @param length SysEx length
      */
-    void dispatch(const uint8_t* sysex, uint16_t length) {{
+    void dispatch(const uint8_t* sysex, uint16_t length) {
         // Validate SysEx frame
-        if (sysex == nullptr || length < MIN_MESSAGE_LENGTH) {{
+        if (sysex == nullptr || length < MIN_MESSAGE_LENGTH) {
             return;
-        }}
+        }
 
-        if (sysex[0] != SYSEX_START || sysex[length - 1] != SYSEX_END) {{
+        if (sysex[0] != SYSEX_START || sysex[length - 1] != SYSEX_END) {
             return;
-        }}
+        }
 
-        if (sysex[1] != MANUFACTURER_ID || sysex[2] != DEVICE_ID) {{
+        if (sysex[1] != MANUFACTURER_ID || sysex[2] != DEVICE_ID) {
             return;
-        }}
+        }
 
         // Parse header
         MessageID messageId = static_cast<MessageID>(sysex[MESSAGE_TYPE_OFFSET]);
@@ -223,7 +201,7 @@ public:
 
         // Dispatch to typed callback
         DecoderRegistry::dispatch(*this, messageId, payload, payloadLen, fromHost);
-    }}
+    }
 
     // ========================================================================
     // TODO: Add project-specific helper methods here
@@ -241,10 +219,10 @@ private:
     // Examples:
     //   oc::api::MidiAPI& midi_;
     //   oc::core::event::IEventBus& events_;
-    //   oc::core::event::SubscriptionID subscriptionId_{{0}};
-}};
+    //   oc::core::event::SubscriptionID subscriptionId_{0};
+};
 
-}}  // namespace Protocol
+}  // namespace Protocol
 
 // ============================================================================
 // USAGE EXAMPLE
@@ -254,21 +232,40 @@ private:
 // #include <oc/api/MidiAPI.hpp>
 // #include <oc/core/event/IEventBus.hpp>
 //
-// class MyContext : public oc::interface::IContext {{
+// class MyContext : public oc::interface::IContext {
 //     Protocol protocol_;
 //
 // public:
 //     MyContext(oc::api::MidiAPI& midi, oc::core::event::IEventBus& events)
 //         : protocol_(midi, events)
-//     {{
+//     {
 //         // Register callbacks
-{callback_examples_str}
-//     }}
+"""
+
+_TEMPLATE_TAIL = """//     }
 //
-//     void sendCommand() {{
-//         protocol_.send(TransportPlayMessage{{true}});
-//     }}
-// }};
+//     void sendCommand() {
+//         protocol_.send(TransportPlayMessage{true});
+//     }
+// };
 """
 
-    return code
+
+def generate_protocol_template_hpp(messages: list[Message], output_path: Path) -> str:
+    """
+    Generate Protocol.hpp.template for SysEx transport.
+
+    Args:
+        messages: List of message definitions
+        output_path: Where to write Protocol.hpp.template
+
+    Returns:
+        Generated C++ template code with TODO comments
+    """
+    # Example callback assignments for the first 3 messages
+    callback_examples_str = "\n".join(
+        f"    // protocol.on{message.pascal_name} = [](const {message.pascal_name}Message& msg) {{ }};"
+        for message in messages[:3]
+    )
+
+    return f"{_TEMPLATE_HEAD}{callback_examples_str}\n{_TEMPLATE_TAIL}"
@@ -30,6 +30,7 @@ from typing import TYPE_CHECKING
 
 # Import field classes for runtime isinstance checks
 from protocol_codegen.core.field import CompositeField, FieldBase, PrimitiveField
+from protocol_codegen.generators.core.naming import field_to_pascal_case
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -390,7 +391,7 @@ def _format_composite_array(
     getter = _to_getter_name(field.name, False)
 
     # Capitalize first letter of field name for inner class type
-    class_name = field.name[0].upper() + field.name[1:]
+    class_name = field_to_pascal_case(field.name)
 
     lines: list[str] = []
     lines.append(f'        sb.append("{indent_str}{field.name}:\\n");')
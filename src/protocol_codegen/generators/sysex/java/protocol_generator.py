@@ -13,6 +13,7 @@ SysEx-specific:
 
 from __future__ import annotations
 
+from string import Template
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,33 +22,8 @@ if TYPE_CHECKING:
     from protocol_codegen.core.message import Message
 
 
-def generate_protocol_template_java(
-    messages: list[Message], output_path: Path, package: str
-) -> str:
-    """
-    Generate Protocol.java.template for SysEx transport.
-
-    Args:
-        messages: List of message definitions
-        output_path: Where to write Protocol.java.template
-        package: Java package name
-
-    Returns:
-        Generated Java template code with TODO comments
-    """
-    # Generate example callback assignments
-    callback_examples: list[str] = []
-    for message in messages[:3]:  # Show first 3 as examples
-        pascal_name = "".join(word.capitalize() for word in message.name.split("_"))
-        callback_name = f"on{pascal_name}"
-        class_name = f"{pascal_name}Message"
-        callback_examples.append(
-            f"        // protocol.{callback_name} = msg -> {{ }};"
-        )
-
-    callback_examples_str = "\n".join(callback_examples)
-
-    code = f"""package {package};
+# Template body, parsed once at import ($-placeholders leave Java braces unescaped)
+_PROTOCOL_TEMPLATE = Template("""package $package;
 
 /**
  * Protocol.java.template - SysEx Protocol Handler Template
@@ -86,7 +62,7 @@ def generate_protocol_template_java(
  * ============================================================================
  */
 
-import {package}.struct.*;
+import $package.struct.*;
 
 /**
  * SysEx Protocol Handler
@@ -96,7 +72,7 @@ import {package}.struct.*;
  * Extends ProtocolCallbacks which provides typed callback fields
  * for each message type (e.g., onTransportPlay, onDeviceChange, etc.)
  */
-public class Protocol extends ProtocolCallbacks {{
+public class Protocol extends ProtocolCallbacks {
 
     // ========================================================================
     // TODO: Add your transport members here
@@ -113,26 +89,26 @@ public class Protocol extends ProtocolCallbacks {{
     /**
      * Example for Bitwig Controller API:
      *
-     *   public Protocol(ControllerHost host, MidiOut midiOut, MidiIn midiIn) {{
+     *   public Protocol(ControllerHost host, MidiOut midiOut, MidiIn midiIn) {
      *       this.host = host;
      *       this.midiOut = midiOut;
      *
      *       // Register SysEx callback
-     *       midiIn.setSysexCallback(hexData -> {{
+     *       midiIn.setSysexCallback(hexData -> {
      *           byte[] data = hexStringToByteArray(hexData);
      *           dispatch(data);
-     *       }});
-     *   }}
+     *       });
+     *   }
      *
-     *   private static byte[] hexStringToByteArray(String hexString) {{
+     *   private static byte[] hexStringToByteArray(String hexString) {
      *       int len = hexString.length();
      *       byte[] data = new byte[len / 2];
-     *       for (int i = 0; i < len; i += 2) {{
+     *       for (int i = 0; i < len; i += 2) {
      *           data[i / 2] = (byte) ((Character.digit(hexString.charAt(i), 16) << 4)
      *                                + Character.digit(hexString.charAt(i+1), 16));
-     *       }}
+     *       }
      *       return data;
-     *   }}
+     *   }
      */
 
     // ========================================================================
@@ -146,10 +122,10 @@ public class Protocol extends ProtocolCallbacks {{
      *
      * @param message Message to send (must have MESSAGE_ID and encode())
      */
-    public <T> void send(T message) {{
+    public <T> void send(T message) {
         // if (!isActive) return;  // Skip if deactivating
 
-        try {{
+        try {
             // Get MESSAGE_ID via reflection
             var messageIdField = message.getClass().getField("MESSAGE_ID");
             MessageID messageId = (MessageID) messageIdField.get(null);
@@ -165,12 +141,12 @@ public class Protocol extends ProtocolCallbacks {{
             // Example (Bitwig):
             //   midiOut.sendSysex(sysex);
 
-        }} catch (Exception e) {{
+        } catch (Exception e) {
             throw new RuntimeException("Failed to send message: " + e.getMessage(), e);
-        }}
-    }}
+        }
+    }
 
-    private byte[] buildSysExFrame(byte messageId, byte[] payload) {{
+    private byte[] buildSysExFrame(byte messageId, byte[] payload) {
         int totalSize = ProtocolConstants.MIN_MESSAGE_LENGTH + payload.length;
         byte[] sysex = new byte[totalSize];
 
@@ -187,7 +163,7 @@ public class Protocol extends ProtocolCallbacks {{
         sysex[offset] = ProtocolConstants.SYSEX_END;
 
         return sysex;
-    }}
+    }
 
     // ========================================================================
     // Receive / Dispatch
@@ -200,28 +176,28 @@ public class Protocol extends ProtocolCallbacks {{
      *
      * @param sysex Raw SysEx data (including F0/F7)
      */
-    public void dispatch(byte[] sysex) {{
+    public void dispatch(byte[] sysex) {
         // Validate SysEx frame
-        if (sysex == null || sysex.length < ProtocolConstants.MIN_MESSAGE_LENGTH) {{
+        if (sysex == null || sysex.length < ProtocolConstants.MIN_MESSAGE_LENGTH) {
             return;
-        }}
+        }
 
         if (sysex[0] != ProtocolConstants.SYSEX_START ||
-            sysex[sysex.length - 1] != ProtocolConstants.SYSEX_END) {{
+            sysex[sysex.length - 1] != ProtocolConstants.SYSEX_END) {
             return;
-        }}
+        }
 
         if (sysex[1] != ProtocolConstants.MANUFACTURER_ID ||
-            sysex[2] != ProtocolConstants.DEVICE_ID) {{
+            sysex[2] != ProtocolConstants.DEVICE_ID) {
             return;
-        }}
+        }
 
         // Parse header
         byte messageIdByte = sysex[ProtocolConstants.MESSAGE_TYPE_OFFSET];
         MessageID messageId = MessageID.fromValue(messageIdByte);
-        if (messageId == null) {{
+        if (messageId == null) {
             return;
-        }}
+        }
 
         boolean fromHost = (sysex[ProtocolConstants.FROM_HOST_OFFSET] != 0);
 
@@ -232,16 +208,16 @@ public class Protocol extends ProtocolCallbacks {{
 
         // Dispatch to callbacks
         DecoderRegistry.dispatch(this, messageId, payload, fromHost);
-    }}
+    }
 
     // ========================================================================
     // TODO: Add project-specific helper methods here
     // ========================================================================
     // Examples:
-    //   public void deactivate() {{ isActive = false; }}
-    //   public void requestHostStatus() {{ send(new RequestHostStatusMessage()); }}
+    //   public void deactivate() { isActive = false; }
+    //   public void requestHostStatus() { send(new RequestHostStatusMessage()); }
 
-}}  // class Protocol
+}  // class Protocol
 
 // ============================================================================
 // USAGE EXAMPLE
@@ -250,10 +226,29 @@ public class Protocol extends ProtocolCallbacks {{
 // Protocol protocol = new Protocol(host, midiOut, midiIn);
 //
 // // Register callbacks
-{callback_examples_str}
+$callback_examples
 //
 // // Send messages
 // protocol.send(new TransportPlayMessage(true));
-"""
+""")
+
+
+def generate_protocol_template_java(
+    messages: list[Message], output_path: Path, package: str
+) -> str:
+    """
+    Generate Protocol.java.template for SysEx transport.
 
-    return code
+    Args:
+        messages: List of message definitions
+        output_path: Where to write Protocol.java.template
+        package: Java package name
+
+    Returns:
+        Generated Java template code with TODO comments
+    """
+    # Example callback assignments for the first 3 messages
+    callback_examples = "\n".join(
+        f"        // protocol.on{message.pascal_name} = msg -> {{ }};" for message in messages[:3]
+    )
+    return _PROTOCOL_TEMPLATE.substitute(package=package, callback_examples=callback_examples)
@@ -7,6 +7,7 @@ to generate protocol-specific code for different target languages.
 Templates:
 - EncoderTemplate: Generates Encoder.hpp/Encoder.java files
 - DecoderTemplate: Generates Decoder.hpp/Decoder.java files
+- StructCodecTemplate: Generates StructCodec.java (table-driven message codec)
 
 Usage:
     from protocol_codegen.generators.languages.cpp import CppBackend
@@ -19,8 +20,10 @@ Usage:
 
 from .decoder import DecoderTemplate
 from .encoder import EncoderTemplate
+from .struct_codec import StructCodecTemplate
 
 __all__ = [
     "DecoderTemplate",
     "EncoderTemplate",
+    "StructCodecTemplate",
 ]
@@ -8,11 +8,12 @@ eliminating code duplication while maintaining clear separation.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from protocol_codegen.core.loader import TypeRegistry
     from protocol_codegen.generators.languages.base import LanguageBackend
     from protocol_codegen.generators.protocols import EncodingStrategy
@@ -93,4 +93,30 @@ class DecoderTemplate(CodecTemplate):
             if code:
                 decoders.append(code)
 
+        if self.backend.name == "java" and self.strategy.raw_byte_arrays:
+            decoders.append(self._generate_java_byte_array())
+
         return "\n".join(decoders)
+
+    def _generate_java_byte_array(self) -> str:
+        """Generate decodeByteArray() for bulk-copied int8 arrays.
+
+        Only emitted when the strategy sends bytes unmasked, so the payload
+        slice is the array content as-is.
+        """
+        return """
+    /**
+     * Decode a uint8-count-prefixed int8 array in one copy
+     *
+     * @param buffer Input buffer
+     * @param offset Offset of the count byte
+     * @return Copy of the array items (length = count)
+     * @throws IllegalArgumentException if the items run past the buffer
+     */
+    public static byte[] decodeByteArray(byte[] buffer, int offset) {
+        int count = buffer[offset] & 0xFF;
+        if (offset + 1 + count > buffer.length) {
+            throw new IllegalArgumentException("Insufficient data for byte array");
+        }
+        return java.util.Arrays.copyOfRange(buffer, offset + 1, offset + 1 + count);
+    }"""
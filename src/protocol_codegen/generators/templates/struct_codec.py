@@ -0,0 +1,146 @@
+"""
+StructCodec Template for generating StructCodec.java.
+
+StructCodec is the shared runtime behind table-driven message classes: each
+message only carries a static SCHEMA of type codes, and StructCodec walks it,
+delegating every field to the protocol's Encoder/Decoder methods. Encoding
+rules therefore stay in one place (Encoder/Decoder), and message classes
+shrink to table emission.
+
+Java only: C++ structs keep their inline encode/decode.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from protocol_codegen.generators.core.naming import capitalize_first
+from protocol_codegen.generators.templates.base import CodecTemplate
+
+if TYPE_CHECKING:
+    from protocol_codegen.core.loader import AtomicType, TypeRegistry
+
+# Java value -> raw bits stored in the long[] exchanged with StructCodec
+JAVA_TO_RAW_BITS: dict[str, str] = {
+    "boolean": "{value} ? 1 : 0",
+    "float": "Float.floatToRawIntBits({value})",
+}
+
+# Raw bits -> Java value (inverse of JAVA_TO_RAW_BITS, with narrowing casts)
+JAVA_FROM_RAW_BITS: dict[str, str] = {
+    "boolean": "{value} != 0",
+    "byte": "(byte) {value}",
+    "short": "(short) {value}",
+    "int": "(int) {value}",
+    "long": "{value}",
+    "float": "Float.intBitsToFloat((int) {value})",
+}
+
+
+def is_struct_codec_type(atomic_type: AtomicType) -> bool:
+    """Check if a type has a StructCodec type code (fixed-size builtin)."""
+    return atomic_type.is_builtin and isinstance(atomic_type.size_bytes, int)
+
+
+class StructCodecTemplate(CodecTemplate):
+    """Template for generating the StructCodec schema interpreter (Java).
+
+    Type codes follow the sorted builtin order so that struct generators can
+    reference them by name (StructCodec.TYPE_UINT8, ...). Strings are not
+    table-encodable: their size is only known at runtime.
+    """
+
+    @property
+    def codec_name(self) -> str:
+        """Return 'StructCodec'."""
+        return "StructCodec"
+
+    def _build_handler_map(self) -> dict[str, object]:
+        """StructCodec delegates to Encoder/Decoder, no type handlers."""
+        return {}
+
+    def _generate_methods(self, type_registry: TypeRegistry) -> str:
+        """Generate TYPE_* codes, encodeStruct() and decodeStruct()."""
+        constants: list[str] = []
+        encode_cases: list[str] = []
+        decode_cases: list[str] = []
+
+        for type_name, atomic_type in sorted(type_registry.types.items()):
+            if not is_struct_codec_type(atomic_type):
+                continue
+
+            java_type = atomic_type.java_type or "int"
+            code_name = f"TYPE_{type_name.upper()}"
+            method = capitalize_first(type_name)
+            value = JAVA_FROM_RAW_BITS[java_type].format(value="values[i]")
+            decoded = JAVA_TO_RAW_BITS.get(java_type, "{value}").format(
+                value=f"Decoder.decode{method}(buffer, offset)"
+            )
+            size_bytes = atomic_type.size_bytes
+            assert isinstance(size_bytes, int)  # is_struct_codec_type: fixed-size only
+            size = self.strategy.get_encoded_size(type_name, size_bytes)
+
+            constants.append(f"    public static final byte {code_name} = {len(constants)};")
+            encode_cases.append(
+                f"                case {code_name}: offset += Encoder.encode{method}(buffer, offset, {value}); break;"
+            )
+            decode_cases.append(
+                f"                case {code_name}: out[i] = {decoded}; offset += {size}; break;"
+            )
+
+        constants_str = "\n".join(constants)
+        encode_cases_str = "\n".join(encode_cases)
+        decode_cases_str = "\n".join(decode_cases)
+
+        return f"""
+    /** Schema type codes used by table-driven message encode()/decode() */
+{constants_str}
+
+    /**
+     * Encode a run of scalar fields described by a schema table
+     *
+     * Values are raw bits: integers widened to long, floats via
+     * Float.floatToRawIntBits(), bools as 0/1.
+     *
+     * @param buffer Output buffer
+     * @param offset Offset of the first field
+     * @param schema Field type codes (TYPE_* constants)
+     * @param values Field values, one per schema entry
+     * @return Offset after the last encoded field
+     */
+    public static int encodeStruct(byte[] buffer, int offset, byte[] schema, long[] values) {{
+        for (int i = 0; i < schema.length; i++) {{
+            switch (schema[i]) {{
+{encode_cases_str}
+                default: throw new IllegalArgumentException("Unknown schema type code: " + schema[i]);
+            }}
+        }}
+        return offset;
+    }}
+
+    /**
+     * Decode a run of scalar fields described by a schema table
+     *
+     * @param buffer Input buffer
+     * @param offset Offset of the first field
+     * @param schema Field type codes (TYPE_* constants)
+     * @param out Decoded raw bits, one per schema entry (see encodeStruct)
+     * @return Offset after the last decoded field
+     */
+    public static int decodeStruct(byte[] buffer, int offset, byte[] schema, long[] out) {{
+        for (int i = 0; i < schema.length; i++) {{
+            switch (schema[i]) {{
+{decode_cases_str}
+                default: throw new IllegalArgumentException("Unknown schema type code: " + schema[i]);
+            }}
+        }}
+        return offset;
+    }}"""
+
+
+__all__ = [
+    "JAVA_FROM_RAW_BITS",
+    "JAVA_TO_RAW_BITS",
+    "StructCodecTemplate",
+    "is_struct_codec_type",
+]
@@ -146,6 +146,16 @@ class TestEncoderTemplateJavaBinary:
         assert "return 2;" in code  # uint16
         assert "return 4;" in code  # uint32, float32
 
+    def test_int32_keeps_all_bits(
+        self, template: EncoderTemplate, type_registry: TypeRegistry
+    ) -> None:
+        code = template.generate(type_registry, Path("Encoder.java"))
+        int16 = code[code.index("encodeInt16(") :]
+        int32 = code[code.index("encodeInt32(") :]
+        # short is masked to its 16-bit pattern, int is written whole
+        assert "int val = value & 0xFFFF;" in int16[: int16.index("}")]
+        assert "int val = value;" in int32[: int32.index("}")]
+
 
 class TestEncoderTemplateJavaSysEx:
     """Test EncoderTemplate with Java and SysEx."""
@@ -0,0 +1,67 @@
+"""Tests for StructCodecTemplate."""
+
+from pathlib import Path
+
+import pytest
+
+from protocol_codegen.core.loader import TypeRegistry
+from protocol_codegen.generators.languages.java import JavaBackend
+from protocol_codegen.generators.protocols import (
+    BinaryEncodingStrategy,
+    SysExEncodingStrategy,
+)
+from protocol_codegen.generators.templates import StructCodecTemplate
+
+
+@pytest.fixture
+def type_registry() -> TypeRegistry:
+    """Create a TypeRegistry with builtins loaded."""
+    registry = TypeRegistry()
+    registry.load_builtins()
+    return registry
+
+
+class TestStructCodecTemplateJava:
+    """Test StructCodecTemplate with Java and Binary."""
+
+    @pytest.fixture
+    def template(self) -> StructCodecTemplate:
+        return StructCodecTemplate(JavaBackend(package="protocol"), BinaryEncodingStrategy())
+
+    def test_has_class(self, template: StructCodecTemplate, type_registry: TypeRegistry) -> None:
+        code = template.generate(type_registry, Path("StructCodec.java"))
+        assert "package protocol;" in code
+        assert "public final class StructCodec {" in code
+
+    def test_type_codes_sorted(
+        self, template: StructCodecTemplate, type_registry: TypeRegistry
+    ) -> None:
+        code = template.generate(type_registry, Path("StructCodec.java"))
+        assert "public static final byte TYPE_BOOL = 0;" in code
+        assert "TYPE_STRING" not in code
+
+    def test_encode_delegates_to_encoder(
+        self, template: StructCodecTemplate, type_registry: TypeRegistry
+    ) -> None:
+        code = template.generate(type_registry, Path("StructCodec.java"))
+        assert "public static int encodeStruct(" in code
+        assert "Encoder.encodeBool(buffer, offset, values[i] != 0)" in code
+        assert (
+            "Encoder.encodeFloat32(buffer, offset, Float.intBitsToFloat((int) values[i]))" in code
+        )
+        assert "Encoder.encodeUint32(buffer, offset, values[i])" in code
+
+    def test_decode_delegates_to_decoder(
+        self, template: StructCodecTemplate, type_registry: TypeRegistry
+    ) -> None:
+        code = template.generate(type_registry, Path("StructCodec.java"))
+        assert "public static int decodeStruct(" in code
+        assert "out[i] = Decoder.decodeBool(buffer, offset) ? 1 : 0; offset += 1;" in code
+        assert "out[i] = Decoder.decodeUint16(buffer, offset); offset += 2;" in code
+
+
+def test_sysex_sizes(type_registry: TypeRegistry) -> None:
+    """Test that decode offsets follow the 7-bit encoded sizes."""
+    template = StructCodecTemplate(JavaBackend(package="protocol"), SysExEncodingStrategy())
+    code = template.generate(type_registry, Path("StructCodec.java"))
+    assert "out[i] = Decoder.decodeUint16(buffer, offset); offset += 3;" in code
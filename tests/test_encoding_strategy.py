@@ -61,6 +61,15 @@ class TestBinaryStrategy:
         # Empty string = just length prefix
         assert strategy.get_string_min_encoded_size() == 1
 
+    def test_raw_byte_arrays(self, strategy: BinaryEncodingStrategy) -> None:
+        # 8-bit bytes are copied verbatim
+        assert strategy.raw_byte_arrays
+
+    def test_raw_little_endian(self, strategy: BinaryEncodingStrategy) -> None:
+        assert strategy.is_raw_little_endian("uint32")
+        assert strategy.is_raw_little_endian("float32")
+        assert not strategy.is_raw_little_endian("norm16")
+
 
 class TestSysExStrategy:
     """Test SysEx 7-bit MIDI-safe encoding strategy."""
@@ -116,6 +125,14 @@ class TestSysExStrategy:
     def test_string_min_size(self, strategy: SysExEncodingStrategy) -> None:
         assert strategy.get_string_min_encoded_size() == 1
 
+    def test_no_raw_byte_arrays(self, strategy: SysExEncodingStrategy) -> None:
+        # 7-bit masking rules out bulk copies
+        assert not strategy.raw_byte_arrays
+
+    def test_not_raw_little_endian(self, strategy: SysExEncodingStrategy) -> None:
+        assert not strategy.is_raw_little_endian("uint8")
+        assert not strategy.is_raw_little_endian("uint16")
+
 
 class TestEncodingStrategyFactory:
     """Test get_encoding_strategy factory function."""
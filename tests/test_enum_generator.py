@@ -7,7 +7,11 @@ from pathlib import Path
 import pytest
 
 from protocol_codegen.core.enum_def import EnumDef
-from protocol_codegen.generators.languages.cpp.file_generators.enum import generate_enum_hpp
+from protocol_codegen.generators.languages.cpp.file_generators.enum import (
+    clear_enum_cache,
+    generate_all_enum_hpp,
+    generate_enum_hpp,
+)
 from protocol_codegen.generators.languages.java.file_generators.enum import generate_enum_java
 
 
@@ -113,6 +117,40 @@ class TestCppEnumGenerator:
 
         assert "#include <cstdint>" in code
 
+    def test_cached_body_keeps_file_name(self, simple_enum: EnumDef) -> None:
+        """Test that identical enums reuse the body but not the header file name."""
+        clear_enum_cache()
+        first = generate_enum_hpp(simple_enum, Path("TrackType.hpp"))
+        second = generate_enum_hpp(simple_enum, Path("Other.hpp"))
+
+        assert " * Other.hpp - Auto-generated Protocol Enum" in second
+        assert "TrackType.hpp" not in second
+        assert first.split("#pragma once")[1] == second.split("#pragma once")[1]
+
+    def test_cache_distinguishes_content(self, simple_enum: EnumDef) -> None:
+        """Test that a changed definition is not served from the cache."""
+        generate_enum_hpp(simple_enum, Path("TrackType.hpp"))
+        changed = EnumDef(name="TrackType", values={"AUDIO": 0, "MASTER": 3})
+        code = generate_enum_hpp(changed, Path("TrackType.hpp"))
+
+        assert "MASTER = 3," in code
+        assert "INSTRUMENT" not in code
+
+    def test_batch_generation_matches_sequential(
+        self, simple_enum: EnumDef, bitflags_enum: EnumDef
+    ) -> None:
+        """Test that the process-pool batch renders the same code as in-process."""
+        enum_defs = [simple_enum, bitflags_enum]
+
+        sequential = generate_all_enum_hpp(enum_defs, Path("enums"), max_workers=1)
+        parallel = generate_all_enum_hpp(enum_defs, Path("enums"), max_workers=2)
+
+        assert list(parallel) == ["TrackType", "ChildType"]
+        assert parallel == sequential
+        assert sequential["TrackType"] == generate_enum_hpp(
+            simple_enum, Path("enums/TrackType.hpp")
+        )
+
 
 class TestJavaEnumGenerator:
     """Tests for Java enum generator."""
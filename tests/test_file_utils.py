@@ -88,6 +88,16 @@ class TestWriteIfChanged:
 
         assert result is False
 
+    def test_crlf_checkout_unchanged(self, tmp_path: Path) -> None:
+        """A CRLF copy of the same text (e.g. git autocrlf) should not be rewritten."""
+        target = tmp_path / "crlf.txt"
+        target.write_bytes(b"Line 1\r\nLine 2\r\n")
+
+        result = write_if_changed(target, "Line 1\nLine 2\n")
+
+        assert result is False
+        assert target.read_bytes() == b"Line 1\r\nLine 2\r\n"
+
     def test_whitespace_matters(self, tmp_path: Path) -> None:
         """Whitespace differences should trigger write."""
         target = tmp_path / "whitespace.txt"
@@ -6,8 +6,9 @@ Validates message creation and properties.
 
 from __future__ import annotations
 
+from protocol_codegen.core.enum_def import EnumDef
 from protocol_codegen.core.enums import Direction, Intent
-from protocol_codegen.core.field import CompositeField, PrimitiveField, Type
+from protocol_codegen.core.field import CompositeField, EnumField, PrimitiveField, Type
 from protocol_codegen.core.message import (
     Message,
     collect_messages,
@@ -82,6 +83,46 @@ class TestMessage:
 
         assert str(msg) == "Message(UNNAMED, 1 fields)"
 
+    def test_pascal_name(self) -> None:
+        """PascalCase name is derived from the injected name."""
+        msg = Message(description="Test message", fields=[])
+        msg.name = "TRANSPORT_PLAY"
+
+        assert msg.pascal_name == "TransportPlay"
+
+    def test_has_string_field_nested(self) -> None:
+        """String detection descends into composite fields."""
+        flat = Message(description="Flat", fields=[PrimitiveField("value", type_name=Type.FLOAT32)])
+        nested = Message(
+            description="Nested",
+            fields=[
+                CompositeField(
+                    "info",
+                    fields=[PrimitiveField("label", type_name=Type.STRING)],
+                )
+            ],
+        )
+
+        assert flat.has_string_field is False
+        assert nested.has_string_field is True
+
+    def test_enum_defs_unique_in_order(self) -> None:
+        """Enum definitions are collected once each, nested included."""
+        mode = EnumDef(name="Mode", values={"A": 0, "B": 1})
+        flags = EnumDef(name="Flags", values={"X": 1}, is_bitflags=True)
+        msg = Message(
+            description="Enums",
+            fields=[
+                EnumField("mode", enum_def=mode),
+                CompositeField(
+                    "slot",
+                    fields=[EnumField("flags", enum_def=flags), EnumField("mode", enum_def=mode)],
+                ),
+            ],
+        )
+
+        assert msg.enum_defs == (mode, flags)
+
     def test_message_with_composite_field(self) -> None:
         """Message containing composite fields."""
         msg = Message(
@@ -197,6 +197,36 @@ class TestPayloadCalculatorComposite:
         assert binary_calculator.calculate_max_payload_size(fields, 32) == 3
 
 
+class TestPayloadCalculatorBounds:
+    """Test the single-walk (min, max) calculation."""
+
+    @pytest.mark.parametrize("prefix", [0, 5])
+    def test_bounds_match_separate_walks(
+        self, sysex_calculator: PayloadCalculator, prefix: int
+    ) -> None:
+        """Bounds equal calculate_min/max_payload_size for every field kind."""
+        enum_def = EnumDef(name="Mode", values={"OFF": 0, "ON": 1})
+        point = [
+            PrimitiveField(name="x", type_name=Type.UINT16),
+            PrimitiveField(name="label", type_name=Type.STRING),
+            EnumField(name="mode", enum_def=enum_def, array=2),
+        ]
+        fields = [
+            PrimitiveField(name="id", type_name=Type.UINT8),
+            PrimitiveField(name="name", type_name=Type.STRING),
+            PrimitiveField(name="values", type_name=Type.UINT32, array=4),
+            PrimitiveField(name="tags", type_name=Type.STRING, array=3, dynamic=True),
+            EnumField(name="mode", enum_def=enum_def),
+            CompositeField(name="origin", fields=point),
+            CompositeField(name="points", fields=point, array=3),
+        ]
+
+        assert sysex_calculator.calculate_payload_size_bounds(fields, 16, prefix) == (
+            sysex_calculator.calculate_min_payload_size(fields, 16, prefix),
+            sysex_calculator.calculate_max_payload_size(fields, 16, prefix),
+        )
+
+
 class TestPayloadCalculatorProtocolDifference:
     """Test key differences between Binary and SysEx."""
 
@@ -0,0 +1,769 @@
+"""
+Tests for struct generators (C++ and Java).
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from protocol_codegen.core.enum_def import EnumDef
+from protocol_codegen.core.field import (
+    CompositeField,
+    EnumField,
+    PrimitiveField,
+    Type,
+    populate_type_names,
+)
+from protocol_codegen.core.loader import TypeRegistry
+from protocol_codegen.core.message import Message
+from protocol_codegen.generators.languages.cpp.file_generators.message_base import (
+    needs_message_base,
+)
+from protocol_codegen.generators.languages.cpp.file_generators.struct import (
+    generate_all_composite_hpp,
+    generate_all_struct_hpp,
+    generate_struct_hpp,
+)
+from protocol_codegen.generators.languages.java.file_generators.struct import (
+    clear_struct_cache,
+    generate_all_struct_java,
+    generate_struct_java,
+)
+from protocol_codegen.generators.protocols import BinaryEncodingStrategy, SysExEncodingStrategy
+
+
+class TestJavaStructGenerator:
+    """Tests for Java struct generator."""
+
+    @pytest.fixture
+    def message(self) -> Message:
+        """Create a simple message for testing."""
+        return Message(
+            description="Sensor reading",
+            fields=[
+                PrimitiveField("sensorId", type_name=Type.UINT8),
+                PrimitiveField("value", type_name=Type.FLOAT32),
+                PrimitiveField("label", type_name=Type.STRING),
+            ],
+            name="SENSOR_READING",
+        )
+
+    def _generate(
+        self, message: Message, registry: TypeRegistry, include_message_name: bool
+    ) -> str:
+        return generate_struct_java(
+            message,
+            0x01,
+            registry,
+            Path("SensorReadingMessage.java"),
+            16,
+            "protocol.struct",
+            BinaryEncodingStrategy(),
+            include_message_name,
+        )
+
+    def test_message_name_copied_in_bulk(
+        self, message: Message, type_registry: TypeRegistry
+    ) -> None:
+        """Test that MESSAGE_NAME is pre-encoded and copied with System.arraycopy."""
+        code = self._generate(message, type_registry, include_message_name=True)
+
+        assert "private static final byte[] MESSAGE_NAME_BYTES =" in code
+        assert "buffer[offset++] = (byte) MESSAGE_NAME_BYTES.length;" in code
+        assert "System.arraycopy(MESSAGE_NAME_BYTES, 0, buffer, offset" in code
+        assert "MESSAGE_NAME.charAt(i)" not in code
+
+    def test_no_message_name_bytes_when_disabled(
+        self, message: Message, type_registry: TypeRegistry
+    ) -> None:
+        """Test that MESSAGE_NAME_BYTES is omitted without a name prefix."""
+        code = self._generate(message, type_registry, include_message_name=False)
+
+        assert "MESSAGE_NAME_BYTES" not in code
+
+    def test_fixed_layout_encoded_by_byte_buffer(self, type_registry: TypeRegistry) -> None:
+        """Test that raw little-endian scalar messages encode as one ByteBuffer chain."""
+        message = Message(
+            description="Sample",
+            fields=[
+                PrimitiveField("channel", type_name=Type.UINT8),
+                PrimitiveField("level", type_name=Type.INT16),
+                PrimitiveField("gain", type_name=Type.FLOAT32),
+            ],
+            name="SAMPLE",
+        )
+
+        code = self._generate(message, type_registry, include_message_name=True)
+
+        assert "import java.nio.ByteBuffer;" in code
+        assert "import protocol.Encoder;" not in code
+        assert ".order(ByteOrder.LITTLE_ENDIAN);" in code
+        assert "bb.put((byte) MESSAGE_NAME_BYTES.length)" in code
+        assert ".put(MESSAGE_NAME_BYTES)" in code
+        assert ".putShort(level)" in code
+        assert ".putFloat(gain);" in code
+        assert "return bb.position() - startOffset;" in code
+        assert "(allocates one ByteBuffer view)" in code
+        assert "(zero allocation)" not in code
+        # decode() is unchanged
+        assert "short level = Decoder.decodeInt16(data, offset);" in code
+
+    def test_sysex_keeps_encoder_calls(self, type_registry: TypeRegistry) -> None:
+        """Test that 7-bit protocols never take the ByteBuffer path."""
+        message = Message(
+            description="Sample",
+            fields=[PrimitiveField("channel", type_name=Type.UINT8)],
+            name="SAMPLE",
+        )
+
+        code = generate_struct_java(
+            message,
+            0x01,
+            type_registry,
+            Path("SampleMessage.java"),
+            16,
+            "protocol.struct",
+            SysExEncodingStrategy(),
+        )
+
+        assert "ByteBuffer" not in code
+        assert "offset += Encoder.encodeUint8(buffer, offset, channel);" in code
+        assert "(zero allocation)" in code
+
+    def test_table_driven_codec_above_threshold(self, type_registry: TypeRegistry) -> None:
+        """Test that wide scalar messages encode and decode through StructCodec."""
+        fields = [PrimitiveField(f"f{i}", type_name=Type.UINT8) for i in range(9)]
+        message = Message(description="Wide", fields=fields, name="WIDE")
+
+        code = generate_struct_java(
+            message,
+            0x02,
+            type_registry,
+            Path("WideMessage.java"),
+            16,
+            "protocol.struct",
+            BinaryEncodingStrategy(),
+            False,
+            table_codec_threshold=8,
+        )
+
+        assert "import protocol.StructCodec;" in code
+        assert "import protocol.Encoder;" not in code
+        assert "private static final byte[] SCHEMA = {" in code
+        assert "offset = StructCodec.encodeStruct(buffer, offset, SCHEMA, new long[] {" in code
+        assert "(allocates one long[] of field bits)" in code
+        assert "StructCodec.decodeStruct(data, offset, SCHEMA, v);" in code
+        assert "(int) v[8]);" in code
+
+    def test_unrolled_codec_when_not_table_codable(self, type_registry: TypeRegistry) -> None:
+        """Test that strings keep the unrolled encode/decode path."""
+        fields = [PrimitiveField(f"f{i}", type_name=Type.UINT8) for i in range(9)]
+        fields.append(PrimitiveField("name", type_name=Type.STRING))
+        message = Message(description="Wide", fields=fields, name="WIDE")
+
+        code = generate_struct_java(
+            message,
+            0x02,
+            type_registry,
+            Path("WideMessage.java"),
+            16,
+            "protocol.struct",
+            BinaryEncodingStrategy(),
+            False,
+            table_codec_threshold=8,
+        )
+
+        assert "SCHEMA" not in code
+        assert "StructCodec" not in code
+        assert "Encoder.encodeString(" in code
+        assert "Decoder.decodeString(" in code
+
+    def test_generation_is_memoized(self, message: Message, type_registry: TypeRegistry) -> None:
+        """Test that regenerating the same message reuses the cached class."""
+        first = self._generate(message, type_registry, include_message_name=True)
+
+        assert self._generate(message, type_registry, include_message_name=True) is first
+        assert self._generate(message, type_registry, include_message_name=False) != first
+
+        clear_struct_cache()
+        again = self._generate(message, type_registry, include_message_name=True)
+        assert again == first
+        assert again is not first
+
+    def test_batch_generation_matches_sequential(
+        self, message: Message, type_registry: TypeRegistry
+    ) -> None:
+        """Test that the process-pool batch renders the same code as in-process."""
+        other = Message(
+            description="Ping",
+            fields=[PrimitiveField("seq", type_name=Type.UINT16)],
+            name="PING",
+        )
+        args = (
+            [message, other],
+            {"SENSOR_READING": 0x01, "PING": 0x02},
+            type_registry,
+            Path("struct"),
+            16,
+            "protocol.struct",
+            BinaryEncodingStrategy(),
+        )
+
+        sequential = generate_all_struct_java(*args, max_workers=1)
+        parallel = generate_all_struct_java(*args, max_workers=2)
+
+        assert list(parallel) == ["SENSOR_READING", "PING"]
+        assert parallel == sequential
+        assert sequential["PING"] == generate_struct_java(
+            other,
+            0x02,
+            type_registry,
+            Path("struct/PingMessage.java"),
+            16,
+            "protocol.struct",
+            BinaryEncodingStrategy(),
+        )
+
+    def test_int8_array_decoded_by_bulk_copy(self, type_registry: TypeRegistry) -> None:
+        """Test that raw-byte strategies decode int8 arrays with decodeByteArray()."""
+        message = Message(
+            description="Blob",
+            fields=[PrimitiveField("payload", type_name=Type.INT8, array=8)],
+            name="BLOB",
+        )
+
+        binary = generate_struct_java(
+            message,
+            0x03,
+            type_registry,
+            Path("BlobMessage.java"),
+            16,
+            "protocol.struct",
+            BinaryEncodingStrategy(),
+        )
+        sysex = generate_struct_java(
+            message,
+            0x03,
+            type_registry,
+            Path("BlobMessage.java"),
+            16,
+            "protocol.struct",
+            SysExEncodingStrategy(),
+        )
+
+        assert "byte[] payload = Decoder.decodeByteArray(data, offset);" in binary
+        assert "Decoder.decodeByteArray" not in sysex
+        assert "payload[i] = Decoder.decodeInt8(data, offset);" in sysex
+
+
+class TestCppStructGenerator:
+    """Tests for C++ struct generator."""
+
+    def test_batch_generation_matches_sequential(self, type_registry: TypeRegistry) -> None:
+        """Test that the process-pool batch renders the same code as in-process."""
+        messages = [
+            Message(
+                description="Sensor reading",
+                fields=[
+                    PrimitiveField("sensorId", type_name=Type.UINT8),
+                    PrimitiveField("label", type_name=Type.STRING),
+                ],
+                name="SENSOR_READING",
+            ),
+            Message(
+                description="Ping",
+                fields=[PrimitiveField("seq", type_name=Type.UINT16)],
+                name="PING",
+            ),
+        ]
+        args = (
+            messages,
+            {"SENSOR_READING": 0x01, "PING": 0x02},
+            type_registry,
+            Path("struct"),
+            16,
+            SysExEncodingStrategy(),
+        )
+
+        sequential = generate_all_struct_hpp(*args, max_workers=1)
+        parallel = generate_all_struct_hpp(*args, max_workers=2)
+        with ProcessPoolExecutor(
+            max_workers=2,
+            initializer=populate_type_names,
+            initargs=(list(type_registry.types.keys()),),
+        ) as executor:
+            shared = generate_all_struct_hpp(*args, executor=executor)
+
+        assert list(parallel) == ["SENSOR_READING", "PING"]
+        assert parallel == sequential
+        assert shared == sequential
+        assert sequential["PING"] == generate_struct_hpp(
+            messages[1],
+            0x02,
+            type_registry,
+            Path("struct/PingMessage.hpp"),
+            16,
+            SysExEncodingStrategy(),
+        )
+
+    def test_message_name_length_is_constant(self, type_registry: TypeRegistry) -> None:
+        """Test that MESSAGE_NAME is copied with a compile-time length, not strlen()."""
+        message = Message(
+            description="Ping",
+            fields=[PrimitiveField("seq", type_name=Type.UINT16)],
+            name="PING",
+        )
+        code = generate_struct_hpp(
+            message,
+            0x02,
+            type_registry,
+            Path("struct/PingMessage.hpp"),
+            16,
+            SysExEncodingStrategy(),
+            include_message_name=True,
+        )
+
+        assert "static constexpr uint8_t MESSAGE_NAME_LEN = 4;" in code
+        assert "Encoder::encodeUint8(ptr, MESSAGE_NAME_LEN);" in code
+        assert "std::memcpy(ptr, MESSAGE_NAME, MESSAGE_NAME_LEN);" in code
+        assert "strlen(MESSAGE_NAME)" not in code
+
+    def test_encode_decode_forced_inline(self, type_registry: TypeRegistry) -> None:
+        """Test that encode()/decode() carry the PROTOCOL_FORCE_INLINE macro."""
+        message = Message(
+            description="Ping",
+            fields=[PrimitiveField("seq", type_name=Type.UINT16)],
+            name="PING",
+        )
+        code = generate_struct_hpp(
+            message,
+            0x02,
+            type_registry,
+            Path("struct/PingMessage.hpp"),
+            16,
+            BinaryEncodingStrategy(),
+        )
+
+        assert "    PROTOCOL_FORCE_INLINE uint16_t encode(" in code
+        assert (
+            "    [[nodiscard]] PROTOCOL_FORCE_INLINE static std::optional<PingMessage> decode("
+            in code
+        )
+
+    def test_composite_array_decoded_in_place(self, type_registry: TypeRegistry) -> None:
+        """Test that composite array elements are decoded into their slot, not via a copy."""
+        message = Message(
+            description="Point set",
+            fields=[
+                CompositeField(
+                    name="points",
+                    fields=[
+                        PrimitiveField("x", type_name=Type.INT16),
+                        PrimitiveField("y", type_name=Type.INT16),
+                    ],
+                    array=4,
+                )
+            ],
+            name="POINT_SET",
+        )
+        code = generate_struct_hpp(
+            message,
+            0x03,
+            type_registry,
+            Path("struct/PointSetMessage.hpp"),
+            16,
+            # 7-bit: the composite is decoded member by member (no wire layout)
+            SysExEncodingStrategy(),
+        )
+
+        assert "Decoder::decodeInt16(ptr, remaining, points_data[i].x)" in code
+        assert "Points item;" not in code
+        assert "points_data[i] = item;" not in code
+
+    def test_byte_array_copied_in_bulk(self, type_registry: TypeRegistry) -> None:
+        """Test that raw uint8 arrays use memcpy, but 7-bit protocols keep the loop."""
+        message = Message(
+            description="Sensor set",
+            fields=[PrimitiveField("ids", type_name=Type.UINT8, array=8)],
+            name="SENSOR_SET",
+        )
+
+        def generate(strategy: BinaryEncodingStrategy | SysExEncodingStrategy) -> str:
+            return generate_struct_hpp(
+                message, 0x04, type_registry, Path("struct/SensorSetMessage.hpp"), 16, strategy
+            )
+
+        code = generate(BinaryEncodingStrategy())
+        assert "std::memcpy(ptr, ids.data(), ids.size());" in code
+        assert "std::memcpy(ids_data.data(), ptr, len_ids);" in code
+        assert "Decoder::decodeUint8(ptr, remaining, ids_data[i])" not in code
+
+        code = generate(SysExEncodingStrategy())
+        assert "std::memcpy(ptr, ids.data()" not in code
+        assert "Decoder::decodeUint8(ptr, remaining, ids_data[i])" in code
+
+    def test_fixed_size_encode_overload(self, type_registry: TypeRegistry) -> None:
+        """Test that fixed-size messages get an encode() without a size argument."""
+        message = Message(
+            description="Ping",
+            fields=[PrimitiveField("seq", type_name=Type.UINT16)],
+            name="PING",
+        )
+        code = generate_struct_hpp(
+            message,
+            0x02,
+            type_registry,
+            Path("struct/PingMessage.hpp"),
+            16,
+            BinaryEncodingStrategy(),
+        )
+
+        assert "static constexpr bool FIXED_SIZE = MIN_PAYLOAD_SIZE == MAX_PAYLOAD_SIZE;" in code
+        assert "uint16_t encode(uint8_t* buffer) const noexcept {" in code
+
+    def test_long_arrays_aligned(self, type_registry: TypeRegistry) -> None:
+        """Test that only memcpy'd std::array members of 8+ elements are alignas(16)."""
+        message = Message(
+            description="Levels",
+            fields=[
+                PrimitiveField("levels", type_name=Type.UINT8, array=8),
+                PrimitiveField("pair", type_name=Type.UINT8, array=2),
+                PrimitiveField("gains", type_name=Type.UINT16, array=8),
+                CompositeField(
+                    name="points",
+                    array=8,
+                    fields=[
+                        PrimitiveField("x", type_name=Type.UINT16),
+                        PrimitiveField("y", type_name=Type.UINT16),
+                    ],
+                ),
+                CompositeField(
+                    name="flags",
+                    array=8,
+                    fields=[
+                        PrimitiveField("id", type_name=Type.UINT8),
+                        PrimitiveField("set", type_name=Type.BOOL),
+                    ],
+                ),
+                PrimitiveField("label", type_name=Type.STRING),
+            ],
+            name="LEVELS",
+        )
+        code = generate_struct_hpp(
+            message,
+            0x04,
+            type_registry,
+            Path("struct/LevelsMessage.hpp"),
+            16,
+            BinaryEncodingStrategy(),
+        )
+
+        assert "    alignas(16) std::array<uint8_t, 8> levels;" in code
+        assert "    std::array<uint8_t, 2> pair;" in code
+        assert "    std::array<uint16_t, 8> gains;" in code
+        assert "    alignas(16) std::array<Points, 8> points;" in code
+        assert "    std::array<Flags, 8> flags;" in code
+        assert "uint16_t encode(uint8_t* buffer) const noexcept" not in code
+
+        # SysEx packs bytes to 7 bits: nothing is copied as is
+        code = generate_struct_hpp(
+            message,
+            0x04,
+            type_registry,
+            Path("struct/LevelsMessage.hpp"),
+            16,
+            SysExEncodingStrategy(),
+        )
+        assert "alignas" not in code
+
+    def test_empty_message_is_tag_struct(self, type_registry: TypeRegistry) -> None:
+        """Test that a fieldless message without name prefix becomes a constexpr tag type."""
+        message = Message(description="Request status", fields=[], name="REQUEST_STATUS")
+        code = generate_struct_hpp(
+            message,
+            0x05,
+            type_registry,
+            Path("struct/RequestStatusMessage.hpp"),
+            16,
+            SysExEncodingStrategy(),
+            include_message_name=False,
+        )
+
+        assert "static constexpr MessageID MESSAGE_ID = MessageID::REQUEST_STATUS;" in code
+        assert "[[nodiscard]] constexpr uint16_t encode(uint8_t*, uint16_t = 0)" in code
+        assert "[[nodiscard]] static constexpr std::optional<RequestStatusMessage> decode(" in code
+        assert "PROTOCOL_FORCE_INLINE uint16_t encode(" not in code
+        assert code.endswith("};\n\n}  // namespace Protocol\n")
+
+    def test_name_only_message_uses_shared_codec(self, type_registry: TypeRegistry) -> None:
+        """Test that fieldless messages with a name prefix inherit the MessageBase codec."""
+        message = Message(description="Request status", fields=[], name="REQUEST_STATUS")
+        code = generate_struct_hpp(
+            message,
+            0x05,
+            type_registry,
+            Path("struct/RequestStatusMessage.hpp"),
+            16,
+            BinaryEncodingStrategy(),
+            include_message_name=True,
+        )
+
+        assert '#include "../MessageBase.hpp"' in code
+        assert (
+            "struct RequestStatusMessage : detail::NameOnlyMessage<RequestStatusMessage> {" in code
+        )
+        assert "static constexpr uint8_t MESSAGE_NAME_LEN = 13;" in code
+        assert "decode(const uint8_t" not in code
+        assert "encode(uint8_t" not in code
+        assert needs_message_base([message], include_message_name=True)
+        assert not needs_message_base([message], include_message_name=False)
+
+    def test_composite_emitted_once_in_shared_header(self, type_registry: TypeRegistry) -> None:
+        """Test that a composite used by two messages gets one header, included by both."""
+
+        def point_field() -> CompositeField:
+            return CompositeField(
+                name="point",
+                fields=[
+                    PrimitiveField("x", type_name=Type.INT16),
+                    PrimitiveField("y", type_name=Type.INT16),
+                ],
+            )
+
+        messages = [
+            Message(description="Move", fields=[point_field()], name="MOVE"),
+            Message(description="Click", fields=[point_field()], name="CLICK"),
+        ]
+        headers = generate_all_composite_hpp(messages, type_registry)
+
+        assert list(headers) == ["Point"]
+        assert "struct Point {\n    int16_t x;\n    int16_t y;\n};" in headers["Point"]
+        code = generate_struct_hpp(
+            messages[0],
+            0x06,
+            type_registry,
+            Path("struct/MoveMessage.hpp"),
+            16,
+            BinaryEncodingStrategy(),
+        )
+        assert '#include "composites/Point.hpp"' in code
+        assert "struct Point {" not in code
+
+    def test_composite_members_ordered_by_alignment(self, type_registry: TypeRegistry) -> None:
+        """Test that composite members are declared by descending alignment, wire order kept."""
+        mode = EnumDef(name="Mode", values={"OFF": 0, "ON": 1})
+        message = Message(
+            description="Sample",
+            fields=[
+                CompositeField(
+                    name="sample",
+                    fields=[
+                        PrimitiveField("active", type_name=Type.BOOL),
+                        PrimitiveField("gain", type_name=Type.FLOAT32),
+                        PrimitiveField("level", type_name=Type.UINT16),
+                        EnumField(name="mode", enum_def=mode),
+                    ],
+                )
+            ],
+            name="SAMPLE",
+        )
+
+        # Enums are uint8_t-sized: they sort with the bools
+        header = generate_all_composite_hpp([message], type_registry)["Sample"]
+        assert (
+            "    float gain;\n    uint16_t level;\n    bool active;\n    Mode mode;\n};" in header
+        )
+
+        code = generate_struct_hpp(
+            message,
+            0x05,
+            type_registry,
+            Path("struct/SampleMessage.hpp"),
+            16,
+            BinaryEncodingStrategy(),
+        )
+        encodes = [code.index(f"sample.{name}") for name in ("active", "gain", "level", "mode")]
+        assert encodes == sorted(encodes)
+
+    def test_composite_schema_order_kept_without_padding_gain(
+        self, type_registry: TypeRegistry
+    ) -> None:
+        """Test that members keep schema order (brace-init order) when sorting saves nothing."""
+        kind = EnumDef(name="SensorType", values={"TEMP": 0, "HUMIDITY": 1})
+        message = Message(
+            description="Sample",
+            fields=[
+                CompositeField(
+                    name="sample",
+                    fields=[
+                        PrimitiveField("flag", type_name=Type.BOOL),
+                        EnumField(name="kind", enum_def=kind),
+                        PrimitiveField("big", type_name=Type.UINT32),
+                        PrimitiveField("f", type_name=Type.FLOAT32),
+                        PrimitiveField("n8", type_name=Type.NORM8),
+                    ],
+                )
+            ],
+            name="SAMPLE",
+        )
+
+        header = generate_all_composite_hpp([message], type_registry)["Sample"]
+
+        assert (
+            "    bool flag;\n    SensorType kind;\n    uint32_t big;\n    float f;\n    float n8;\n};"
+            in header
+        )
+
+    def test_wire_layout_composite_decoded_by_memcpy(self, type_registry: TypeRegistry) -> None:
+        """Test that padding-free raw scalar composites are memcpy'd, in schema order."""
+        point = CompositeField(
+            name="point",
+            fields=[
+                PrimitiveField("x", type_name=Type.INT16),
+                PrimitiveField("y", type_name=Type.INT16),
+                PrimitiveField("z", type_name=Type.FLOAT32),
+            ],
+        )
+        message = Message(description="Move", fields=[point], name="MOVE")
+        strategy = BinaryEncodingStrategy()
+
+        header = generate_all_composite_hpp([message], type_registry, strategy)["Point"]
+        assert "    int16_t x;\n    int16_t y;\n    float z;\n" in header
+        assert 'static_assert(sizeof(Point) == 8, "Point must have no padding");' in header
+        assert 'static_assert(std::is_aggregate_v<Point>, "Point must be an aggregate");' in header
+        code = generate_struct_hpp(
+            message, 0x06, type_registry, Path("struct/MoveMessage.hpp"), 16, strategy
+        )
+        assert "std::memcpy(&point_data, ptr, sizeof(point_data));" in code
+        assert "Decoder::decodeInt16" not in code
+
+        header = generate_all_composite_hpp([message], type_registry, SysExEncodingStrategy())
+        assert "is_trivially_copyable" not in header["Point"]
+
+    def test_fixed_size_composite_declares_wire_size(self, type_registry: TypeRegistry) -> None:
+        """Test that WIRE_SIZE is the encoded size per strategy, only when fixed."""
+        point = CompositeField(
+            name="point",
+            fields=[
+                PrimitiveField("x", type_name=Type.UINT16),
+                PrimitiveField("on", type_name=Type.BOOL),
+            ],
+        )
+        label = CompositeField(
+            name="label",
+            fields=[
+                CompositeField(name="text", fields=[PrimitiveField("s", type_name=Type.STRING)])
+            ],
+        )
+        message = Message(description="Mark", fields=[point, label], name="MARK")
+
+        binary = generate_all_composite_hpp([message], type_registry, BinaryEncodingStrategy())
+        assert "static constexpr uint16_t WIRE_SIZE = 3;" in binary["Point"]
+        assert "WIRE_SIZE" not in binary["Label"]
+        sysex = generate_all_composite_hpp([message], type_registry, SysExEncodingStrategy())
+        assert "static constexpr uint16_t WIRE_SIZE = 4;" in sysex["Point"]
+        assert "WIRE_SIZE" not in generate_all_composite_hpp([message], type_registry)["Point"]
+
+    def test_fixed_size_composite_bounds_checked_once(self, type_registry: TypeRegistry) -> None:
+        """Test that fixed-size composites replace per-member checks with one WIRE_SIZE check."""
+        message = Message(
+            description="Mark",
+            fields=[
+                CompositeField(
+                    name="mark",
+                    fields=[
+                        PrimitiveField("id", type_name=Type.UINT8),
+                        PrimitiveField("x", type_name=Type.INT16),
+                    ],
+                    array=4,
+                )
+            ],
+            name="MARK",
+        )
+
+        code = generate_struct_hpp(
+            message,
+            0x07,
+            type_registry,
+            Path("struct/MarkMessage.hpp"),
+            16,
+            SysExEncodingStrategy(),
+        )
+
+        assert "if (remaining < Mark::WIRE_SIZE) return std::nullopt;" in code
+        assert "            Decoder::decodeInt16(ptr, remaining, mark_data[i].x);" in code
+        assert "if (!Decoder::decodeInt16" not in code
+
+    def test_padded_composite_decoded_by_member(self, type_registry: TypeRegistry) -> None:
+        """Test that a composite with padding in schema order keeps per-member decode."""
+        message = Message(
+            description="Move",
+            fields=[
+                CompositeField(
+                    name="point",
+                    fields=[
+                        PrimitiveField("id", type_name=Type.UINT8),
+                        PrimitiveField("x", type_name=Type.INT16),
+                    ],
+                )
+            ],
+            name="MOVE",
+        )
+        strategy = BinaryEncodingStrategy()
+
+        header = generate_all_composite_hpp([message], type_registry, strategy)["Point"]
+        assert "is_trivially_copyable" not in header
+        code = generate_struct_hpp(
+            message, 0x06, type_registry, Path("struct/MoveMessage.hpp"), 16, strategy
+        )
+        assert "Decoder::decodeInt16(ptr, remaining, point_data.x)" in code
+
+    def test_deeply_nested_composites_all_emitted(self, type_registry: TypeRegistry) -> None:
+        """Test that composite collection has no depth cutoff."""
+        field = CompositeField(name="level5", fields=[PrimitiveField("x", type_name=Type.UINT8)])
+        for level in range(4, 0, -1):
+            field = CompositeField(name=f"level{level}", fields=[field])
+        message = Message(description="Deep", fields=[field], name="DEEP")
+
+        headers = generate_all_composite_hpp([message], type_registry)
+
+        assert list(headers) == [f"Level{level}" for level in range(1, 6)]
+
+    def test_composite_batch_matches_sequential(self, type_registry: TypeRegistry) -> None:
+        """Test that composite headers rendered on a process pool match in-process ones."""
+        field = CompositeField(name="level3", fields=[PrimitiveField("x", type_name=Type.UINT8)])
+        for level in range(2, 0, -1):
+            field = CompositeField(name=f"level{level}", fields=[field])
+        messages = [Message(description="Deep", fields=[field], name="DEEP")]
+        strategy = BinaryEncodingStrategy()
+
+        sequential = generate_all_composite_hpp(messages, type_registry, strategy)
+        parallel = generate_all_composite_hpp(messages, type_registry, strategy, max_workers=2)
+
+        assert list(parallel) == ["Level1", "Level2", "Level3"]
+        assert parallel == sequential
+
+    def test_conflicting_composites_rejected(self, type_registry: TypeRegistry) -> None:
+        """Test that two different composites mapping to one struct name are an error."""
+        messages = [
+            Message(
+                description="Move",
+                fields=[
+                    CompositeField(name="point", fields=[PrimitiveField("x", type_name=Type.INT16)])
+                ],
+                name="MOVE",
+            ),
+            Message(
+                description="Click",
+                fields=[
+                    CompositeField(
+                        name="point", fields=[PrimitiveField("x", type_name=Type.FLOAT32)]
+                    )
+                ],
+                name="CLICK",
+            ),
+        ]
+
+        with pytest.raises(ValueError, match="Composite struct 'Point'"):
+            generate_all_composite_hpp(messages, type_registry)